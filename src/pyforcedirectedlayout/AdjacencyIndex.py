@@ -0,0 +1,182 @@
+
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import TYPE_CHECKING
+
+from numpy import argsort
+from numpy import empty
+from numpy import ndarray
+from numpy import unique
+
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NodesView
+
+if TYPE_CHECKING:
+    from pyforcedirectedlayout.Node import Node
+
+NO_NEIGHBORS: Nodes = Nodes([])
+"""
+Shared by every node without neighbors;  Never modify it
+"""
+
+
+class AdjacencyIndex:
+    """
+    A bidirectional index of the connections between the nodes of a layout.  For each node it
+    keeps the nodes it is connected to (its children) and the nodes connected to it (its parents),
+    so that neither direction requires scanning the whole diagram.
+
+    Nodes are indexed by themselves, so by `Node.nodeId`.  The index is kept up to date incrementally by the layout engine
+    as nodes are added and removed and as connections are made and broken.
+    """
+    def __init__(self):
+
+        self._children: Dict['Node', Nodes] = {}
+        self._parents:  Dict['Node', Nodes] = {}
+
+    def children(self, node: 'Node') -> Nodes:
+        """
+        Args:
+            node:   The node to look up
+
+        Returns:  The nodes that `node` is connected to;  This is the index's own list, do not modify it
+        """
+        return self._children.get(node, NO_NEIGHBORS)
+
+    def parents(self, node: 'Node') -> Nodes:
+        """
+        Args:
+            node:   The node to look up
+
+        Returns:  The nodes that are connected to `node`;  This is the index's own list, do not modify it
+        """
+        return self._parents.get(node, NO_NEIGHBORS)
+
+    def addNode(self, node: 'Node'):
+        """
+        Index the connections the node already has
+
+        Args:
+            node:  A node that was just added to the layout
+        """
+        for child in node.connections:
+            self.addConnection(parent=node, child=child)
+
+    def removeNode(self, node: 'Node'):
+        """
+        Forget every connection to or from the node
+
+        Args:
+            node:  A node that was just removed from the layout
+        """
+        for child in self._children.pop(node, NO_NEIGHBORS):
+            self._removeFrom(self._parents, key=child, node=node)
+        for parent in self._parents.pop(node, NO_NEIGHBORS):
+            self._removeFrom(self._children, key=parent, node=node)
+
+    def addConnection(self, parent: 'Node', child: 'Node'):
+        """
+        Args:
+            parent: The node that the connection is from
+            child:  The node that the connection is to
+        """
+        self._children.setdefault(parent, Nodes([])).append(child)
+        self._parents.setdefault(child, Nodes([])).append(parent)
+
+    def addConnections(self, nodes: Nodes, sources: ndarray, targets: ndarray):
+        """
+        Index many connections at once.  The connections are grouped by node so that each
+        neighbor list is extended once;  The grouping is stable, the lists end up in the same
+        order as when the connections are added one by one
+
+        Args:
+            nodes:      The nodes the indices refer to
+            sources:    The index of the node each connection is from
+            targets:    The index of the node each connection is to
+        """
+        nodeArray: ndarray = empty(len(nodes), dtype=object)
+        nodeArray[:] = nodes
+
+        self._extendNeighbors(self._children, nodeArray=nodeArray, keys=sources, values=targets)
+        self._extendNeighbors(self._parents,  nodeArray=nodeArray, keys=targets, values=sources)
+
+    def removeConnection(self, parent: 'Node', child: 'Node'):
+        """
+        Args:
+            parent: The node that the connection is from
+            child:  The node that the connection is to
+        """
+        self._removeFrom(self._children, key=parent, node=child)
+        self._removeFrom(self._parents,  key=child,  node=parent)
+
+    def connectedComponents(self, nodes: Nodes | NodesView) -> List[Nodes]:
+        """
+        Group the nodes into connected components, following connections in both directions
+
+        Args:
+            nodes:  Every node in the layout
+
+        Returns:  The components, each in the order its nodes appear in `nodes`
+        """
+        order:      Dict['Node', int] = {node: index for index, node in enumerate(nodes)}
+        visited:    Set['Node']       = set()
+        components: List[Nodes]       = []
+
+        for node in nodes:
+            if node in visited:
+                continue
+            visited.add(node)
+            component: Nodes = Nodes([])
+            pending:   Nodes = Nodes([node])
+            while pending:
+                current: 'Node' = pending.pop()
+                component.append(current)
+                for neighbor in self.children(current) + self.parents(current):
+                    if neighbor not in visited and neighbor in order:
+                        visited.add(neighbor)
+                        pending.append(neighbor)
+            component.sort(key=lambda n: order[n])
+            components.append(component)
+
+        return components
+
+    def clear(self):
+        self._children.clear()
+        self._parents.clear()
+
+    def _extendNeighbors(self, neighbors: Dict['Node', Nodes], nodeArray: ndarray, keys: ndarray, values: ndarray):
+        """
+        Args:
+            neighbors:  Either the children or parents dictionary
+            nodeArray:  The nodes the indices refer to
+            keys:       The index of the node whose neighbors are extended, per connection
+            values:     The index of the neighbor, per connection
+        """
+        if keys.size == 0:
+            return
+
+        order: ndarray = argsort(keys, kind='stable')
+        groupKeys, starts = unique(keys[order], return_index=True)
+
+        groupedNodes: List['Node'] = nodeArray[values[order]].tolist()
+        ends:         List[int]    = starts[1:].tolist() + [len(groupedNodes)]
+        for key, start, end in zip(groupKeys.tolist(), starts.tolist(), ends):
+            neighbors.setdefault(nodeArray[key], Nodes([])).extend(groupedNodes[start:end])
+
+    def _removeFrom(self, neighbors: Dict['Node', Nodes], key: 'Node', node: 'Node'):
+        """
+        Remove `node` from the neighbors of `key`
+
+        Args:
+            neighbors:  Either the children or parents dictionary
+            key:        The node whose neighbors are updated
+            node:       The neighbor to remove
+        """
+        nodes: Nodes = neighbors.get(key, NO_NEIGHBORS)
+        for index, neighbor in enumerate(nodes):
+            if neighbor == node:
+                del nodes[index]
+                break
+        if len(nodes) == 0:
+            neighbors.pop(key, None)
@@ -0,0 +1,320 @@
+
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from numpy import array
+from numpy import asarray
+from numpy import float64
+from numpy import hypot
+from numpy import int64
+from numpy import ndarray
+from numpy import zeros_like
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ConvergenceMonitor import ConvergenceMonitor
+from pyforcedirectedlayout.ForceKernels import attractionForEdges
+from pyforcedirectedlayout.ForceKernels import REPULSION_WEIGHT
+from pyforcedirectedlayout.ForceKernels import repulsionForRows
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import LayoutStatusCallback
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NodesView
+from pyforcedirectedlayout.LayoutTypes import StopReason
+from pyforcedirectedlayout.Node import Node
+from pyforcedirectedlayout.ParallelRepulsion import ParallelRepulsion
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.StatusReporter import StatusReporter
+from pyforcedirectedlayout.StepController import StepController
+from pyforcedirectedlayout.StopSignal import StopSignal
+from pyforcedirectedlayout.StopSignal import UNLIMITED
+
+MINIMUM_NODES_PER_WORKER: int = 256
+"""
+Below this many nodes per worker process the cost of synchronizing the workers outweighs running on one core
+"""
+
+NO_PARALLEL_REPULSION: ParallelRepulsion = cast(ParallelRepulsion, None)
+NO_VELOCITIES:         ndarray           = cast(ndarray, None)
+
+
+class ArraySimulation:
+    """
+    Runs the force-directed simulation with positions, velocities and the edge list held in
+    contiguous float arrays.  Each iteration computes every repulsion and attraction force with
+    batched array operations instead of node-by-node `Vector` arithmetic.
+
+    The node locations are read once at construction and written back when the simulation
+    reports status and when it finishes.  Every iteration updates the `positions` and `velocities`
+    arrays in place, so a simulation over shared buffers, for example memory mapped files, writes
+    straight through to them.
+    """
+    def __init__(self, nodes: Nodes | NodesView, velocities: ndarray = NO_VELOCITIES, workerCount: int = 0):
+        """
+
+        Args:
+            nodes:          The nodes to simulate;  Their current locations are the starting positions
+            velocities:     The (n, 2) starting velocities;  The nodes start at rest when omitted
+            workerCount:    The number of processes to spread the repulsion across;  0 uses `Configuration.workerCount`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._configuration: Configuration     = Configuration()
+        self._nodes:         Nodes | NodesView = nodes
+        self._workerCount:   int               = workerCount
+
+        self._positions:  ndarray = array([(node.x, node.y) for node in nodes], dtype=float64).reshape(-1, 2)
+        self._velocities: ndarray = zeros_like(self._positions) if velocities is NO_VELOCITIES else array(velocities, dtype=float64).reshape(-1, 2)
+
+        self._sources, self._targets = self._buildEdgeList()
+
+        self._parallelRepulsion: ParallelRepulsion = NO_PARALLEL_REPULSION
+
+    @classmethod
+    def fromArrays(cls, positions: ndarray, sources: ndarray, targets: ndarray, velocities: ndarray = NO_VELOCITIES,
+                   shareBuffers: bool = False, workerCount: int = 0) -> 'ArraySimulation':
+        """
+        Simulate a graph that has no `Node` objects, for example a coarsened level of a diagram.
+        Nothing is written back, read the result from `positions`
+
+        Args:
+            positions:      The (n, 2) starting positions
+            sources:        The index of the node each edge is from
+            targets:        The index of the node each edge is to
+            velocities:     The (n, 2) starting velocities;  The nodes start at rest when omitted
+            shareBuffers:   Simulate in the given arrays instead of in copies of them.  The positions and
+                            velocities must then be writable (n, 2) float64 arrays
+            workerCount:    The number of processes to spread the repulsion across;  0 uses `Configuration.workerCount`
+
+        Returns:  A simulation of the graph
+        """
+        arraySimulation: ArraySimulation = cls(nodes=Nodes([]), workerCount=workerCount)
+
+        if shareBuffers is True:
+            assert positions.dtype == float64 and positions.ndim == 2 and positions.flags.writeable, 'Need writable (n, 2) float64 positions'
+            assert velocities is not NO_VELOCITIES and velocities.shape == positions.shape and velocities.dtype == float64, 'Need velocities like the positions'
+
+            arraySimulation._positions  = positions
+            arraySimulation._velocities = velocities
+            arraySimulation._sources    = asarray(sources, dtype=int64)
+            arraySimulation._targets    = asarray(targets, dtype=int64)
+        else:
+            arraySimulation._positions  = array(positions, dtype=float64).reshape(-1, 2)
+            arraySimulation._velocities = zeros_like(arraySimulation._positions) if velocities is NO_VELOCITIES else array(velocities, dtype=float64).reshape(-1, 2)
+            arraySimulation._sources    = array(sources, dtype=int64)
+            arraySimulation._targets    = array(targets, dtype=int64)
+
+        return arraySimulation
+
+    @property
+    def positions(self) -> ndarray:
+        """
+        Returns:  The (n, 2) array of current node positions
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: ndarray):
+        self._positions = array(positions, dtype=float64).reshape(-1, 2)
+
+    @property
+    def sources(self) -> ndarray:
+        """
+        Returns:  The index of the node each edge is from
+        """
+        return self._sources
+
+    @property
+    def targets(self) -> ndarray:
+        """
+        Returns:  The index of the node each edge is to
+        """
+        return self._targets
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        Returns:  The (n, 2) array of current node velocities
+        """
+        return self._velocities
+
+    def run(self, statusCallback: LayoutStatusCallback = NO_STATUS_CALLBACK, maxIterations: int = 0, stopSignal: StopSignal = UNLIMITED) -> LayoutStatus:
+        """
+        Iterate until the layout settles or the maximum number of iterations is reached.  Uses
+        the same early exit rules as the reference engine
+
+        Args:
+            statusCallback:  Called after the iterations `StatusReporter` lets through
+            maxIterations:   Stop after this many iterations;  0 uses `Configuration.maxIterations`
+            stopSignal:      Stops the simulation when cancelled or out of time
+
+        Returns:  The status at the end of the simulation
+        """
+        statusReporter: StatusReporter = StatusReporter(statusCallback=statusCallback)
+
+        layoutStatus: LayoutStatus = LayoutStatus()
+        for layoutStatus in self.steps(maxIterations=maxIterations, stopSignal=stopSignal):
+            if layoutStatus.stopReason == StopReason.RUNNING and statusReporter.isDue(iterations=layoutStatus.iterations) is True:
+                self.updateNodeLocations()
+                statusReporter.report(layoutStatus)
+
+        self.updateNodeLocations()
+
+        return layoutStatus
+
+    def steps(self, maxIterations: int = 0, stopSignal: StopSignal = UNLIMITED) -> Generator[LayoutStatus, None, None]:
+        """
+        Iterate one step at a time.  After each iteration `positions` holds the new positions;
+        The nodes are not updated, call `updateNodeLocations` for that.  The last status yielded
+        has its `stopReason` set.  Closing the generator stops the simulation
+
+        Args:
+            maxIterations:   Stop after this many iterations;  0 uses `Configuration.maxIterations`
+            stopSignal:      Stops the simulation when cancelled or out of time
+
+        Returns:  The same status, updated in place, after every iteration
+        """
+        damping:     float = self._configuration.damping
+        workerCount: int   = self._workerCount if self._workerCount > 0 else self._configuration.workerCount
+        if maxIterations <= 0:
+            maxIterations = self._configuration.maxIterations
+
+        if workerCount > 1 and self._positions.shape[0] >= workerCount * MINIMUM_NODES_PER_WORKER:
+            with ParallelRepulsion(nodeCount=self._positions.shape[0], workerCount=workerCount,
+                                   coulombLawConstant=self._configuration.repulsionForce) as parallelRepulsion:
+                self._parallelRepulsion = parallelRepulsion
+                try:
+                    yield from self._iterate(damping=damping, maxIterations=maxIterations, stopSignal=stopSignal)
+                finally:
+                    self._parallelRepulsion = NO_PARALLEL_REPULSION
+        else:
+            yield from self._iterate(damping=damping, maxIterations=maxIterations, stopSignal=stopSignal)
+
+    def _iterate(self, damping: float, maxIterations: int, stopSignal: StopSignal) -> Generator[LayoutStatus, None, None]:
+        """
+        The simulation loop
+        """
+
+        stopCount:  int = 0
+        iterations: int = 0
+
+        stepController:     StepController     = StepController()
+        convergenceMonitor: ConvergenceMonitor = ConvergenceMonitor()
+
+        layoutStatus: LayoutStatus = LayoutStatus()
+        while layoutStatus.stopReason == StopReason.RUNNING:
+            netForces: ndarray = self.computeNetForces(self._positions)
+
+            self._velocities[:] = stepController.limitArray((self._velocities + netForces) * damping)
+            nextPositions: ndarray = self._positions + self._velocities
+
+            displacements:     ndarray = nextPositions - self._positions
+            distances:         ndarray = hypot(displacements[:, 0], displacements[:, 1])
+            totalDisplacement: float   = float(distances.sum())
+            maxDisplacement:   float   = float(distances.max(initial=0.0))
+            self._positions[:] = nextPositions
+
+            energy: float = convergenceMonitor.energy(positions=self._positions, sources=self._sources, targets=self._targets)
+
+            iterations += 1
+            if convergenceMonitor.isSettled(totalDisplacement=totalDisplacement, maxDisplacement=maxDisplacement, energy=energy) is True:
+                stopCount += 1
+
+            layoutStatus.totalDisplacement = totalDisplacement
+            layoutStatus.stopCount         = stopCount
+            layoutStatus.iterations        = iterations
+            layoutStatus.maxIterations     = maxIterations
+            layoutStatus.stepSize          = stepController.stepSize
+            layoutStatus.maxDisplacement   = maxDisplacement
+            layoutStatus.energy            = energy
+
+            stepController.update(energy=float((netForces * netForces).sum()))
+
+            if stopCount > self._configuration.stopCount:
+                self.logger.info(f'Exiting early: {totalDisplacement=} {stopCount=}')
+                layoutStatus.stopReason = StopReason.CONVERGED
+            elif iterations >= maxIterations:
+                self.logger.info(f'Exiting exceeded maxIterations: {iterations=}')
+                layoutStatus.stopReason = StopReason.MAX_ITERATIONS
+            else:
+                layoutStatus.stopReason = stopSignal.stopReason()
+                if layoutStatus.stopReason != StopReason.RUNNING:
+                    self.logger.info(f'Exiting {layoutStatus.stopReason.value}: {iterations=}')
+
+            yield layoutStatus
+
+    def computeNetForces(self, positions: ndarray) -> ndarray:
+        """
+        Args:
+            positions:  (n, 2) node positions
+
+        Returns:  (n, 2) net force acting on each node
+        """
+        return REPULSION_WEIGHT * self._repulsionForces(positions) + self._attractionForces(positions)
+
+    def updateNodeLocations(self):
+        """
+        Copy the simulated positions back into each `Node.location`
+        """
+        if self._configuration.floatPrecision is True:
+            for node, (x, y) in zip(self._nodes, self._positions.tolist()):
+                node.location = Point(x=x, y=y)
+        else:
+            for node, (x, y) in zip(self._nodes, self._positions.tolist()):
+                node.location = Point(x=int(x), y=int(y))
+
+    def _repulsionForces(self, positions: ndarray) -> ndarray:
+        """
+        Coulomb's Law: F = k(Qq/r^2), evaluated for every pair of nodes.  Spread across
+        the worker processes when the simulation has them
+
+        Args:
+            positions:  (n, 2) node positions
+
+        Returns:  (n, 2) repulsion force on each node
+        """
+        if self._parallelRepulsion is not NO_PARALLEL_REPULSION:
+            return self._parallelRepulsion.computeForces(positions)
+
+        return repulsionForRows(positions=positions, start=0, end=positions.shape[0], coulombLawConstant=self._configuration.repulsionForce)
+
+    def _attractionForces(self, positions: ndarray) -> ndarray:
+        """
+        Hooke's Law: F = -kx, evaluated for every edge and applied to both of its nodes
+
+        Args:
+            positions:  (n, 2) node positions
+
+        Returns:  (n, 2) attraction force on each node
+        """
+        return attractionForEdges(positions=positions, sources=self._sources, targets=self._targets,
+                                  attractionForce=self._configuration.attractionForce,
+                                  springLength=self._configuration.springLength)
+
+    def _buildEdgeList(self) -> Tuple[ndarray, ndarray]:
+        """
+        Flatten the node connections into parallel source/target index arrays.  Connections to
+        nodes that are not part of the simulation are ignored
+
+        Returns:  The source and target node indices
+        """
+        indices: Dict[Node, int] = {node: index for index, node in enumerate(self._nodes)}
+
+        sources: List[int] = []
+        targets: List[int] = []
+        for index, node in enumerate(self._nodes):
+            for child in node.connections:
+                childIndex: int | None = indices.get(child)
+                if childIndex is None:
+                    self.logger.debug(f'Ignoring connection to a node outside the simulation: {child=}')
+                else:
+                    sources.append(index)
+                    targets.append(childIndex)
+
+        return array(sources, dtype=int64), array(targets, dtype=int64)
@@ -0,0 +1,126 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import cpu_count
+
+from math import inf
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from concurrent.futures import ProcessPoolExecutor
+
+from functools import partial
+
+from pyforcedirectedlayout.CancellationToken import CancellationToken
+from pyforcedirectedlayout.CancellationToken import NO_CANCELLATION_TOKEN
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.Size import Size
+
+Edge  = NewType('Edge', Tuple[int, int])
+"""
+A connection from the node at the first index to the node at the second index
+"""
+Edges = NewType('Edges', List[Edge])
+
+Positions = NewType('Positions', List[Point])
+
+
+@dataclass
+class DiagramSpecification:
+    """
+    A diagram to lay out;  Nodes are identified by their index
+    """
+    nodeCount:     int        = 0
+    edges:         Edges      = field(default_factory=lambda: Edges([]))
+    sizes:         List[Size] = field(default_factory=list)
+    """
+    Optional size of each node;  Nodes without one have no size
+    """
+    deterministic: bool       = False
+    timeBudget:    float      = inf
+    """
+    Seconds the layout may run for
+    """
+
+
+@dataclass
+class DiagramLayout:
+    """
+    The arranged diagram;  positions are in the same order as the specification's nodes
+    """
+    positions:    Positions    = field(default_factory=lambda: Positions([]))
+    layoutStatus: LayoutStatus = field(default_factory=LayoutStatus)
+
+
+def layoutDiagram(diagramSpecification: DiagramSpecification, cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN,
+                  workerCount: int = 0) -> DiagramLayout:
+    """
+    Arrange a single diagram.  This is what each worker runs
+
+    Args:
+        diagramSpecification:  The diagram to lay out
+        cancellationToken:     Stops the layout once cancelled;  Only usable in the calling process
+        workerCount:           The number of processes to spread the repulsion across;  0 uses `Configuration.workerCount`
+
+    Returns:  The node positions and the final layout status
+    """
+    sizes: List[Size] = diagramSpecification.sizes
+    nodes: Nodes      = Nodes([LayoutNode(size=sizes[i] if i < len(sizes) else Size()) for i in range(diagramSpecification.nodeCount)])
+
+    layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+    layoutEngine.workerCount = workerCount
+    layoutEngine.addGraph(nodes=nodes,
+                          sources=[source for source, _ in diagramSpecification.edges],
+                          targets=[target for _, target in diagramSpecification.edges])
+
+    layoutStatus: LayoutStatus = layoutEngine.arrange(deterministic=diagramSpecification.deterministic, timeBudget=diagramSpecification.timeBudget,
+                                                       cancellationToken=cancellationToken)
+
+    return DiagramLayout(positions=Positions([node.location for node in nodes]), layoutStatus=layoutStatus)
+
+
+class BatchLayout:
+    """
+    Lays out many independent diagrams concurrently on a pool of worker processes.  Each
+    diagram is arranged with its own `ForceDirectedLayout` using the current `Configuration`,
+    except that the workers already use the processors and so compute the repulsion serially.
+    """
+    def __init__(self, workerCount: int = 0):
+        """
+
+        Args:
+            workerCount:  The number of worker processes;  0 uses one per CPU
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._workerCount: int = workerCount if workerCount > 0 else (cpu_count() or 1)
+
+    def arrange(self, diagramSpecifications: List[DiagramSpecification]) -> List[DiagramLayout]:
+        """
+        Args:
+            diagramSpecifications:  The diagrams to lay out
+
+        Returns:  The layout of each diagram, in the same order as the specifications
+        """
+        if len(diagramSpecifications) == 0:
+            return []
+
+        # hand each worker several small diagrams at a time to amortize the inter-process traffic
+        chunkSize: int = max(1, len(diagramSpecifications) // (self._workerCount * 4))
+
+        with ProcessPoolExecutor(max_workers=self._workerCount) as executor:
+            diagramLayouts: List[DiagramLayout] = list(executor.map(partial(layoutDiagram, workerCount=1), diagramSpecifications, chunksize=chunkSize))
+
+        self.logger.debug(f'Arranged {len(diagramLayouts)} diagrams on {self._workerCount} workers')
+
+        return diagramLayouts
@@ -0,0 +1,29 @@
+
+from typing import cast
+
+from threading import Event
+
+
+class CancellationToken:
+    """
+    Lets another thread stop a running layout.  The simulation checks the token once per
+    iteration, stops after the iteration in progress and still centers the nodes
+    """
+    def __init__(self):
+        self._cancelled: Event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Returns:  True once `cancel` was called
+        """
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Ask the layout to stop;  Safe to call from any thread
+        """
+        self._cancelled.set()
+
+
+NO_CANCELLATION_TOKEN: CancellationToken = cast(CancellationToken, None)
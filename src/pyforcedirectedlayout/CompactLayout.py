@@ -0,0 +1,263 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from math import inf
+
+from random import seed as randomSeed
+from random import randint
+
+from numpy import abs as arrayAbs
+from numpy import arange
+from numpy import array
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+from numpy import negative
+from numpy import trunc
+from numpy import zeros
+
+from pyforcedirectedlayout.ArraySimulation import ArraySimulation
+from pyforcedirectedlayout.CancellationToken import CancellationToken
+from pyforcedirectedlayout.CancellationToken import NO_CANCELLATION_TOKEN
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutSnapshot import LayoutSnapshot
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import LayoutStatusCallback
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.Size import Size
+from pyforcedirectedlayout.StopSignal import StopSignal
+
+NO_SIZES: ndarray = cast(ndarray, None)
+NO_EDGES: ndarray = zeros(0, dtype=int64)
+
+
+class NodeView:
+    """
+    A lightweight, index based view of one node of a `CompactLayout`.  It holds no state of
+    its own;  Reading or setting its location goes straight to the layout's position buffer
+    """
+    __slots__ = ('_compactLayout', '_index')
+
+    def __init__(self, compactLayout: 'CompactLayout', index: int):
+
+        self._compactLayout: CompactLayout = compactLayout
+        self._index:         int           = index
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def location(self) -> Point:
+        x, y = self._compactLayout.positions[self._index].tolist()
+        return Point(x=x, y=y)
+
+    @location.setter
+    def location(self, point: Point):
+        self._compactLayout.positions[self._index] = (point.x, point.y)
+
+    @property
+    def x(self) -> float:
+        return float(self._compactLayout.positions[self._index, 0])
+
+    @x.setter
+    def x(self, x: float):
+        self._compactLayout.positions[self._index, 0] = x
+
+    @property
+    def y(self) -> float:
+        return float(self._compactLayout.positions[self._index, 1])
+
+    @y.setter
+    def y(self, y: float):
+        self._compactLayout.positions[self._index, 1] = y
+
+    @property
+    def size(self) -> Size:
+        width, height = self._compactLayout.sizes[self._index].tolist()
+        return Size(width=width, height=height)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, NodeView) and self._compactLayout is other._compactLayout and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._compactLayout), self._index))
+
+    def __str__(self) -> str:
+        return f'NodeView: {self._index} {self.location}'
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class CompactLayout:
+    """
+    Lays out diagrams that are too large for a `Node` object per node.  The positions, velocities
+    and sizes live in (n, 2) struct-of-arrays buffers and the connections in source and target index
+    arrays;  Nodes are identified by their index and `node` hands out `NodeView`s on demand.
+
+    `arrange` runs the array simulation straight on the buffers and places the nodes exactly like
+    `ForceDirectedLayout.arrange` does with the NumPy engine
+    """
+    def __init__(self, nodeCount: int, sources: ndarray, targets: ndarray, sizes: ndarray = NO_SIZES):
+        """
+
+        Args:
+            nodeCount:  The number of nodes
+            sources:    The index of the node each connection is from
+            targets:    The index of the node each connection is to
+            sizes:      The (n, 2) width and height of each node;  The nodes have no size when omitted
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._configuration: Configuration = Configuration()
+
+        self._positions:  ndarray = zeros((nodeCount, 2), dtype=float64)
+        self._velocities: ndarray = zeros((nodeCount, 2), dtype=float64)
+        self._sizes:      ndarray = zeros((nodeCount, 2), dtype=int64) if sizes is NO_SIZES else array(sizes, dtype=int64).reshape(-1, 2)
+        self._sources:    ndarray = array(sources, dtype=int64)
+        self._targets:    ndarray = array(targets, dtype=int64)
+
+        assert self._sizes.shape[0] == nodeCount, 'Need one size per node'
+
+    @property
+    def nodeCount(self) -> int:
+        return self._positions.shape[0]
+
+    @property
+    def positions(self) -> ndarray:
+        """
+        Returns:  The (n, 2) node positions
+        """
+        return self._positions
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        Returns:  The (n, 2) node velocities as of the last layout
+        """
+        return self._velocities
+
+    @property
+    def sizes(self) -> ndarray:
+        """
+        Returns:  The (n, 2) node widths and heights
+        """
+        return self._sizes
+
+    @property
+    def sources(self) -> ndarray:
+        return self._sources
+
+    @property
+    def targets(self) -> ndarray:
+        return self._targets
+
+    @classmethod
+    def fromSnapshot(cls, layoutSnapshot: LayoutSnapshot, sizes: ndarray = NO_SIZES, shareBuffers: bool = False) -> 'CompactLayout':
+        """
+        Args:
+            layoutSnapshot:  A saved layout;  `arrange(warmStart=True)` continues it
+            sizes:           The (n, 2) width and height of each node;  The nodes have no size when omitted
+            shareBuffers:    Lay out in the snapshot's own arrays instead of in a copy of them.  With a
+                             snapshot loaded writable, or made by `LayoutSnapshot.create`, the positions,
+                             velocities and connections then stay in the memory mapped file and other
+                             processes that map it see the positions move while the layout runs
+
+        Returns:  The layout
+        """
+        if shareBuffers is False:
+            compactLayout: CompactLayout = cls(nodeCount=layoutSnapshot.nodeCount, sources=layoutSnapshot.sources, targets=layoutSnapshot.targets, sizes=sizes)
+
+            compactLayout._positions[:]  = layoutSnapshot.positions
+            compactLayout._velocities[:] = layoutSnapshot.velocities
+        else:
+            assert layoutSnapshot.positions.flags.writeable and layoutSnapshot.velocities.flags.writeable, 'Load the snapshot writable to share its buffers'
+
+            compactLayout = cls(nodeCount=0, sources=NO_EDGES, targets=NO_EDGES)
+
+            compactLayout._positions  = layoutSnapshot.positions
+            compactLayout._velocities = layoutSnapshot.velocities
+            compactLayout._sources    = layoutSnapshot.sources
+            compactLayout._targets    = layoutSnapshot.targets
+            compactLayout._sizes      = zeros((layoutSnapshot.nodeCount, 2), dtype=int64) if sizes is NO_SIZES else array(sizes, dtype=int64).reshape(-1, 2)
+
+        return compactLayout
+
+    def snapshot(self) -> LayoutSnapshot:
+        """
+        Returns:  A copy of the positions, velocities and connections;  The node ids are the node indices
+        """
+        return LayoutSnapshot(nodeIds=arange(self.nodeCount, dtype=int64), positions=self._positions.copy(), velocities=self._velocities.copy(),
+                              sources=self._sources.copy(), targets=self._targets.copy())
+
+    def node(self, index: int) -> NodeView:
+        """
+        Args:
+            index:  The index of the node
+
+        Returns:  A view of the node
+        """
+        assert 0 <= index < self.nodeCount, 'No such node'
+
+        return NodeView(compactLayout=self, index=index)
+
+    def arrange(self, statusCallback: LayoutStatusCallback = NO_STATUS_CALLBACK, deterministic: bool = False, warmStart: bool = False,
+                timeBudget: float = inf, cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN) -> LayoutStatus:
+        """
+        Runs the array simulation over the buffers
+
+        Args:
+            statusCallback:     Reports progress, throttled like `ForceDirectedLayout.arrange`
+            deterministic:      Whether to use a random or deterministic layout.
+            warmStart:          Start from the current positions and velocities instead of random positions at rest
+            timeBudget:         Stop after the iteration that runs out of this many seconds of wall clock time
+            cancellationToken:  Stop after the iteration in progress once it is cancelled
+
+        Returns:  The status as of the last iteration
+        """
+        if deterministic is True:
+            randomSeed(1)
+        else:
+            randomSeed()
+
+        if warmStart is False:
+            self._positions[:]  = array([(randint(-50, 50), randint(-50, 50)) for _ in range(self.nodeCount)], dtype=float64).reshape(-1, 2)
+            self._velocities[:] = 0.0
+
+        previousCorner: ndarray = self._positions.min(axis=0) if self.nodeCount > 0 else zeros(2)
+
+        stopSignal:      StopSignal      = StopSignal(cancellationToken=cancellationToken, timeBudget=timeBudget)
+        arraySimulation: ArraySimulation = ArraySimulation.fromArrays(positions=self._positions, sources=self._sources, targets=self._targets,
+                                                                      velocities=self._velocities, shareBuffers=True)
+
+        layoutStatus: LayoutStatus = arraySimulation.run(statusCallback=statusCallback, stopSignal=stopSignal)
+
+        if self._configuration.floatPrecision is False:
+            trunc(self._positions, out=self._positions)
+
+        if warmStart is True:
+            if self.nodeCount > 0:
+                self._positions += previousCorner - self._positions.min(axis=0)
+        else:
+            self._adjustPositions()
+
+        return layoutStatus
+
+    def _adjustPositions(self):
+        """
+        The same placement as `ForceDirectedLayout._adjustNodes`;  It mirrors the positions, so the
+        velocities are mirrored as well
+        """
+        if self.nodeCount == 0:
+            return
+
+        maxX: int = int(max(float(self._positions[:, 0].max()), 0.0))
+        maxY: int = int(max(float(self._positions[:, 1].max()), 0.0))
+
+        self._positions[:] = arrayAbs(self._positions - (maxX, maxY)) + self._sizes
+        negative(self._velocities, out=self._velocities)
@@ -15,6 +15,11 @@ from codeallybasic.SecureConversions import SecureConversions
 
 from codeallybasic.SingletonV3 import SingletonV3
 
+from pyforcedirectedlayout.LayoutTypes import RepulsionMode
+from pyforcedirectedlayout.LayoutTypes import SimulationEngine
+from pyforcedirectedlayout.LayoutTypes import StepControl
+from pyforcedirectedlayout.LayoutTypes import StopCriterion
+
 X_RANGE_MIN: int = -1024
 X_RANGE_MAX: int = 1024
 Y_RANGE_MIN: int = -1024
@@ -46,19 +51,99 @@ randomizeProperties: ValueDescriptions = ValueDescriptions(
 )
 """
 Stop execution after this many number of iterations
-where the totalDisplacement is less that minimumTotalDisplacement
+where the totalDisplacement is less that minimumTotalDisplacement.
+
+stopCriterion selects the normalized criteria instead;  tolerance is a fraction of the
+spring length for Max Displacement and of the energy for Energy
 """
 earlyExitProperties: ValueDescriptions = ValueDescriptions(
     {
         KeyName('minimumTotalDisplacement'): ValueDescription(defaultValue='10', deserializer=SecureConversions.secureInteger),
         KeyName('stopCount'):                ValueDescription(defaultValue='15', deserializer=SecureConversions.secureInteger),
+        KeyName('stopCriterion'):            ValueDescription(defaultValue=StopCriterion.TOTAL_DISPLACEMENT.value, deserializer=StopCriterion, enumUseValue=True),
+        KeyName('tolerance'):                ValueDescription(defaultValue='0.001', deserializer=SecureConversions.secureFloat),
+        KeyName('reportEnergy'):             ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+    }
+)
+engineProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('simulationEngine'): ValueDescription(defaultValue=SimulationEngine.PYTHON.value, deserializer=SimulationEngine, enumUseValue=True),
+        KeyName('floatPrecision'):   ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('workerCount'):      ValueDescription(defaultValue='1',     deserializer=SecureConversions.secureInteger),
+    }
+)
+"""
+theta is the Barnes-Hut opening angle.  Smaller values are more accurate, 0 is the same as comparing all pairs.
+cutoffRadius is the distance, in pixels, beyond which nodes do not repel each other in the Cutoff Grid mode
+"""
+repulsionProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('repulsionMode'): ValueDescription(defaultValue=RepulsionMode.ALL_PAIRS.value, deserializer=RepulsionMode, enumUseValue=True),
+        KeyName('theta'):         ValueDescription(defaultValue='0.8', deserializer=SecureConversions.secureFloat),
+        KeyName('cutoffRadius'):  ValueDescription(defaultValue='500', deserializer=SecureConversions.secureInteger),
+    }
+)
+"""
+Lay out each connected component on its own and pack the results, componentGap pixels apart
+"""
+componentProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('layoutComponents'): ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('componentGap'):     ValueDescription(defaultValue='50',    deserializer=SecureConversions.secureInteger),
+    }
+)
+"""
+The most iterations that ForceDirectedLayout.arrangeIncremental relaxes the changed nodes for
+"""
+incrementalProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('relaxationIterations'): ValueDescription(defaultValue='50', deserializer=SecureConversions.secureInteger),
+    }
+)
+"""
+The Multilevel engine coarsens the diagram until it has at most coarsestSize nodes, and refines each
+finer level for refinementIterations iterations
+"""
+multilevelProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('coarsestSize'):         ValueDescription(defaultValue='100', deserializer=SecureConversions.secureInteger),
+        KeyName('refinementIterations'): ValueDescription(defaultValue='100', deserializer=SecureConversions.secureInteger),
+    }
+)
+"""
+How far a node may move in one iteration;  The step sizes are in pixels and coolingRate
+only applies to the Cooling step control
+"""
+stepControlProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('stepControl'):     ValueDescription(defaultValue=StepControl.FIXED.value, deserializer=StepControl, enumUseValue=True),
+        KeyName('initialStepSize'): ValueDescription(defaultValue='100',  deserializer=SecureConversions.secureFloat),
+        KeyName('minimumStepSize'): ValueDescription(defaultValue='0.0',  deserializer=SecureConversions.secureFloat),
+        KeyName('coolingRate'):     ValueDescription(defaultValue='0.95', deserializer=SecureConversions.secureFloat),
+    }
+)
+"""
+Throttles the status callback;  It is called every statusInterval iterations, but no more often
+than every statusPeriod milliseconds
+"""
+statusProperties: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('statusInterval'): ValueDescription(defaultValue='1', deserializer=SecureConversions.secureInteger),
+        KeyName('statusPeriod'):   ValueDescription(defaultValue='0', deserializer=SecureConversions.secureInteger),
     }
 )
 PYFDL_SECTIONS: Sections = Sections(
     {
-        SectionName('Arrange'):   arrangeProperties,
-        SectionName('Randomize'): randomizeProperties,
-        SectionName('EarlyExit'): earlyExitProperties,
+        SectionName('Arrange'):     arrangeProperties,
+        SectionName('Randomize'):   randomizeProperties,
+        SectionName('EarlyExit'):   earlyExitProperties,
+        SectionName('Engine'):      engineProperties,
+        SectionName('Repulsion'):   repulsionProperties,
+        SectionName('Components'):  componentProperties,
+        SectionName('Incremental'): incrementalProperties,
+        SectionName('Multilevel'):  multilevelProperties,
+        SectionName('StepControl'): stepControlProperties,
+        SectionName('Status'):      statusProperties,
     }
 )
 
@@ -0,0 +1,77 @@
+
+from math import inf
+
+from numpy import ndarray
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ForceKernels import REPULSION_WEIGHT
+from pyforcedirectedlayout.ForceKernels import repulsionEnergy
+from pyforcedirectedlayout.ForceKernels import springEnergy
+from pyforcedirectedlayout.LayoutTypes import StopCriterion
+
+
+class ConvergenceMonitor:
+    """
+    Decides whether an iteration counts toward the early exit, according to `Configuration.stopCriterion`:
+
+    * Total Displacement:  The summed node displacement is below `Configuration.minimumTotalDisplacement`
+    * Max Displacement:    No node moved more than `Configuration.tolerance` spring lengths
+    * Energy:              The system energy changed by at most `Configuration.tolerance` of itself
+
+    The two normalized criteria do not depend on the number of nodes.  The energy is only computed
+    when the criterion needs it or `Configuration.reportEnergy` asks for it.
+    """
+    def __init__(self):
+
+        self._configuration: Configuration = Configuration()
+
+        self._stopCriterion:            StopCriterion = self._configuration.stopCriterion
+        self._tolerance:                float         = self._configuration.tolerance
+        self._minimumTotalDisplacement: float         = self._configuration.minimumTotalDisplacement
+        self._springLength:             float         = self._configuration.springLength
+
+        self._needsEnergy: bool  = self._stopCriterion == StopCriterion.ENERGY or self._configuration.reportEnergy
+        self._lastEnergy:  float = inf
+
+    @property
+    def needsEnergy(self) -> bool:
+        return self._needsEnergy
+
+    def energy(self, positions: ndarray, sources: ndarray, targets: ndarray) -> float:
+        """
+        The spring plus the repulsion energy of the system, consistent with the forces the engines apply
+
+        Args:
+            positions:  (n, 2) node positions
+            sources:    The index of the node each edge is from
+            targets:    The index of the node each edge is to
+
+        Returns:  The total energy;  0 when it is not needed
+        """
+        if self._needsEnergy is False:
+            return 0.0
+
+        return (REPULSION_WEIGHT * repulsionEnergy(positions=positions, coulombLawConstant=self._configuration.repulsionForce) +
+                springEnergy(positions=positions, sources=sources, targets=targets,
+                             attractionForce=self._configuration.attractionForce, springLength=self._springLength))
+
+    def isSettled(self, totalDisplacement: float, maxDisplacement: float, energy: float) -> bool:
+        """
+        Args:
+            totalDisplacement:  The summed node displacement of the iteration
+            maxDisplacement:    The largest node displacement of the iteration
+            energy:             The system energy after the iteration
+
+        Returns:  True when the iteration counts toward the early exit
+        """
+        settled: bool = False
+        if self._stopCriterion == StopCriterion.MAX_DISPLACEMENT:
+            settled = maxDisplacement <= self._tolerance * self._springLength
+        elif self._stopCriterion == StopCriterion.ENERGY:
+            settled = self._lastEnergy != inf and abs(self._lastEnergy - energy) <= self._tolerance * abs(self._lastEnergy)
+        else:
+            settled = totalDisplacement < self._minimumTotalDisplacement
+
+        self._lastEnergy = energy
+
+        return settled
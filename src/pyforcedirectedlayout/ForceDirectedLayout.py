@@ -1,4 +1,13 @@
 
+from typing import AsyncGenerator
+from typing import Dict
+from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -6,7 +15,16 @@ from logging import getLogger
 
 from sys import maxsize
 
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import Queue
+from asyncio import get_running_loop
+from asyncio import wait
+
+from dataclasses import replace
+
 from math import atan2
+from math import inf
 from math import pi
 from math import sqrt
 
@@ -16,19 +34,74 @@ from random import randint
 from uuid import uuid4
 from uuid import UUID
 
+from numpy import array
+from numpy import asarray
+from numpy import concatenate
+from numpy import flatnonzero
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+from numpy import unique
+from numpy import zeros
+
+from pyforcedirectedlayout.AdjacencyIndex import AdjacencyIndex
+from pyforcedirectedlayout.ArraySimulation import ArraySimulation
+from pyforcedirectedlayout.ArraySimulation import NO_VELOCITIES
+from pyforcedirectedlayout.CancellationToken import CancellationToken
+from pyforcedirectedlayout.CancellationToken import NO_CANCELLATION_TOKEN
 from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ConvergenceMonitor import ConvergenceMonitor
+from pyforcedirectedlayout.ForceKernels import proximity
+from pyforcedirectedlayout.ForceKernels import REPULSION_WEIGHT
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutSnapshot import LayoutSnapshot
+from pyforcedirectedlayout.LayoutTypes import Force
+from pyforcedirectedlayout.LayoutTypes import LayoutFrame
 from pyforcedirectedlayout.LayoutTypes import LayoutStatus
 from pyforcedirectedlayout.LayoutTypes import LayoutStatusCallback
+from pyforcedirectedlayout.LayoutTypes import NO_NODES_VIEW
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+from pyforcedirectedlayout.LayoutTypes import NodesView
+from pyforcedirectedlayout.LayoutTypes import RepulsionMode
+from pyforcedirectedlayout.LayoutTypes import SimulationEngine
+from pyforcedirectedlayout.LayoutTypes import StopReason
+from pyforcedirectedlayout.MultilevelSimulation import MultilevelSimulation
 from pyforcedirectedlayout.Node import Node
+from pyforcedirectedlayout.Packing import Extents
+from pyforcedirectedlayout.Packing import Offsets
+from pyforcedirectedlayout.Packing import shelfPack
 from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.QuadTree import Coordinates
+from pyforcedirectedlayout.QuadTree import QuadTree
+from pyforcedirectedlayout.SpatialGrid import SpatialGrid
+from pyforcedirectedlayout.StatusReporter import StatusReporter
+from pyforcedirectedlayout.StepController import StepController
+from pyforcedirectedlayout.StopSignal import StopSignal
 from pyforcedirectedlayout.Vector import Vector
 from pyforcedirectedlayout.LayoutTypes import Nodes
 from pyforcedirectedlayout.Rectangle import Rectangle
 from pyforcedirectedlayout.NodeLayoutInformation import NodeLayoutInformation
 from pyforcedirectedlayout.NodeLayoutInformation import NodeLayoutInformationList
 
+if TYPE_CHECKING:
+    from pyforcedirectedlayout.BatchLayout import DiagramSpecification
+
 ORIGIN_POINT: Point = Point(0, 0)
 
+NO_QUAD_TREE:    QuadTree    = cast(QuadTree, None)
+NO_SPATIAL_GRID: SpatialGrid = cast(SpatialGrid, None)
+
+NO_LAYOUT_INFORMATION: NodeLayoutInformation = cast(NodeLayoutInformation, None)
+
+NO_EDGES: ndarray = cast(ndarray, None)
+
+NO_LAYOUT_STATUS: LayoutStatus = cast(LayoutStatus, None)
+
+COMPONENT_STOP_REASONS: List[StopReason] = [StopReason.CANCELLED, StopReason.TIME_BUDGET, StopReason.MAX_ITERATIONS, StopReason.CONVERGED]
+"""
+A diagram laid out by component reports the first of these that stopped any component
+"""
+
 
 class ForceDirectedLayout:
     """
@@ -45,25 +118,52 @@ class ForceDirectedLayout:
     def __init__(self):
         self.logger: Logger = getLogger(__name__)
 
-        self._configuration: Configuration = Configuration()
-        self.id:             UUID          = uuid4()
-        self._nodes:         Nodes         = Nodes([])
+        self._configuration: Configuration    = Configuration()
+        self.id:             UUID             = uuid4()
+        self._nodes:         Dict[Node, None] = {}      # insertion ordered, for constant time membership
+        self._nodesView:     NodesView        = NO_NODES_VIEW   # built on the first read after a change
+        self._adjacency:     AdjacencyIndex   = AdjacencyIndex()
+
+        self._floatPrecision: bool = self._configuration.floatPrecision
+        self._workerCount:    int  = 0
+        # The velocity of every arranged node;  Nodes missing from here are new
+        self._layoutInformation: Dict[Node, NodeLayoutInformation] = {}
+        # Nodes whose neighborhood changed since they were arranged, insertion ordered
+        self._displacedNodes:    Dict[Node, None]                  = {}
 
     @property
-    def nodes(self) -> Nodes:
+    def nodes(self) -> NodesView:
         """
+        Repeated reads return the same tuple until nodes are added or removed
 
         Returns:  a read-only collection of the nodes in this Diagram.
         """
-        return Nodes(self._nodes[:])
+        if self._nodesView is NO_NODES_VIEW:
+            self._nodesView = NodesView(tuple(self._nodes))
+
+        return self._nodesView
+
+    @property
+    def workerCount(self) -> int:
+        """
+        Returns:  The number of processes the array engines spread the repulsion across, and the components
+                  are laid out on;  0, the default, uses `Configuration.workerCount`
+        """
+        return self._workerCount
+
+    @workerCount.setter
+    def workerCount(self, workerCount: int):
+        self._workerCount = workerCount
 
     def clear(self):
         """
         Removes all nodes and connections from the diagram.
-
-        Do not access via the property because you get a copy
         """
         self._nodes.clear()
+        self._nodesView = NO_NODES_VIEW
+        self._adjacency.clear()
+        self._layoutInformation.clear()
+        self._displacedNodes.clear()
 
     def containsNode(self, node: Node) -> bool:
         """
@@ -92,12 +192,130 @@ class ForceDirectedLayout:
         assert node is not None, 'node argument cannot be None'
 
         if node not in self._nodes:
-            self._nodes.append(node)
+            self._nodes[node] = None
+            self._nodesView   = NO_NODES_VIEW
+            self._adjacency.addNode(node)
             node.layoutEngine = self
             return True
         else:
             return False
 
+    def addGraph(self, nodes: Nodes, sources: Sequence[int] | ndarray, targets: Sequence[int] | ndarray) -> int:
+        """
+        Adds the nodes and connects them in a single pass, without the checks and the back and
+        forth between `Node` and the engine of calling `addNode` and `addChild` per element.
+        An edge list converts with `sources, targets = zip(*edges)`
+
+        Args:
+            nodes:      The nodes to add;  Nodes already on this diagram are kept
+            sources:    The index, into `nodes`, of the node each connection is from
+            targets:    The index, into `nodes`, of the node each connection is to
+
+        Returns:  The number of connections made;  Connections to the node itself and existing connections are skipped
+        """
+        for node in nodes:
+            if node not in self._nodes:
+                self._nodes[node]  = None
+                self._nodesView    = NO_NODES_VIEW
+                node._layoutEngine = self
+                self._adjacency.addNode(node)
+
+        sourceArray: ndarray = asarray(sources, dtype=int64)
+        targetArray: ndarray = asarray(targets, dtype=int64)
+
+        # keep the first of each repeated connection and drop the connections to the node itself
+        _, first = unique(sourceArray * len(nodes) + targetArray, return_index=True)
+        keep: ndarray = zeros(sourceArray.size, dtype=bool)
+        keep[first] = True
+        keep &= sourceArray != targetArray
+
+        # only nodes that were connected before the call can already have the connection
+        connected: ndarray = array([len(node._connections) > 0 for node in nodes], dtype=bool)
+        for connection in flatnonzero(keep & connected[sourceArray]).tolist():
+            if nodes[targetArray[connection]] in nodes[sourceArray[connection]]._connections:
+                keep[connection] = False
+
+        sourceArray = sourceArray[keep]
+        targetArray = targetArray[keep]
+
+        self._adjacency.addConnections(nodes=nodes, sources=sourceArray, targets=targetArray)
+        # the engine indexed the connections itself, so skip the Node.addChild notifications
+        for parentIndex in unique(sourceArray).tolist():
+            parent: Node = nodes[parentIndex]
+            parent._connections.update(dict.fromkeys(self._adjacency.children(parent)))
+            parent._connectionsView = NO_NODES_VIEW
+
+        if len(self._layoutInformation) > 0:
+            for index in unique(concatenate([sourceArray, targetArray])).tolist():
+                self._displaceNode(nodes[index])
+
+        connectionCount: int = sourceArray.size
+
+        return connectionCount
+
+    @classmethod
+    def fromGraph(cls, nodeCount: int, sources: Sequence[int] | ndarray, targets: Sequence[int] | ndarray) -> 'ForceDirectedLayout':
+        """
+        Builds a diagram of `LayoutNode`s, for graphs that have no node classes of their own
+
+        Args:
+            nodeCount:  The number of nodes
+            sources:    The index of the node each connection is from
+            targets:    The index of the node each connection is to
+
+        Returns:  A new diagram;  Its `nodes` are in index order
+        """
+        layoutEngine: ForceDirectedLayout = cls()
+        layoutEngine.addGraph(nodes=Nodes([LayoutNode() for _ in range(nodeCount)]), sources=sources, targets=targets)
+
+        return layoutEngine
+
+    @classmethod
+    def fromSnapshot(cls, layoutSnapshot: LayoutSnapshot) -> 'ForceDirectedLayout':
+        """
+        Rebuilds a saved diagram with `LayoutNode`s;  `arrange(warmStart=True)` continues the saved layout
+
+        Args:
+            layoutSnapshot:  The saved diagram
+
+        Returns:  A new diagram;  Its `nodes` are in the order of the snapshot rows
+        """
+        layoutEngine: ForceDirectedLayout = cls.fromGraph(nodeCount=layoutSnapshot.nodeCount, sources=layoutSnapshot.sources, targets=layoutSnapshot.targets)
+        layoutEngine.restoreSnapshot(layoutSnapshot)
+
+        return layoutEngine
+
+    def snapshot(self) -> LayoutSnapshot:
+        """
+        Returns:  The node locations, the velocities from the last layout and the connections, in the order of `nodes`
+        """
+        layoutList: NodeLayoutInformationList = self._currentLayoutInformation()
+        sources, targets = self._edgeArrays()
+
+        return LayoutSnapshot(nodeIds=array([node.nodeId for node in self._nodes], dtype=int64),
+                              positions=array([(node.x, node.y) for node in self._nodes], dtype=float64).reshape(-1, 2),
+                              velocities=array([(information.velocityX, information.velocityY) for information in layoutList], dtype=float64).reshape(-1, 2),
+                              sources=sources,
+                              targets=targets)
+
+    def restoreSnapshot(self, layoutSnapshot: LayoutSnapshot):
+        """
+        Places the nodes where the snapshot has them and remembers the saved velocities for a warm start.
+        The rows are matched to the nodes by position, the diagram should hold the snapshot's nodes in
+        the same order;  The connections are not touched
+
+        Args:
+            layoutSnapshot:  The saved diagram
+        """
+        assert layoutSnapshot.nodeCount == len(self._nodes), 'The snapshot is of a diagram with a different number of nodes'
+
+        floatPrecision: bool = self._configuration.floatPrecision
+        for node, (x, y) in zip(self._nodes, layoutSnapshot.positions.tolist()):
+            node.location = Point(x=x, y=y) if floatPrecision is True else Point(x=int(x), y=int(y))
+
+        self._rememberLayout(NodeLayoutInformationList([NodeLayoutInformation(node=node, nextPosition=Point(), velocityX=velocityX, velocityY=velocityY)
+                                                        for node, (velocityX, velocityY) in zip(self._nodes, layoutSnapshot.velocities.tolist())]))
+
     def removeNode(self, node: Node):
         """
         Removes the specified node from the diagram. Any connected nodes will remain on the diagram.
@@ -109,27 +327,72 @@ class ForceDirectedLayout:
         """
         node.layoutEngine = cast(ForceDirectedLayout, None)
 
-        for otherNode in self._nodes:
-            if otherNode != node and node in otherNode.connections:
-                otherNode.disConnect(node)
+        for neighbor in self._adjacency.children(node) + self._adjacency.parents(node):
+            self._displaceNode(neighbor)
+
+        for parent in Nodes(self._adjacency.parents(node)[:]):
+            if parent != node:
+                parent.disConnect(node)
+
+        self._layoutInformation.pop(node, None)
+        self._displacedNodes.pop(node, None)
 
         removed: bool = True
         try:
-            self._nodes.remove(node)
-        except ValueError:
+            del self._nodes[node]
+            self._nodesView = NO_NODES_VIEW
+            self._adjacency.removeNode(node)
+        except KeyError:
             self.logger.warning(f'Node not in this diagram. {node=}')
             removed = False
 
         return removed
 
-    def arrange(self, statusCallback: LayoutStatusCallback, deterministic:  bool = False):
+    def connectionAdded(self, parent: Node, child: Node):
+        """
+        Called by a Node on this diagram when it connects to a child
+
+        Args:
+            parent: The node the connection is from
+            child:  The node the connection is to
+        """
+        self._adjacency.addConnection(parent=parent, child=child)
+        self._displaceNode(parent)
+        self._displaceNode(child)
+
+    def connectionRemoved(self, parent: Node, child: Node):
+        """
+        Called by a Node on this diagram when it disconnects from a child
+
+        Args:
+            parent: The node the connection was from
+            child:  The node the connection was to
+        """
+        self._adjacency.removeConnection(parent=parent, child=child)
+        self._displaceNode(parent)
+        self._displaceNode(child)
+
+    def arrange(self, statusCallback: LayoutStatusCallback = NO_STATUS_CALLBACK, deterministic:  bool = False, warmStart: bool = False,
+                timeBudget: float = inf, cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN) -> LayoutStatus:
         """
         Runs the force-directed layout algorithm on this Diagram, using the specified parameters.
+        `Configuration.simulationEngine` selects the reference or the array based simulation.
 
         Args:
-            statusCallback
+            statusCallback: Reports progress, throttled by `Configuration.statusInterval` and `Configuration.statusPeriod`;
+                            `NO_STATUS_CALLBACK` reports nothing
             deterministic:  Whether to use a random or deterministic layout.
+            warmStart:      Start from the current node locations instead of random ones, and with
+                            the velocities from the last layout of each node.  Components are not
+                            laid out separately, and the multilevel engine does not coarsen, since
+                            the existing arrangement is kept
+            timeBudget:         Stop after the iteration that runs out of this many seconds of wall clock time
+            cancellationToken:  Stop after the iteration in progress once it is cancelled.  Components laid
+                                out on worker processes only honor the time budget
 
+        The nodes are centered however the simulation stopped;  `LayoutStatus.stopReason` tells why it did
+
+        Returns:  The status as of the last iteration
         """
         # random starting positions can be made deterministic by seeding with a constant
         if deterministic is True:
@@ -137,61 +400,570 @@ class ForceDirectedLayout:
         else:
             randomSeed()
 
-        # Python multiplication works different than C#;  We need a real object
-        dampingVector: Vector = Vector(direction=0.0, magnitude=self._configuration.damping)
-        layoutList:    NodeLayoutInformationList = self._randomizeInitialNodeCoordinates()
+        self._floatPrecision = self._configuration.floatPrecision
+
+        stopSignal: StopSignal = StopSignal(cancellationToken=cancellationToken, timeBudget=timeBudget)
+
+        if self._configuration.layoutComponents is True and warmStart is False:
+            components: List[Nodes] = self._adjacency.connectedComponents(self.nodes)
+            if len(components) > 1:
+                componentStatus: LayoutStatus = self._arrangeComponents(components=components, deterministic=deterministic, stopSignal=stopSignal)
+                StatusReporter(statusCallback=statusCallback).report(componentStatus)
+                componentList: NodeLayoutInformationList = NodeLayoutInformationList([NodeLayoutInformation(node=node, nextPosition=Point()) for node in self._nodes])
+                self._adjustNodes(componentList)
+                self._rememberLayout(componentList)
+                return componentStatus
+
+        previousBounds: Rectangle = self._getDiagramBounds()
+        if warmStart is True:
+            layoutList: NodeLayoutInformationList = self._currentLayoutInformation()
+        else:
+            layoutList = self._randomizeInitialNodeCoordinates()
+
+        if self._configuration.simulationEngine == SimulationEngine.NUMPY:
+            velocities:      ndarray         = array([(info.velocityX, info.velocityY) for info in layoutList], dtype=float64)
+            arraySimulation: ArraySimulation = ArraySimulation(nodes=self.nodes, velocities=velocities, workerCount=self._workerCount)
+            layoutStatus:    LayoutStatus    = arraySimulation.run(statusCallback=statusCallback, stopSignal=stopSignal)
+            self._copyVelocities(layoutList=layoutList, velocities=arraySimulation.velocities)
+        elif self._configuration.simulationEngine == SimulationEngine.MULTILEVEL:
+            warmVelocities: ndarray = NO_VELOCITIES
+            if warmStart is True:
+                warmVelocities = array([(info.velocityX, info.velocityY) for info in layoutList], dtype=float64)
+            multilevelSimulation: MultilevelSimulation = MultilevelSimulation(nodes=self.nodes, seed=1 if deterministic is True else None, velocities=warmVelocities,
+                                                                              workerCount=self._workerCount)
+            layoutStatus = multilevelSimulation.run(statusCallback=statusCallback, stopSignal=stopSignal)
+            self._copyVelocities(layoutList=layoutList, velocities=multilevelSimulation.velocities)
+        else:
+            layoutStatus = self._runSimulation(layoutList=layoutList, statusCallback=statusCallback, maxIterations=self._configuration.maxIterations,
+                                               stopSignal=stopSignal)
+
+        self._placeNodes(layoutList=layoutList, warmStart=warmStart, previousBounds=previousBounds)
+        self._rememberLayout(layoutList)
+
+        return layoutStatus
+
+    def arrangeSteps(self, deterministic: bool = False, warmStart: bool = False) -> Generator[LayoutFrame, None, LayoutStatus]:
+        """
+        Runs the layout one iteration at a time, for example to animate it.  Each frame holds the
+        positions after an iteration;  They are a new array every iteration, so a frame stays valid
+        without copying it or any node.  Close the generator to stop early.
+
+        The nodes are only moved, and centered, when the generator finishes or is closed.  The steps
+        always use the array simulation and do not lay out components separately.
+
+        Args:
+            deterministic:  Whether to use a random or deterministic layout.
+            warmStart:      Start from the current node locations and the velocities from the last layout
+
+        Returns:  The final status, as the value of the generator
+        """
+        if deterministic is True:
+            randomSeed(1)
+        else:
+            randomSeed()
+
+        self._floatPrecision = self._configuration.floatPrecision
+
+        previousBounds: Rectangle = self._getDiagramBounds()
+        if warmStart is True:
+            layoutList: NodeLayoutInformationList = self._currentLayoutInformation()
+        else:
+            layoutList = self._randomizeInitialNodeCoordinates()
+
+        velocities:      ndarray         = array([(info.velocityX, info.velocityY) for info in layoutList], dtype=float64)
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=self.nodes, velocities=velocities, workerCount=self._workerCount)
+
+        layoutStatus: LayoutStatus = LayoutStatus()
+        try:
+            for layoutStatus in arraySimulation.steps():
+                # the simulation moves the nodes in place
+                positions: ndarray = arraySimulation.positions.copy()
+                positions.flags.writeable = False
+                yield LayoutFrame(positions=positions, layoutStatus=replace(layoutStatus))
+        finally:
+            arraySimulation.updateNodeLocations()
+            self._copyVelocities(layoutList=layoutList, velocities=arraySimulation.velocities)
+            self._placeNodes(layoutList=layoutList, warmStart=warmStart, previousBounds=previousBounds)
+            self._rememberLayout(layoutList)
+
+        return layoutStatus
+
+    async def arrangeAsync(self, deterministic: bool = False, warmStart: bool = False, timeBudget: float = inf,
+                           cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN) -> AsyncGenerator[LayoutStatus, None]:
+        """
+        Runs `arrange` on the event loop's default executor, so the loop keeps serving other
+        work, and streams its progress.  Iterate it with `async for`;  It yields a copy of each
+        status that `Configuration.statusInterval` and `Configuration.statusPeriod` let through,
+        then the final status.  Do not read the node locations before the final status arrives.
+
+        Leaving the iteration early cancels the layout, through the specified token when there is one,
+        and waits for the executor to finish the iteration in progress
+
+        Args:
+            deterministic:      Whether to use a random or deterministic layout.
+            warmStart:          Start from the current node locations
+            timeBudget:         Stop after the iteration that runs out of this many seconds of wall clock time
+            cancellationToken:  Stop after the iteration in progress once it is cancelled
+
+        Returns:  The layout statuses;  The last one tells why the layout stopped
+        """
+        if cancellationToken is NO_CANCELLATION_TOKEN:
+            cancellationToken = CancellationToken()
+
+        loop:     AbstractEventLoop   = get_running_loop()
+        statuses: Queue[LayoutStatus] = Queue()
+
+        def reportStatus(layoutStatus: LayoutStatus):
+            # the engines update their status in place, so send a copy to the loop
+            loop.call_soon_threadsafe(statuses.put_nowait, replace(layoutStatus))
+
+        def arrangeInExecutor() -> LayoutStatus:
+            try:
+                return self.arrange(statusCallback=reportStatus, deterministic=deterministic, warmStart=warmStart,
+                                    timeBudget=timeBudget, cancellationToken=cancellationToken)
+            finally:
+                loop.call_soon_threadsafe(statuses.put_nowait, NO_LAYOUT_STATUS)
+
+        arranging: Future[LayoutStatus] = loop.run_in_executor(None, arrangeInExecutor)
+        try:
+            while True:
+                layoutStatus: LayoutStatus = await statuses.get()
+                if layoutStatus is NO_LAYOUT_STATUS:
+                    break
+                yield layoutStatus
+
+            yield await arranging
+        finally:
+            if arranging.done() is False:
+                cancellationToken.cancel()
+                await wait([arranging])
+
+    def arrangeIncremental(self, statusCallback: LayoutStatusCallback = NO_STATUS_CALLBACK, deterministic:  bool = False,
+                           timeBudget: float = inf, cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN) -> LayoutStatus:
+        """
+        Re-layout after nodes or connections were added or removed since the last `arrange`.
+        Arranged nodes keep their locations and velocities.  New nodes start next to the arranged
+        nodes they are connected to.  Only the new nodes, the nodes whose connections changed and
+        their neighbors move, for at most `Configuration.relaxationIterations` iterations, so the
+        cost follows the size of the change rather than the size of the diagram.
+
+        The relaxation always runs the reference simulation, whatever `Configuration.simulationEngine`
+        says, since the array engines move every node.  The Barnes-Hut quadtree or the cutoff grid
+        is built once, over the nodes that stay put, instead of over every node each iteration.
+
+        The diagram is not re-centered so that the unchanged part stays where it is.  When the
+        diagram was never arranged this is the same as `arrange`
+
+        Args:
+            statusCallback: Reports progress, throttled by `Configuration.statusInterval` and `Configuration.statusPeriod`;
+                            `NO_STATUS_CALLBACK` reports nothing
+            deterministic:  Whether to use a random or deterministic placement of the new nodes.
+            timeBudget:         Stop after the iteration that runs out of this many seconds of wall clock time
+            cancellationToken:  Stop after the iteration in progress once it is cancelled
+
+        Returns:  The status as of the last iteration
+        """
+        if len(self._layoutInformation) == 0:
+            return self.arrange(statusCallback=statusCallback, deterministic=deterministic, timeBudget=timeBudget, cancellationToken=cancellationToken)
+
+        if deterministic is True:
+            randomSeed(1)
+        else:
+            randomSeed()
+
+        self._floatPrecision = self._configuration.floatPrecision
+
+        newNodes: Nodes = Nodes([node for node in self._nodes if node not in self._layoutInformation])
+        for node in newNodes:
+            self._placeNearNeighbors(node)
+
+        seeds:   Nodes = Nodes(newNodes + list(self._displacedNodes))
+        movable: Nodes = self._neighborhood(seeds)
+
+        layoutList: NodeLayoutInformationList = NodeLayoutInformationList([self._layoutInformation[node] for node in movable])
+
+        self._displacedNodes.clear()
+        self.logger.debug(f'Relaxing {len(layoutList)} of {len(self._nodes)} nodes')
+
+        stopSignal: StopSignal = StopSignal(cancellationToken=cancellationToken, timeBudget=timeBudget)
+
+        return self._runSimulation(layoutList=layoutList, statusCallback=statusCallback, maxIterations=self._configuration.relaxationIterations,
+                                   stopSignal=stopSignal, pinUnlisted=True)
+
+    def _runSimulation(self, layoutList: NodeLayoutInformationList, statusCallback: LayoutStatusCallback, maxIterations: int,
+                       stopSignal: StopSignal, pinUnlisted: bool = False) -> LayoutStatus:
+        """
+        The node-by-node reference simulation.  Only the nodes in the layout list move;  Every
+        node in the diagram exerts force on them
+
+        Args:
+            layoutList:     The layout metadata for each node to move
+            statusCallback: Called after the iterations `StatusReporter` lets through
+            maxIterations:  Stop after this many iterations
+            stopSignal:     Stops the simulation when cancelled or out of time
+            pinUnlisted:    The nodes that are not in the layout list never move during the run, so the
+                            quadtree or grid is built over them once;  The moving nodes repel each other exactly
+
+        Returns:  The status as of the last iteration
+        """
+        damping:      float = self._configuration.damping
+        springLength: int   = self._configuration.springLength
 
         stopCount:  int = 0
         iterations: int = 0
 
+        stepController:     StepController     = StepController()
+        convergenceMonitor: ConvergenceMonitor = ConvergenceMonitor()
+        statusReporter:     StatusReporter     = StatusReporter(statusCallback=statusCallback)
+
+        sources, targets = self._edgeArrays() if convergenceMonitor.needsEnergy is True else (NO_EDGES, NO_EDGES)
+
+        movingNodes: Nodes       = Nodes([layoutInformation.node for layoutInformation in layoutList])
+        fixedIndex:  bool        = pinUnlisted is True and self._configuration.repulsionMode != RepulsionMode.ALL_PAIRS
+        quadTree:    QuadTree    = NO_QUAD_TREE
+        spatialGrid: SpatialGrid = NO_SPATIAL_GRID
+        if fixedIndex is True:
+            moving:      Set[Node] = set(movingNodes)
+            pinnedNodes: Nodes     = Nodes([node for node in self._nodes if node not in moving])
+            quadTree    = self._buildQuadTree(nodes=pinnedNodes)
+            spatialGrid = self._buildSpatialGrid(nodes=pinnedNodes)
+
         layoutStatus: LayoutStatus = LayoutStatus()
         while True:
+            forceEnergy:       float = 0.0
             totalDisplacement: float = 0.0
+            maxDisplacement:   float = 0.0
+            if fixedIndex is False:
+                quadTree    = self._buildQuadTree(nodes=self._nodes)
+                spatialGrid = self._buildSpatialGrid(nodes=self._nodes)
             for currentMeta in layoutList:
                 metaNode: Node = currentMeta.node
-                #
-                # express the node's current position as a vector, relative to the origin
-                #
-                magnitude:       int    = ForceDirectedLayout.calculateDistance(a=ORIGIN_POINT, b=metaNode.location)
-                direction:       float  = self._getBearingAngle(start=ORIGIN_POINT, end=metaNode.location)
-                currentPosition: Vector = Vector(magnitude=magnitude, direction=direction)
-
-                netForce: Vector = self._determineRepulsionBetweenNodes(metaNode=metaNode)
-                netForce += self._determineAttractionBetweenConnections(currentLayoutNode=metaNode,
-                                                                        springLength=self._configuration.springLength,
-                                                                        netForce=netForce)
+
+                repulsionX, repulsionY   = self._netRepulsion(metaNode=metaNode, quadTree=quadTree, spatialGrid=spatialGrid)
+                if fixedIndex is True:
+                    movingX, movingY = self._movingRepulsion(metaNode=metaNode, movingNodes=movingNodes)
+                    repulsionX += movingX
+                    repulsionY += movingY
+                attractionX, attractionY = self._determineAttractionBetweenConnections(currentLayoutNode=metaNode, springLength=springLength)
+
+                netX: float = REPULSION_WEIGHT * repulsionX + attractionX
+                netY: float = REPULSION_WEIGHT * repulsionY + attractionY
+                forceEnergy += netX * netX + netY * netY
 
                 # apply net force to node velocity
-                currentMeta.velocity = (currentMeta.velocity + netForce) * dampingVector
+                currentMeta.velocityX, currentMeta.velocityY = stepController.limit(velocityX=(currentMeta.velocityX + netX) * damping,
+                                                                                    velocityY=(currentMeta.velocityY + netY) * damping)
                 # apply velocity to node position
-                currentMeta.nextPosition = (currentPosition + currentMeta.velocity).toPoint()
+                nextX: float = metaNode.x + currentMeta.velocityX
+                nextY: float = metaNode.y + currentMeta.velocityY
+                if self._floatPrecision is True:
+                    currentMeta.nextPosition = Point(x=nextX, y=nextY)
+                else:
+                    currentMeta.nextPosition = Point(x=int(nextX), y=int(nextY))
 
             # move nodes to resultant positions (and calculate total displacement)
             for currentMeta in layoutList:
                 metaNode = currentMeta.node
-                totalDisplacement += ForceDirectedLayout.calculateDistance(a=metaNode.location, b=currentMeta.nextPosition)
+                displacement: float = ForceDirectedLayout.calculateExactDistance(a=metaNode.location, b=currentMeta.nextPosition)
+                if self._floatPrecision is True:
+                    totalDisplacement += displacement
+                else:
+                    totalDisplacement += int(displacement)
+                maxDisplacement = max(maxDisplacement, displacement)
                 metaNode.location = currentMeta.nextPosition
 
+            energy: float = 0.0
+            if convergenceMonitor.needsEnergy is True:
+                positions: ndarray = array([(node.x, node.y) for node in self._nodes], dtype=float64).reshape(-1, 2)
+                energy = convergenceMonitor.energy(positions=positions, sources=sources, targets=targets)
+
             iterations += 1
-            if totalDisplacement < self._configuration.minimumTotalDisplacement:
+            if convergenceMonitor.isSettled(totalDisplacement=totalDisplacement, maxDisplacement=maxDisplacement, energy=energy) is True:
                 stopCount += 1
+
+            layoutStatus.totalDisplacement = totalDisplacement
+            layoutStatus.stopCount         = stopCount
+            layoutStatus.iterations        = iterations
+            layoutStatus.maxIterations     = maxIterations
+            layoutStatus.stepSize          = stepController.stepSize
+            layoutStatus.maxDisplacement   = maxDisplacement
+            layoutStatus.energy            = energy
+
+            stepController.update(energy=forceEnergy)
+
             if stopCount > self._configuration.stopCount:
                 self.logger.info(f'Exiting early: {totalDisplacement=} {stopCount=}')
+                layoutStatus.stopReason = StopReason.CONVERGED
                 break
-            if iterations >= self._configuration.maxIterations:
+            if iterations >= maxIterations:
                 self.logger.info(f'Exiting exceeded maxIterations: {iterations=}')
+                layoutStatus.stopReason = StopReason.MAX_ITERATIONS
+                break
+            stopReason: StopReason = stopSignal.stopReason()
+            if stopReason != StopReason.RUNNING:
+                self.logger.info(f'Exiting {stopReason.value}: {iterations=}')
+                layoutStatus.stopReason = stopReason
                 break
 
-            layoutStatus.totalDisplacement = totalDisplacement
-            layoutStatus.stopCount         = stopCount
-            layoutStatus.iterations        = iterations
-            layoutStatus.maxIterations     = self._configuration.maxIterations
+            if statusReporter.isDue(iterations=iterations) is True:
+                statusReporter.report(layoutStatus)
+
+        return layoutStatus
+
+    def _edgeArrays(self) -> Tuple[ndarray, ndarray]:
+        """
+        Connections to nodes that are not part of the diagram are ignored
+
+        Returns:  The connections as parallel source and target node index arrays
+        """
+        indices: Dict[Node, int] = {node: index for index, node in enumerate(self._nodes)}
+
+        sources: List[int] = []
+        targets: List[int] = []
+        for index, node in enumerate(self._nodes):
+            for child in self._adjacency.children(node):
+                childIndex: int | None = indices.get(child)
+                if childIndex is None:
+                    self.logger.debug(f'Ignoring connection to a node outside the diagram: {child=}')
+                else:
+                    sources.append(index)
+                    targets.append(childIndex)
+
+        return array(sources, dtype=int64), array(targets, dtype=int64)
+
+    def _currentLayoutInformation(self) -> NodeLayoutInformationList:
+        """
+        Copy nodes into an array of metadata, keeping their current locations.  Nodes that were
+        laid out before keep their last velocity
+
+        Returns:  Metadata
+        """
+        layout: NodeLayoutInformationList = NodeLayoutInformationList([])
+        for node in self._nodes:
+            previous: NodeLayoutInformation = self._layoutInformation.get(node, NO_LAYOUT_INFORMATION)
+            if previous is NO_LAYOUT_INFORMATION:
+                layout.append(NodeLayoutInformation(node=node, nextPosition=Point()))
+            else:
+                layout.append(NodeLayoutInformation(node=node, nextPosition=Point(), velocityX=previous.velocityX, velocityY=previous.velocityY))
+
+        return layout
+
+    def _copyVelocities(self, layoutList: NodeLayoutInformationList, velocities: ndarray):
+        """
+        Args:
+            layoutList:     The layout metadata for every node
+            velocities:     The (n, 2) final velocities from an array simulation
+        """
+        for layoutInformation, (velocityX, velocityY) in zip(layoutList, velocities.tolist()):
+            layoutInformation.velocityX = velocityX
+            layoutInformation.velocityY = velocityY
+
+    def _rememberLayout(self, layoutList: NodeLayoutInformationList):
+        """
+        Keep the velocities of the arranged nodes for later incremental layouts
+
+        Args:
+            layoutList:     The layout metadata for every node
+        """
+        self._layoutInformation = {layoutInformation.node: layoutInformation for layoutInformation in layoutList}
+        self._displacedNodes.clear()
+
+    def _displaceNode(self, node: Node):
+        """
+        Mark an arranged node for relaxation on the next incremental layout
+
+        Args:
+            node:   A node whose connections changed
+        """
+        if node in self._layoutInformation:
+            self._displacedNodes[node] = None
+
+    def _placeNearNeighbors(self, node: Node):
+        """
+        Place a new node near the arranged nodes it is connected to, or randomly near the
+        origin when it has none, and start tracking its velocity
+
+        Args:
+            node:   A node that was added since the last layout
+        """
+        neighbors: Nodes = Nodes([neighbor for neighbor in self._adjacency.children(node) + self._adjacency.parents(node)
+                                  if neighbor in self._layoutInformation])
+
+        spread: int = self._configuration.springLength // 2
+        if len(neighbors) == 0:
+            centerX: float = 0.0
+            centerY: float = 0.0
+            spread = 50
+        else:
+            centerX = sum(neighbor.x for neighbor in neighbors) / len(neighbors)
+            centerY = sum(neighbor.y for neighbor in neighbors) / len(neighbors)
+
+        # jitter so that new nodes with the same neighbors do not coincide
+        x: float = centerX + randint(-spread, spread)
+        y: float = centerY + randint(-spread, spread)
+        if self._floatPrecision is True:
+            node.location = Point(x=x, y=y)
+        else:
+            node.location = Point(x=int(x), y=int(y))
+
+        self._layoutInformation[node] = NodeLayoutInformation(node=node, nextPosition=Point())
+
+    def _neighborhood(self, seeds: Nodes) -> Nodes:
+        """
+        Args:
+            seeds:  The nodes that changed
+
+        Returns:  The seeds and their direct neighbors, each once, in diagram order
+        """
+        included: Set[Node] = set()
+        for seed in seeds:
+            included.add(seed)
+            included.update(self._adjacency.children(seed) + self._adjacency.parents(seed))
+
+        return Nodes([node for node in self._nodes if node in included and node in self._layoutInformation])
+
+    def _arrangeComponents(self, components: List[Nodes], deterministic: bool, stopSignal: StopSignal) -> LayoutStatus:
+        """
+        Lay out each connected component independently, on the worker processes when there are
+        several, and then pack the components next to each other.  Components do not repel
+        each other, so they neither pay for the repulsion between them nor drift apart
+
+        Args:
+            components:     The connected components of the diagram
+            deterministic:  Whether to use a random or deterministic layout.
+            stopSignal:     Its remaining time is the time budget of each component;  Only the
+                            components laid out in this process honor its cancellation token
+
+        Returns:  The combined status;  The most iterations that any component needed
+        """
+        # BatchLayout arranges each diagram with its own ForceDirectedLayout
+        from pyforcedirectedlayout.BatchLayout import BatchLayout
+        from pyforcedirectedlayout.BatchLayout import DiagramLayout
+        from pyforcedirectedlayout.BatchLayout import DiagramSpecification
+        from pyforcedirectedlayout.BatchLayout import layoutDiagram
+
+        diagramSpecifications: List[DiagramSpecification] = [self._toDiagramSpecification(component, deterministic) for component in components]
+
+        workerCount: int = self._workerCount if self._workerCount > 0 else self._configuration.workerCount
+        if workerCount > 1:
+            for diagramSpecification in diagramSpecifications:
+                diagramSpecification.timeBudget = stopSignal.remainingTime
+            diagramLayouts: List[DiagramLayout] = BatchLayout(workerCount=workerCount).arrange(diagramSpecifications)
+        else:
+            diagramLayouts = []
+            for diagramSpecification in diagramSpecifications:
+                diagramSpecification.timeBudget = stopSignal.remainingTime
+                diagramLayouts.append(layoutDiagram(diagramSpecification, cancellationToken=stopSignal.cancellationToken, workerCount=workerCount))
 
-            statusCallback(layoutStatus)
-        # center the diagram around the origin
-        self._adjustNodes()
+        layoutStatus: LayoutStatus = LayoutStatus(maxIterations=self._configuration.maxIterations)
+        for component, diagramLayout in zip(components, diagramLayouts):
+            for node, position in zip(component, diagramLayout.positions):
+                node.location = Point(x=position.x, y=position.y)
+            layoutStatus.totalDisplacement += diagramLayout.layoutStatus.totalDisplacement
+            layoutStatus.iterations = max(layoutStatus.iterations, diagramLayout.layoutStatus.iterations)
+            layoutStatus.stopCount  = max(layoutStatus.stopCount,  diagramLayout.layoutStatus.stopCount)
 
-    def _adjustNodes(self):
+        stopReasons: List[StopReason] = [diagramLayout.layoutStatus.stopReason for diagramLayout in diagramLayouts]
+        layoutStatus.stopReason = next((stopReason for stopReason in COMPONENT_STOP_REASONS if stopReason in stopReasons), StopReason.RUNNING)
+
+        self._packComponents(components=components)
+
+        return layoutStatus
+
+    def _toDiagramSpecification(self, component: Nodes, deterministic: bool) -> 'DiagramSpecification':
+        """
+        Args:
+            component:      The nodes of a connected component
+            deterministic:  Whether to use a random or deterministic layout.
+
+        Returns:  The component with its nodes replaced by their index;  Connections to nodes
+        outside the component are left out
+        """
+        from pyforcedirectedlayout.BatchLayout import DiagramSpecification
+        from pyforcedirectedlayout.BatchLayout import Edge
+        from pyforcedirectedlayout.BatchLayout import Edges
+
+        indices: Dict[Node, int] = {node: index for index, node in enumerate(component)}
+        edges:   Edges           = Edges([])
+        for node in component:
+            for child in self._adjacency.children(node):
+                if child in indices:
+                    edges.append(Edge((indices[node], indices[child])))
+
+        return DiagramSpecification(nodeCount=len(component), edges=edges, sizes=[node.size for node in component], deterministic=deterministic)
+
+    def _packComponents(self, components: List[Nodes]):
+        """
+        Move the components so that their bounding boxes sit on compact shelves
+
+        Args:
+            components:  The arranged connected components
+        """
+        extents: Extents     = Extents([])
+        origins: List[Point] = []
+        for component in components:
+            left:   float = min(node.x for node in component)
+            top:    float = min(node.y for node in component)
+            right:  float = max(node.x + node.size.width  for node in component)
+            bottom: float = max(node.y + node.size.height for node in component)
+            extents.append((right - left, bottom - top))
+            origins.append(Point(x=left, y=top))
+
+        offsets: Offsets = shelfPack(extents=extents, gap=self._configuration.componentGap)
+        for component, origin, (offsetX, offsetY) in zip(components, origins, offsets):
+            deltaX: float = offsetX - origin.x
+            deltaY: float = offsetY - origin.y
+            if self._floatPrecision is False:
+                deltaX = int(deltaX)
+                deltaY = int(deltaY)
+            for node in component:
+                node.location = Point(x=node.x + deltaX, y=node.y + deltaY)
+
+    def roundNodeLocations(self):
+        """
+        Rounds every node location to whole pixels.  Only needed after arranging with
+        `Configuration.floatPrecision`, where locations keep sub-pixel coordinates
+        """
+        for node in self._nodes:
+            node.location = node.location.rounded()
+
+    def _placeNodes(self, layoutList: NodeLayoutInformationList, warmStart: bool, previousBounds: Rectangle):
+        """
+        A warm start keeps the diagram where it was;  Otherwise the diagram is centered
+
+        Args:
+            layoutList:      The layout metadata for every node
+            warmStart:       Whether the layout continued from the current node locations
+            previousBounds:  The diagram bounds before the layout
+        """
+        if warmStart is True:
+            self._translateNodes(previousBounds)
+        else:
+            self._adjustNodes(layoutList)
+
+    def _translateNodes(self, previousBounds: Rectangle):
+        """
+        Move the diagram, without mirroring it, so that its bounds start where they did before the layout.
+        The velocities do not change with a translation
+
+        Args:
+            previousBounds:  The diagram bounds before the layout
+        """
+        logicalBounds: Rectangle = self._getDiagramBounds()
+
+        deltaX: int = previousBounds.x - logicalBounds.x
+        deltaY: int = previousBounds.y - logicalBounds.y
+        for node in self._nodes:
+            node.location = Point(x=node.x + deltaX, y=node.y + deltaY)
+
+    def _adjustNodes(self, layoutList: NodeLayoutInformationList):
+        """
+        Center the diagram.  The placement mirrors the diagram, so the velocities are mirrored as well
+        to stay valid for a later warm start
+
+        Args:
+            layoutList:     The layout metadata for every node
+        """
         logicalBounds: Rectangle = self._getDiagramBounds()
         # midPoint:      Point     = Point(x=logicalBounds.x + (logicalBounds.width // 2),
         #                                  y=logicalBounds.y + (logicalBounds.height // 2)
@@ -205,38 +977,131 @@ class ForceDirectedLayout:
             node.location.x += node.size.width
             node.location.y += node.size.height
 
-    def _determineRepulsionBetweenNodes(self, metaNode: Node) -> Vector:
+        for layoutInformation in layoutList:
+            layoutInformation.velocityX = -layoutInformation.velocityX
+            layoutInformation.velocityY = -layoutInformation.velocityY
+
+    def _buildQuadTree(self, nodes: Iterable[Node]) -> QuadTree:
+        """
+        Args:
+            nodes:  The nodes that repel
+
+        Returns:  A quadtree over their current locations when using the Barnes-Hut approximation,
+        else NO_QUAD_TREE
+        """
+        if self._configuration.repulsionMode == RepulsionMode.BARNES_HUT:
+            return QuadTree(coordinates=Coordinates([(node.x, node.y) for node in nodes]))
+        else:
+            return NO_QUAD_TREE
+
+    def _buildSpatialGrid(self, nodes: Iterable[Node]) -> SpatialGrid:
+        """
+        Args:
+            nodes:  The nodes that repel
+
+        Returns:  A hash grid over their current locations when using the cutoff radius,
+        else NO_SPATIAL_GRID
+        """
+        if self._configuration.repulsionMode == RepulsionMode.CUTOFF_GRID:
+            return SpatialGrid(coordinates=Coordinates([(node.x, node.y) for node in nodes]), cutoffRadius=self._configuration.cutoffRadius)
+        else:
+            return NO_SPATIAL_GRID
+
+    def _movingRepulsion(self, metaNode: Node, movingNodes: Nodes) -> Force:
+        """
+        The repulsion between the nodes that move, which a quadtree or grid over the pinned nodes leaves out;
+        Honors the cutoff radius
 
-        netForce: Vector = Vector(magnitude=0, direction=0)
+        Args:
+            metaNode:       The node the force is acting on
+            movingNodes:    The nodes that move
+
+        Returns:  The net repulsion force of the other moving nodes
+        """
+        coulombLawConstant: int   = self._configuration.repulsionForce
+        cutoffRadius:       float = self._configuration.cutoffRadius if self._configuration.repulsionMode == RepulsionMode.CUTOFF_GRID else inf
+
+        netX: float = 0.0
+        netY: float = 0.0
+        for other in movingNodes:
+            if other != metaNode and ForceDirectedLayout.calculateExactDistance(a=metaNode.location, b=other.location) <= cutoffRadius:
+                forceX, forceY = self._repulsionComponents(x=metaNode, y=other, coulombLawConstant=coulombLawConstant)
+                netX += forceX
+                netY += forceY
+
+        return Force((netX, netY))
+
+    def _determineRepulsionBetweenNodes(self, metaNode: Node, quadTree: QuadTree = NO_QUAD_TREE, spatialGrid: SpatialGrid = NO_SPATIAL_GRID) -> Vector:
+        """
+        Determine the repulsion exerted on a node by every other node
+
+        Args:
+            metaNode:       The node the force is acting on
+            quadTree:       When present, approximate distant nodes with this Barnes-Hut quadtree
+            spatialGrid:    When present, only the nodes within the cutoff radius in this grid repel
+
+        Returns:  The net repulsion force
+        """
+        forceX, forceY = self._netRepulsion(metaNode=metaNode, quadTree=quadTree, spatialGrid=spatialGrid)
+
+        return Vector.fromCartesian(x=forceX, y=forceY)
+
+    def _netRepulsion(self, metaNode: Node, quadTree: QuadTree, spatialGrid: SpatialGrid = NO_SPATIAL_GRID) -> Force:
+        """
+        Sum the repulsion on a node in Cartesian form
+
+        Args:
+            metaNode:       The node the force is acting on
+            quadTree:       When present, approximate distant nodes with this Barnes-Hut quadtree
+            spatialGrid:    When present, only the nodes within the cutoff radius in this grid repel
+
+        Returns:  The net repulsion force
+        """
+        if quadTree is not NO_QUAD_TREE:
+            return quadTree.repulsionAt(x=metaNode.x, y=metaNode.y, coulombLawConstant=self._configuration.repulsionForce, theta=self._configuration.theta,
+                                        floatPrecision=self._floatPrecision)
+        if spatialGrid is not NO_SPATIAL_GRID:
+            return spatialGrid.repulsionAt(x=metaNode.x, y=metaNode.y, coulombLawConstant=self._configuration.repulsionForce,
+                                           floatPrecision=self._floatPrecision)
 
+        coulombLawConstant: int = self._configuration.repulsionForce
+
+        netX: float = 0.0
+        netY: float = 0.0
         for other in self._nodes:
             if other != metaNode:
-                netForce = netForce + self._calculateRepulsionForce(x=metaNode, y=other)
+                forceX, forceY = self._repulsionComponents(x=metaNode, y=other, coulombLawConstant=coulombLawConstant)
+                netX += forceX
+                netY += forceY
 
-        return netForce
+        return Force((netX, netY))
 
-    def _determineAttractionBetweenConnections(self, currentLayoutNode: Node, springLength: int, netForce: Vector) -> Vector:
+    def _determineAttractionBetweenConnections(self, currentLayoutNode: Node, springLength: int) -> Force:
         """
         Determine attraction between connections
 
         Args:
-            currentLayoutNode:
-            springLength:
-            netForce:
-
-        Returns:
+            currentLayoutNode:  The node the force is acting on
+            springLength:       The length of the spring, in pixels.
 
+        Returns:  The net attraction force in Cartesian form
         """
+        attractionForce: float = self._configuration.attractionForce
 
-        for child in currentLayoutNode.connections:
-            netForce += self._calculateAttractionForce(x=currentLayoutNode, y=child, springLength=springLength)
+        netX: float = 0.0
+        netY: float = 0.0
 
-        for p in self._nodes:
-            parent: Node = cast(Node, p)
-            if currentLayoutNode in parent.connections:
-                netForce += self._calculateAttractionForce(x=currentLayoutNode, y=parent, springLength=springLength)
+        for child in self._adjacency.children(currentLayoutNode):
+            forceX, forceY = self._attractionComponents(x=currentLayoutNode, y=child, springLength=springLength, attractionForce=attractionForce)
+            netX += forceX
+            netY += forceY
 
-        return netForce
+        for parent in self._adjacency.parents(currentLayoutNode):
+            forceX, forceY = self._attractionComponents(x=currentLayoutNode, y=parent, springLength=springLength, attractionForce=attractionForce)
+            netX += forceX
+            netY += forceY
+
+        return Force((netX, netY))
 
     def _randomizeInitialNodeCoordinates(self) -> NodeLayoutInformationList:
         """
@@ -256,10 +1121,7 @@ class ForceDirectedLayout:
             # diagramNode.location = Point(x=randint(minRandomX, maxRandomX), y=randint(minRandomY, maxRandomY))
             diagramNode.location = Point(x=randint(-50, 50), y=randint(-50, 50))
             # diagramNode.location = Point(x=randint(10, 100), y=randint(10, 100))
-            layoutInformation: NodeLayoutInformation = NodeLayoutInformation(node=diagramNode,
-                                                                             velocity=Vector(magnitude=0, direction=0),
-                                                                             nextPosition=Point(),
-                                                                             )
+            layoutInformation: NodeLayoutInformation = NodeLayoutInformation(node=diagramNode, nextPosition=Point())
             layout.append(layoutInformation)
 
         return layout
@@ -274,14 +1136,9 @@ class ForceDirectedLayout:
 
         Returns:  A Vector representing the attraction force.
         """
-        proximity: int = max(ForceDirectedLayout.calculateDistance(x.location, y.location), 1)
-        # Hooke's Law: F = -kx
-        attraction: float = self._configuration.attractionForce
-        force: float = attraction * max(proximity - springLength, 0)
-        angle: float = self._getBearingAngle(start=x.location, end=y.location)
+        forceX, forceY = self._attractionComponents(x=x, y=y, springLength=springLength, attractionForce=self._configuration.attractionForce)
 
-        attractionVector: Vector = Vector(magnitude=force, direction=angle)
-        return attractionVector
+        return Vector.fromCartesian(x=forceX, y=forceY)
 
     def _calculateRepulsionForce(self, x: Node, y: Node) -> Vector:
         """
@@ -295,16 +1152,65 @@ class ForceDirectedLayout:
 
         Returns:    A Vector representing the repulsion force.
         """
-        proximity: int = max(ForceDirectedLayout.calculateDistance(x.location, y.location), 1)
-        #  Coulomb's Law: F = k(Qq/r^2)
-        coulombLawConstant: int = self._configuration.repulsionForce
+        forceX, forceY = self._repulsionComponents(x=x, y=y, coulombLawConstant=self._configuration.repulsionForce)
+
+        return Vector.fromCartesian(x=forceX, y=forceY)
+
+    def _attractionComponents(self, x: Node, y: Node, springLength: float, attractionForce: float) -> Force:
+        """
+        Hooke's Law: F = -kx
+
+        Args:
+            x:                  The node that the force is acting on
+            y:                  The node creating the force
+            springLength:       The length of the spring, in pixels.
+            attractionForce:    The spring constant;  Passed in to keep configuration lookups out of the inner loop
+
+        Returns:  The attraction force in Cartesian form;  Points from x towards y
+        """
+        deltaX:   float = y.x - x.x
+        deltaY:   float = y.y - x.y
+        distance: float = sqrt(deltaX * deltaX + deltaY * deltaY)
+        if distance == 0:
+            return Force((0.0, 0.0))
+
+        proximity: float = self._proximity(distance)
+        force:     float = attractionForce * max(proximity - springLength, 0)
+
+        return Force((deltaX * force / distance, deltaY * force / distance))
+
+    def _repulsionComponents(self, x: Node, y: Node, coulombLawConstant: float) -> Force:
+        """
+        Coulomb's Law: F = k(Qq/r^2)
+
+        Args:
+            x:                  The node that the force is acting on.
+            y:                  The node creating the force.
+            coulombLawConstant: k;  Passed in to keep configuration lookups out of the inner loop
+
+        Returns:  The repulsion force in Cartesian form;  Points from y towards x.  Coincident nodes
+        have no direction and exert no force
+        """
+        deltaX:   float = y.x - x.x
+        deltaY:   float = y.y - x.y
+        distance: float = sqrt(deltaX * deltaX + deltaY * deltaY)
+        if distance == 0:
+            return Force((0.0, 0.0))
 
-        force: float = -(coulombLawConstant / pow(proximity, 2))
-        angle: float = self._getBearingAngle(start=x.location, end=y.location)
+        proximity: float = self._proximity(distance)
+        # negative magnitude pushes x away from y
+        force:     float = -(coulombLawConstant / (proximity * proximity))
 
-        vector: Vector = Vector(magnitude=force, direction=angle)
+        return Force((deltaX * force / distance, deltaY * force / distance))
 
-        return vector
+    def _proximity(self, distance: float) -> float:
+        """
+        Args:
+            distance:   The distance between two nodes
+
+        Returns:  The distance used by the force laws, see `ForceKernels.proximity`
+        """
+        return proximity(distance, self._floatPrecision)
 
     def _getBearingAngle(self, start: Point, end: Point) -> float:
         """
@@ -316,8 +1222,12 @@ class ForceDirectedLayout:
 
         Returns: The bearing angle, in degrees.
         """
-        x: int = start.x + ((end.x - start.x) // 2)
-        y: int = start.y + ((end.y - start.y) // 2)
+        if self._floatPrecision is True:
+            x: float = start.x + ((end.x - start.x) / 2)
+            y: float = start.y + ((end.y - start.y) / 2)
+        else:
+            x = start.x + ((end.x - start.x) // 2)
+            y = start.y + ((end.y - start.y) // 2)
 
         half: Point = Point(x=x, y=y)
 
@@ -342,10 +1252,10 @@ class ForceDirectedLayout:
 
         Returns:  Rectangle that fits exactly around every node in the diagram.
         """
-        minX: int = maxsize     # The biggest it can be.
-        minY: int = maxsize
-        maxX: int = 0           # The smallest it can be.
-        maxY: int = 0
+        minX: float = maxsize     # The biggest it can be.
+        minY: float = maxsize
+        maxX: float = 0           # The smallest it can be.
+        maxY: float = 0
 
         for node in self._nodes:
             if node.x < minX:
@@ -357,7 +1267,7 @@ class ForceDirectedLayout:
             if node.y > maxY:
                 maxY = node.y
 
-        rectangle: Rectangle = Rectangle.FromLTRB(minX, minY, maxX, maxY)
+        rectangle: Rectangle = Rectangle.FromLTRB(int(minX), int(minY), int(maxX), int(maxY))
         self.logger.debug(f'{rectangle=}')
         return rectangle
 
@@ -389,12 +1299,23 @@ class ForceDirectedLayout:
 
         Returns: The pixel distance between the two points.
         """
+        return int(ForceDirectedLayout.calculateExactDistance(a=a, b=b))
+
+    @classmethod
+    def calculateExactDistance(cls, a: Point, b: Point) -> float:
+        """
+        Calculates the distance between two points without truncating it to whole pixels.
+
+        Args:
+            a:  The first point
+            b:  The second point
+
+        Returns: The distance between the two points.
+        """
         xDistance: float = a.x - b.x
         yDistance: float = a.y - b.y
 
-        distance: float = sqrt(pow(xDistance, 2) + pow(yDistance, 2))
-
-        return int(distance)
+        return sqrt(pow(xDistance, 2) + pow(yDistance, 2))
 
     def __eq__(self, other) -> bool:
 
@@ -0,0 +1,176 @@
+
+from typing import Tuple
+
+from math import hypot as scalarHypot
+
+from numpy import bincount
+from numpy import einsum
+from numpy import float64
+from numpy import hypot
+from numpy import maximum
+from numpy import ndarray
+from numpy import where
+from numpy import zeros
+
+REPULSION_WEIGHT: float = 2.0
+"""
+The original accumulation passed the repulsion total into the attraction accumulation and then
+added the result back onto it, so repulsion was counted twice.  Both engines keep that weight so
+that layouts keep their established spacing
+"""
+ROW_BLOCK_SIZE: int = 512
+"""
+Number of rows of the pairwise repulsion matrix computed at once;  Bounds the
+temporary memory to ROW_BLOCK_SIZE * node count
+"""
+
+
+def repulsionForRows(positions: ndarray, start: int, end: int, coulombLawConstant: float) -> ndarray:
+    """
+    Coulomb's Law: F = k(Qq/r^2), evaluated between the nodes in rows [start, end) and every
+    other node, one block of rows at a time.  Coincident nodes (including a node and itself)
+    do not repel each other
+
+    Args:
+        positions:          (n, 2) node positions
+        start:              The first row
+        end:                One past the last row
+        coulombLawConstant: k
+
+    Returns:  (end - start, 2) repulsion force on each node in the rows
+    """
+    forces: ndarray = zeros((end - start, 2), dtype=float64)
+
+    for blockStart in range(start, end, ROW_BLOCK_SIZE):
+        blockEnd: int = min(blockStart + ROW_BLOCK_SIZE, end)
+        # vectors from each node in the block towards every other node
+        deltas:    ndarray = positions[None, :, :] - positions[blockStart:blockEnd, None, :]
+        distances: ndarray = hypot(deltas[..., 0], deltas[..., 1])
+        proximity: ndarray = maximum(distances, 1.0)
+        # negative magnitude pushes the node away from the other node;  divide by the distance to normalize deltas
+        scale: ndarray = where(distances > 0, -coulombLawConstant / (proximity * proximity * where(distances > 0, distances, 1.0)), 0.0)
+
+        forces[blockStart - start:blockEnd - start] = einsum('bn,bnd->bd', scale, deltas)
+
+    return forces
+
+
+def attractionForEdges(positions: ndarray, sources: ndarray, targets: ndarray, attractionForce: float, springLength: float) -> ndarray:
+    """
+    Hooke's Law: F = -kx, evaluated for every edge and applied to both of its nodes
+
+    Args:
+        positions:          (n, 2) node positions
+        sources:            The index of the node each edge is from
+        targets:            The index of the node each edge is to
+        attractionForce:    k
+        springLength:       The length of the spring, in pixels.
+
+    Returns:  (n, 2) attraction force on each node
+    """
+    nodeCount: int     = positions.shape[0]
+    forces:    ndarray = zeros((nodeCount, 2), dtype=float64)
+    if sources.size == 0:
+        return forces
+
+    deltas:    ndarray = positions[targets] - positions[sources]
+    distances: ndarray = hypot(deltas[:, 0], deltas[:, 1])
+    proximity: ndarray = maximum(distances, 1.0)
+    magnitude: ndarray = attractionForce * maximum(proximity - springLength, 0.0)
+    scale:     ndarray = where(distances > 0, magnitude / where(distances > 0, distances, 1.0), 0.0)
+
+    edgeForces: ndarray = deltas * scale[:, None]
+    for axis in range(2):
+        forces[:, axis] = (bincount(sources, weights=edgeForces[:, axis], minlength=nodeCount) -
+                           bincount(targets, weights=edgeForces[:, axis], minlength=nodeCount))
+
+    return forces
+
+
+def proximity(distance: float, floatPrecision: bool) -> float:
+    """
+    Args:
+        distance:       The distance between two nodes
+        floatPrecision: Keep sub-pixel distances, see `Configuration.floatPrecision`
+
+    Returns:  The distance used by the force laws;  At least 1 pixel and truncated
+    to whole pixels unless running with float precision
+    """
+    if floatPrecision is True:
+        return max(distance, 1.0)
+    else:
+        return max(int(distance), 1)
+
+
+def pairRepulsion(x: float, y: float, otherX: float, otherY: float, charge: float, floatPrecision: bool = True) -> Tuple[float, float]:
+    """
+    Coulomb's Law for a single pair:  The repulsion exerted on (x, y) by a charge at (otherX, otherY).
+    Coincident points exert no force
+
+    Args:
+        x:              The x coordinate the force is acting on
+        y:              The y coordinate the force is acting on
+        otherX:         The x coordinate of the charge
+        otherY:         The y coordinate of the charge
+        charge:         k times the number of points the charge stands for
+        floatPrecision: Whether the distance is truncated to whole pixels, see `proximity`
+
+    Returns:  The (x, y) components of the force
+    """
+    deltaX:   float = otherX - x
+    deltaY:   float = otherY - y
+    distance: float = scalarHypot(deltaX, deltaY)
+    if distance == 0:
+        return 0.0, 0.0
+
+    pairProximity: float = proximity(distance, floatPrecision)
+    # negative magnitude pushes away from the other point
+    scale: float = -(charge / (pairProximity * pairProximity)) / distance
+
+    return deltaX * scale, deltaY * scale
+
+
+def repulsionEnergy(positions: ndarray, coulombLawConstant: float) -> float:
+    """
+    The Coulomb potential, k / r, summed over every pair of distinct, non-coincident nodes
+
+    Args:
+        positions:          (n, 2) node positions
+        coulombLawConstant: k
+
+    Returns:  The repulsion energy
+    """
+    nodeCount: int   = positions.shape[0]
+    energy:    float = 0.0
+    for blockStart in range(0, nodeCount, ROW_BLOCK_SIZE):
+        blockEnd:  int     = min(blockStart + ROW_BLOCK_SIZE, nodeCount)
+        deltas:    ndarray = positions[None, :, :] - positions[blockStart:blockEnd, None, :]
+        distances: ndarray = hypot(deltas[..., 0], deltas[..., 1])
+        potential: ndarray = where(distances > 0, coulombLawConstant / maximum(distances, 1.0), 0.0)
+
+        energy += float(potential.sum())
+
+    # every pair was counted from both ends
+    return energy / 2
+
+
+def springEnergy(positions: ndarray, sources: ndarray, targets: ndarray, attractionForce: float, springLength: float) -> float:
+    """
+    The potential of the springs, k * x^2 / 2, for every edge stretched beyond the spring length
+
+    Args:
+        positions:          (n, 2) node positions
+        sources:            The index of the node each edge is from
+        targets:            The index of the node each edge is to
+        attractionForce:    k
+        springLength:       The length of the spring, in pixels.
+
+    Returns:  The spring energy
+    """
+    if sources.size == 0:
+        return 0.0
+
+    deltas:  ndarray = positions[targets] - positions[sources]
+    stretch: ndarray = maximum(maximum(hypot(deltas[:, 0], deltas[:, 1]), 1.0) - springLength, 0.0)
+
+    return float(attractionForce * (stretch * stretch).sum() / 2)
@@ -0,0 +1,35 @@
+
+from pyforcedirectedlayout.LayoutTypes import DrawingContext
+from pyforcedirectedlayout.Node import Node
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.Size import Size
+
+
+class LayoutNode(Node):
+    """
+    A node that only takes part in the layout;  It has a size but draws nothing.
+    """
+    def __init__(self, size: Size | None = None, location: Point | None = None):
+        """
+
+        Args:
+            size:       The node width and height;  Zero when omitted
+            location:   The starting location;  The origin when omitted
+        """
+        super().__init__()
+
+        self._size: Size = Size() if size is None else size
+        self.location    = Point() if location is None else Point(x=location.x, y=location.y)
+
+    @property
+    def size(self) -> Size:
+        return self._size
+
+    def drawNode(self, dc: DrawingContext):
+        pass
+
+    def __str__(self) -> str:
+        return f'LayoutNode: {self.location}'
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,173 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import prod
+
+from pathlib import Path
+
+from dataclasses import dataclass
+
+from numpy import arange
+from numpy import ascontiguousarray
+from numpy import dtype
+from numpy import fromfile
+from numpy import memmap
+from numpy import ndarray
+from numpy import uint8
+
+SNAPSHOT_MAGIC:   bytes = b'PYFDLSNP'
+SNAPSHOT_VERSION: int   = 1
+
+SNAPSHOT_HEADER: dtype = dtype([('magic', 'S8'), ('version', '<u8'), ('nodeCount', '<u8'), ('edgeCount', '<u8')])
+"""
+The fixed size header;  The arrays follow it in the order of the `LayoutSnapshot` fields
+"""
+ID_TYPE:    dtype = dtype('<i8')
+FLOAT_TYPE: dtype = dtype('<f8')
+
+
+@dataclass
+class LayoutSnapshot:
+    """
+    The state of a layout in a form that can be saved and loaded without parsing:  A 32 byte header
+    followed by the raw little endian arrays.  Every array starts on an 8 byte boundary, so a loaded
+    snapshot is a set of views onto a memory map of the file and only the pages that are read are
+    ever loaded.
+
+    Rows are in the order of the nodes of the layout.  Node ids are only unique within a process;
+    They are saved so that an application can map the rows back onto its own nodes
+    """
+    nodeIds:    ndarray
+    """
+    The id of each node
+    """
+    positions:  ndarray
+    """
+    The (n, 2) node positions
+    """
+    velocities: ndarray
+    """
+    The (n, 2) node velocities, for a warm start
+    """
+    sources:    ndarray
+    """
+    The index of the node each connection is from
+    """
+    targets:    ndarray
+    """
+    The index of the node each connection is to
+    """
+
+    @property
+    def nodeCount(self) -> int:
+        return self.nodeIds.shape[0]
+
+    @property
+    def edgeCount(self) -> int:
+        return self.sources.shape[0]
+
+    def save(self, path: Path):
+        """
+        Args:
+            path:   The file to write;  It is replaced if it exists
+        """
+        header: ndarray = ascontiguousarray([(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.nodeCount, self.edgeCount)], dtype=SNAPSHOT_HEADER)
+
+        with open(path, 'wb') as snapshotFile:
+            header.tofile(snapshotFile)
+            for section, sectionType in self._sections():
+                ascontiguousarray(section, dtype=sectionType).tofile(snapshotFile)
+
+        logger: Logger = getLogger(__name__)
+        logger.debug(f'Saved {self.nodeCount} nodes and {self.edgeCount} connections to {path}')
+
+    @classmethod
+    def create(cls, path: Path, sources: ndarray, targets: ndarray, nodeCount: int) -> 'LayoutSnapshot':
+        """
+        Creates a snapshot file for a graph that is not laid out yet and maps it for writing.  The
+        positions and velocities start zeroed on disk, none of them is held in memory
+
+        Args:
+            path:       The file to create;  It is replaced if it exists
+            sources:    The index of the node each connection is from
+            targets:    The index of the node each connection is to
+            nodeCount:  The number of nodes;  Their ids are their indices
+
+        Returns:  The writable snapshot, see `load`
+        """
+        edgeCount: int     = len(sources)
+        header:    ndarray = ascontiguousarray([(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, nodeCount, edgeCount)], dtype=SNAPSHOT_HEADER)
+
+        with open(path, 'wb') as snapshotFile:
+            header.tofile(snapshotFile)
+            snapshotFile.truncate(SNAPSHOT_HEADER.itemsize + ID_TYPE.itemsize * (nodeCount + 2 * edgeCount) + FLOAT_TYPE.itemsize * 4 * nodeCount)
+
+        layoutSnapshot: LayoutSnapshot = cls.load(path, writable=True)
+
+        layoutSnapshot.nodeIds[:] = arange(nodeCount)
+        layoutSnapshot.sources[:] = sources
+        layoutSnapshot.targets[:] = targets
+
+        return layoutSnapshot
+
+    @classmethod
+    def load(cls, path: Path, memoryMap: bool = True, writable: bool = False) -> 'LayoutSnapshot':
+        """
+        Args:
+            path:       A file written by `save`
+            memoryMap:  Map the file instead of reading it into memory
+            writable:   Map the file for writing;  Changes to the arrays go straight to the file and
+                        every process that maps it sees them.  Without it, copy an array before modifying it
+
+        Returns:  The snapshot
+        """
+        if memoryMap is True:
+            data: ndarray = memmap(path, dtype=uint8, mode='r+' if writable is True else 'r')
+        else:
+            data = fromfile(path, dtype=uint8)
+
+        if data.size < SNAPSHOT_HEADER.itemsize:
+            raise ValueError(f'{path} is too short for a layout snapshot')
+
+        header: ndarray = data[:SNAPSHOT_HEADER.itemsize].view(SNAPSHOT_HEADER)[0]
+        if header['magic'] != SNAPSHOT_MAGIC or header['version'] != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} is not a version {SNAPSHOT_VERSION} layout snapshot')
+
+        nodeCount: int = int(header['nodeCount'])
+        edgeCount: int = int(header['edgeCount'])
+
+        shapes: Tuple[Tuple[int, ...], ...] = ((nodeCount,), (nodeCount, 2), (nodeCount, 2), (edgeCount,), (edgeCount,))
+        types:  Tuple[dtype, ...]           = (ID_TYPE, FLOAT_TYPE, FLOAT_TYPE, ID_TYPE, ID_TYPE)
+
+        expectedSize: int = SNAPSHOT_HEADER.itemsize + sum(sectionType.itemsize * prod(shape) for shape, sectionType in zip(shapes, types))
+        if data.size != expectedSize:
+            raise ValueError(f'{path} should be {expectedSize} bytes long, not {data.size}')
+
+        sections: List[ndarray] = []
+        offset:   int           = SNAPSHOT_HEADER.itemsize
+        for shape, sectionType in zip(shapes, types):
+            size: int = sectionType.itemsize * prod(shape)
+            sections.append(data[offset:offset + size].view(sectionType).reshape(shape))
+            offset += size
+
+        nodeIds, positions, velocities, sources, targets = sections
+
+        return cls(nodeIds=nodeIds, positions=positions, velocities=velocities, sources=sources, targets=targets)
+
+    def flush(self):
+        """
+        Write the changes to a writable snapshot out to its file
+        """
+        for section, _ in self._sections():
+            if isinstance(section, memmap):
+                section.flush()
+
+    def _sections(self) -> Tuple[Tuple[ndarray, dtype], ...]:
+        """
+        Returns:  The arrays, in file order, with the type each is saved as
+        """
+        return ((self.nodeIds, ID_TYPE), (self.positions, FLOAT_TYPE), (self.velocities, FLOAT_TYPE), (self.sources, ID_TYPE), (self.targets, ID_TYPE))
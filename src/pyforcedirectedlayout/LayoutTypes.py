@@ -3,16 +3,59 @@ from typing import Any
 from typing import Callable
 from typing import List
 from typing import NewType
+from typing import Tuple
 from typing import TYPE_CHECKING
+from typing import cast
 
 from dataclasses import dataclass
 
+from enum import Enum
+
+from numpy import ndarray
+
 if TYPE_CHECKING:
     # noinspection PyUnresolvedReferences
     from pyforcedirectedlayout.Node import Node
 
 Nodes = NewType('Nodes', List['Node'])
 
+NodesView = NewType('NodesView', Tuple['Node', ...])
+"""
+An immutable snapshot of nodes;  The same snapshot is handed out until the nodes change
+"""
+NO_NODES_VIEW: NodesView = cast(NodesView, None)
+
+Force = NewType('Force', Tuple[float, float])
+"""
+A force, or a velocity, in Cartesian (x, y) form
+"""
+
+
+class StopReason(Enum):
+    """
+    Why the simulation stopped
+    """
+    RUNNING        = 'Running'
+    """
+    The simulation has not stopped yet
+    """
+    CONVERGED      = 'Converged'
+    """
+    Enough iterations settled for the early exit
+    """
+    MAX_ITERATIONS = 'Max Iterations'
+    """
+    The simulation ran for the maximum number of iterations
+    """
+    TIME_BUDGET    = 'Time Budget'
+    """
+    The time budget ran out
+    """
+    CANCELLED      = 'Cancelled'
+    """
+    The cancellation token was cancelled
+    """
+
 
 @dataclass
 class LayoutStatus:
@@ -20,10 +63,113 @@ class LayoutStatus:
     iterations:        int   = 0
     stopCount:         int   = 0
     maxIterations:     int   = 0
+    stepSize:          float = 0.0
+    """
+    The most a node was allowed to move in the last iteration, in pixels;  Infinite when the step is fixed
+    """
+    maxDisplacement:   float = 0.0
+    """
+    The farthest any node moved in the last iteration, in pixels
+    """
+    energy:            float = 0.0
+    """
+    The spring plus repulsion energy after the last iteration;  Only computed when needed
+    """
+    stopReason:        StopReason = StopReason.RUNNING
+
+
+@dataclass
+class LayoutFrame:
+    """
+    The layout after one iteration of `ForceDirectedLayout.arrangeSteps`
+    """
+    positions:    ndarray
+    """
+    Read only (n, 2) node positions, in the order of `ForceDirectedLayout.nodes`, before the diagram is centered
+    """
+    layoutStatus: LayoutStatus
 
 
 LayoutStatusCallback = Callable[[LayoutStatus], None]
 
+NO_STATUS_CALLBACK: LayoutStatusCallback = cast(LayoutStatusCallback, None)
+"""
+Pass this to lay out without reporting progress
+"""
+
+
+class SimulationEngine(Enum):
+    """
+    Selects how `ForceDirectedLayout.arrange` runs the simulation
+    """
+    PYTHON     = 'Python'
+    """
+    The node-by-node reference implementation
+    """
+    NUMPY      = 'NumPy'
+    """
+    Batched array operations over contiguous position, velocity and edge arrays
+    """
+    MULTILEVEL = 'Multilevel'
+    """
+    Lays out a hierarchy of coarsened graphs, coarsest first, with the array operations
+    """
+
+
+class RepulsionMode(Enum):
+    """
+    Selects how the repulsion between nodes is computed
+    """
+    ALL_PAIRS   = 'All Pairs'
+    """
+    Every node is compared to every other node
+    """
+    BARNES_HUT  = 'Barnes-Hut'
+    """
+    Distant clusters of nodes are approximated by their center of mass
+    """
+    CUTOFF_GRID = 'Cutoff Grid'
+    """
+    Only nodes within the cutoff radius repel each other;  Found with a uniform hash grid
+    """
+
+
+class StopCriterion(Enum):
+    """
+    Selects which iterations count toward the early exit
+    """
+    TOTAL_DISPLACEMENT = 'Total Displacement'
+    """
+    The summed node displacement is below an absolute threshold
+    """
+    MAX_DISPLACEMENT   = 'Max Displacement'
+    """
+    No node moved more than a fraction of the spring length
+    """
+    ENERGY             = 'Energy'
+    """
+    The relative change in system energy is below a threshold
+    """
+
+
+class StepControl(Enum):
+    """
+    Selects how far a node may move in one iteration
+    """
+    FIXED    = 'Fixed'
+    """
+    Only the damping slows the nodes down
+    """
+    COOLING  = 'Cooling'
+    """
+    The step size shrinks geometrically every iteration
+    """
+    ADAPTIVE = 'Adaptive'
+    """
+    The step size shrinks when the energy rises and grows while it keeps dropping
+    """
+
+
 DrawingContext = Any
 """
 Purposely set to Any to avoid tying to a particular toolkit
@@ -0,0 +1,251 @@
+
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from numpy import bincount
+from numpy import array
+from numpy import int64
+from numpy import maximum
+from numpy import minimum
+from numpy import ndarray
+from numpy import stack
+from numpy import unique
+
+from numpy.random import Generator
+from numpy.random import default_rng
+
+from pyforcedirectedlayout.ArraySimulation import ArraySimulation
+from pyforcedirectedlayout.ArraySimulation import NO_VELOCITIES
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import LayoutStatusCallback
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NodesView
+from pyforcedirectedlayout.StopSignal import StopSignal
+from pyforcedirectedlayout.StopSignal import UNLIMITED
+
+MINIMUM_REDUCTION: float = 0.95
+"""
+Stop coarsening once a level keeps more than this fraction of the nodes of the level below it
+"""
+INTERPOLATION_JITTER: float = 0.1
+"""
+Nodes that were merged start this fraction of the spring length apart so that they can separate
+"""
+
+UNMATCHED: int = -1
+
+
+@dataclass
+class Level:
+    """
+    One level of the graph hierarchy
+    """
+    nodeCount: int
+    sources:   ndarray
+    targets:   ndarray
+    parents:   ndarray
+    """
+    The node of this level that each node of the next finer level was merged into
+    """
+
+
+def coarsen(nodeCount: int, sources: ndarray, targets: ndarray, generator: Generator) -> Tuple[int, ndarray, ndarray, ndarray]:
+    """
+    Halve a graph by matching the ends of randomly ordered edges, then collapse each unmatched
+    node into a neighbor so that stars and other hubs shrink as well
+
+    Args:
+        nodeCount:  The number of nodes in the graph
+        sources:    The index of the node each edge is from
+        targets:    The index of the node each edge is to
+        generator:  The random order of the edges
+
+    Returns:  The number of coarse nodes, the coarse node of each node and the coarse edges
+    """
+    sourceList: List[int] = sources.tolist()
+    targetList: List[int] = targets.tolist()
+
+    partner: List[int] = [UNMATCHED] * nodeCount
+    for edge in generator.permutation(len(sourceList)).tolist():
+        source: int = sourceList[edge]
+        target: int = targetList[edge]
+        if source != target and partner[source] == UNMATCHED and partner[target] == UNMATCHED:
+            partner[source] = target
+            partner[target] = source
+
+    # every matched pair, and every unmatched node, becomes a coarse node
+    parents:     List[int] = [UNMATCHED] * nodeCount
+    coarseCount: int       = 0
+    for node in range(nodeCount):
+        if parents[node] == UNMATCHED and partner[node] != UNMATCHED:
+            parents[node]          = coarseCount
+            parents[partner[node]] = coarseCount
+            coarseCount += 1
+
+    for source, target in zip(sourceList, targetList):
+        if partner[source] == UNMATCHED and parents[source] == UNMATCHED and parents[target] != UNMATCHED:
+            parents[source] = parents[target]
+        elif partner[target] == UNMATCHED and parents[target] == UNMATCHED and parents[source] != UNMATCHED:
+            parents[target] = parents[source]
+
+    for node in range(nodeCount):
+        if parents[node] == UNMATCHED:
+            parents[node] = coarseCount
+            coarseCount += 1
+
+    parentArray: ndarray = array(parents, dtype=int64)
+
+    coarseSources, coarseTargets = _coarseEdges(parents=parentArray, sources=sources, targets=targets)
+
+    return coarseCount, parentArray, coarseSources, coarseTargets
+
+
+def _coarseEdges(parents: ndarray, sources: ndarray, targets: ndarray) -> Tuple[ndarray, ndarray]:
+    """
+    Map the edges onto the coarse nodes, dropping the ones inside a coarse node and the duplicates
+    """
+    if sources.size == 0:
+        return sources, targets
+
+    coarseSources: ndarray = parents[sources]
+    coarseTargets: ndarray = parents[targets]
+    between:       ndarray = coarseSources != coarseTargets
+
+    pairs: ndarray = unique(stack([minimum(coarseSources[between], coarseTargets[between]),
+                                   maximum(coarseSources[between], coarseTargets[between])], axis=1).reshape(-1, 2), axis=0)
+
+    return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+
+class MultilevelSimulation:
+    """
+    Lays out large diagrams through a hierarchy of ever coarser graphs.  The connections are
+    coarsened by matching and collapsing until the graph has at most `Configuration.coarsestSize`
+    nodes or stops shrinking.  The coarsest graph is laid out from the nodes' starting locations;
+    Each finer level then starts with its nodes at the location of the node they were merged into
+    and is refined for `Configuration.refinementIterations` iterations.
+
+    A warm start, one given the velocities of a previous layout, keeps that layout:  It skips the
+    hierarchy and only runs the diagram itself, like the array engine.
+
+    Every level uses the forces of the array engine.
+    """
+    def __init__(self, nodes: Nodes | NodesView, seed: int | None = None, velocities: ndarray = NO_VELOCITIES, workerCount: int = 0):
+        """
+
+        Args:
+            nodes:          The nodes to lay out;  Their current locations are the starting positions
+            seed:           Seeds the edge order and the interpolation jitter
+            velocities:     The (n, 2) velocities of a warm start;  The hierarchy is skipped when given
+            workerCount:    The number of processes every level spreads the repulsion across;  0 uses `Configuration.workerCount`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._configuration: Configuration   = Configuration()
+        self._finest:        ArraySimulation = ArraySimulation(nodes=nodes, velocities=velocities, workerCount=workerCount)
+        self._workerCount:   int             = workerCount
+        self._generator:     Generator       = default_rng(seed)
+        self._warmStart:     bool            = velocities is not NO_VELOCITIES
+
+    @property
+    def velocities(self) -> ndarray:
+        """
+        Returns:  The (n, 2) array of current velocities of the diagram nodes
+        """
+        return self._finest.velocities
+
+    def run(self, statusCallback: LayoutStatusCallback = NO_STATUS_CALLBACK, stopSignal: StopSignal = UNLIMITED) -> LayoutStatus:
+        """
+        Args:
+            statusCallback:  Reports the iterations of the finest level
+            stopSignal:      Shared by every level;  Once it stops, the remaining levels run a single iteration
+
+        Returns:  The status at the end of the finest level
+        """
+        if self._warmStart is True:
+            return self._finest.run(statusCallback=statusCallback, stopSignal=stopSignal)
+
+        levels: List[Level] = self._buildHierarchy()
+        if len(levels) == 0:
+            return self._finest.run(statusCallback=statusCallback, stopSignal=stopSignal)
+
+        coarsest: ArraySimulation = ArraySimulation.fromArrays(positions=self._coarsestPositions(levels),
+                                                               sources=levels[-1].sources, targets=levels[-1].targets, workerCount=self._workerCount)
+        coarsest.run(stopSignal=stopSignal)
+
+        positions: ndarray = coarsest.positions
+
+        refinementIterations: int = self._configuration.refinementIterations
+        for index in range(len(levels) - 1, 0, -1):
+            finer:   Level           = levels[index - 1]
+            refined: ArraySimulation = ArraySimulation.fromArrays(positions=self._interpolate(positions, levels[index].parents),
+                                                                  sources=finer.sources, targets=finer.targets, workerCount=self._workerCount)
+            refined.run(maxIterations=refinementIterations, stopSignal=stopSignal)
+            positions = refined.positions
+            self.logger.debug(f'Refined a level of {finer.nodeCount} nodes')
+
+        self._finest.positions = self._interpolate(positions, levels[0].parents)
+
+        return self._finest.run(statusCallback=statusCallback, maxIterations=refinementIterations, stopSignal=stopSignal)
+
+    def _buildHierarchy(self) -> List[Level]:
+        """
+        Returns:  The coarse levels, finest first;  Empty when the diagram is already small enough
+        """
+        coarsestSize: int = self._configuration.coarsestSize
+
+        nodeCount: int     = self._finest.positions.shape[0]
+        sources:   ndarray = self._finest.sources
+        targets:   ndarray = self._finest.targets
+
+        levels: List[Level] = []
+        while nodeCount > coarsestSize:
+            coarseCount, parents, coarseSources, coarseTargets = coarsen(nodeCount=nodeCount, sources=sources, targets=targets, generator=self._generator)
+            if coarseCount > nodeCount * MINIMUM_REDUCTION:
+                break
+            levels.append(Level(nodeCount=coarseCount, sources=coarseSources, targets=coarseTargets, parents=parents))
+            self.logger.debug(f'Coarsened {nodeCount} nodes to {coarseCount}')
+
+            nodeCount = coarseCount
+            sources   = coarseSources
+            targets   = coarseTargets
+
+        return levels
+
+    def _coarsestPositions(self, levels: List[Level]) -> ndarray:
+        """
+        Place each coarse node at the mean starting location of the nodes merged into it
+
+        Args:
+            levels:  The coarse levels, finest first
+
+        Returns:  The starting positions of the coarsest level
+        """
+        positions: ndarray = self._finest.positions
+        for level in levels:
+            counts:  ndarray = maximum(bincount(level.parents, minlength=level.nodeCount), 1)
+            summedX: ndarray = bincount(level.parents, weights=positions[:, 0], minlength=level.nodeCount)
+            summedY: ndarray = bincount(level.parents, weights=positions[:, 1], minlength=level.nodeCount)
+
+            positions = stack([summedX / counts, summedY / counts], axis=1)
+
+        return positions
+
+    def _interpolate(self, coarsePositions: ndarray, parents: ndarray) -> ndarray:
+        """
+        Args:
+            coarsePositions:    The positions of the coarse nodes
+            parents:            The coarse node that each fine node was merged into
+
+        Returns:  The fine positions;  Each node starts next to the node it was merged into
+        """
+        jitter: float = self._configuration.springLength * INTERPOLATION_JITTER
+
+        return coarsePositions[parents] + self._generator.uniform(-jitter, jitter, size=(parents.size, 2))
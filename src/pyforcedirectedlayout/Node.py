@@ -1,4 +1,6 @@
 
+from typing import Dict
+from typing import Iterator
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -9,6 +11,8 @@ from logging import getLogger
 from abc import ABC
 from abc import abstractmethod
 
+from itertools import count
+
 from pyforcedirectedlayout.LayoutTypes import DrawingContext
 
 from pyforcedirectedlayout.Point import Point
@@ -17,21 +21,38 @@ from pyforcedirectedlayout.Size import Size
 if TYPE_CHECKING:
     from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
 
-from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NO_NODES_VIEW
+from pyforcedirectedlayout.LayoutTypes import NodesView
 
 
 class Node(ABC):
     """
     I hate cyclical dependencies
     Node is the base class for a node on a diagram.
+
+    Nodes are identified by their `nodeId`, not by their location, and hash by it, so they
+    can be kept in sets and dictionaries.  The connections are kept in insertion order in a
+    dictionary so that connecting and disconnecting do not scan them.  Subclasses that
+    override `__eq__` must override `__hash__` to match.
     """
+    _nodeIds: Iterator[int] = count(1)
+
+    nodeLogger: Logger = getLogger(__name__)
+
     def __init__(self):
 
-        self.nodeLogger: Logger = getLogger(__name__)
+        self._nodeId:          int                   = next(Node._nodeIds)
+        self._layoutEngine:    'ForceDirectedLayout' = cast('ForceDirectedLayout', None)
+        self._connections:     Dict['Node', None]    = {}
+        self._connectionsView: NodesView             = NO_NODES_VIEW      # built on the first read after a change
+        self._location:        Point                 = Point()
 
-        self._layoutEngine: 'ForceDirectedLayout' = cast('ForceDirectedLayout', None)
-        self._connections:  Nodes     = Nodes([])
-        self._location:     Point     = Point()
+    @property
+    def nodeId(self) -> int:
+        """
+        Returns:  A number unique to this node for the life of the process
+        """
+        return self._nodeId
 
     @property
     @abstractmethod
@@ -53,7 +74,7 @@ class Node(ABC):
             sourcePoint:        Source coordinate
             destinationPoint:   Destination coordinate.
         """
-        dc.DrawLine(x1=sourcePoint.x, y1=sourcePoint.y, x2=destinationPoint.x, y2=destinationPoint.y)
+        dc.DrawLine(x1=round(sourcePoint.x), y1=round(sourcePoint.y), x2=round(destinationPoint.x), y2=round(destinationPoint.y))
 
     @abstractmethod
     def drawNode(self, dc: DrawingContext):
@@ -73,19 +94,19 @@ class Node(ABC):
         self._location = point
 
     @property
-    def x(self) -> int:
+    def x(self) -> float:
         return self._location.x
 
     @x.setter
-    def x(self, x: int):
+    def x(self, x: float):
         self._location.x = x
 
     @property
-    def y(self) -> int:
+    def y(self) -> float:
         return self._location.y
 
     @y.setter
-    def y(self, y: int):
+    def y(self, y: float):
         self._location.y = y
 
     @property
@@ -94,21 +115,28 @@ class Node(ABC):
 
     @layoutEngine.setter
     def layoutEngine(self, layoutEngine: 'ForceDirectedLayout'):
-
+        """
+        Adds the node to the layout engine; None detaches it, as `ForceDirectedLayout.removeNode` does
+        """
         if layoutEngine == self._layoutEngine:
             pass
+        elif layoutEngine is None:
+            self._layoutEngine = layoutEngine
         else:
-            if layoutEngine is not None:
-                self._layoutEngine = layoutEngine
-                self._layoutEngine.addNode(self)
+            self._layoutEngine = layoutEngine
+            self._layoutEngine.addNode(self)
 
     @property
-    def connections(self) -> Nodes:
+    def connections(self) -> NodesView:
         """
+        Repeated reads return the same tuple until the connections change
 
         Returns:  a read-only collection representing the (child) nodes that this node is connected to
         """
-        return Nodes(self._connections[:])
+        if self._connectionsView is NO_NODES_VIEW:
+            self._connectionsView = NodesView(tuple(self._connections))
+
+        return self._connectionsView
 
     def addChild(self, child: 'Node') -> bool:
         """
@@ -123,7 +151,10 @@ class Node(ABC):
 
         if child != self and child not in self._connections:
             child.layoutEngine = self.layoutEngine
-            self._connections.append(child)
+            self._connections[child] = None
+            self._connectionsView    = NO_NODES_VIEW
+            if self._layoutEngine is not None:
+                self._layoutEngine.connectionAdded(parent=self, child=child)
             return True
         else:
             return False
@@ -154,13 +185,19 @@ class Node(ABC):
         selfFailed:  bool = False
         otherFailed: bool = False
         try:
-            self._connections.remove(other)
-        except ValueError:
+            del self._connections[other]
+            self._connectionsView = NO_NODES_VIEW
+            if self._layoutEngine is not None:
+                self._layoutEngine.connectionRemoved(parent=self, child=other)
+        except KeyError:
             selfFailed = True
 
         try:
-            other.connections.remove(self)
-        except ValueError:
+            del other._connections[self]
+            other._connectionsView = NO_NODES_VIEW
+            if other._layoutEngine is not None:
+                other._layoutEngine.connectionRemoved(parent=other, child=self)
+        except KeyError:
             otherFailed = True
 
         if selfFailed or otherFailed:
@@ -170,8 +207,10 @@ class Node(ABC):
 
     def __eq__(self, other) -> bool:
 
-        ans: bool = False
-        if self.x == other.x and self.y == other .y and self.location == other.location:
-            ans = True
+        if isinstance(other, Node) is False:
+            return False
+
+        return self._nodeId == other._nodeId
 
-        return ans
+    def __hash__(self) -> int:
+        return hash(self._nodeId)
@@ -9,7 +9,7 @@ from pyforcedirectedlayout.Point import Point
 from pyforcedirectedlayout.Vector import Vector
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeLayoutInformation:
     """
     Tracks the mechanical properties (velocity, future coordinates) of each node during the
@@ -20,14 +20,29 @@ class NodeLayoutInformation:
     """
     reference to the node in the simulation
     """
-    velocity:     Vector
-    """
-    the node's current velocity, expressed in vector form
-    """
     nextPosition: Point
     """
     the node's position after the next iteration
     """
+    velocityX:    float = 0.0
+    """
+    the x component of the node's current velocity
+    """
+    velocityY:    float = 0.0
+    """
+    the y component of the node's current velocity
+    """
+
+    @property
+    def velocity(self) -> Vector:
+        """
+        Returns:  The node's current velocity, expressed in vector form
+        """
+        return Vector.fromCartesian(x=self.velocityX, y=self.velocityY)
+
+    @velocity.setter
+    def velocity(self, velocity: Vector):
+        self.velocityX, self.velocityY = velocity.toCartesian()
 
 
 NodeLayoutInformationList = NewType('NodeLayoutInformationList', List[NodeLayoutInformation])
@@ -0,0 +1,49 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from math import sqrt
+
+Extents = NewType('Extents', List[Tuple[float, float]])
+"""
+The (width, height) of each rectangle to pack
+"""
+Offsets = NewType('Offsets', List[Tuple[float, float]])
+"""
+The (x, y) of the upper-left corner of each packed rectangle
+"""
+
+
+def shelfPack(extents: Extents, gap: float) -> Offsets:
+    """
+    Pack rectangles onto horizontal shelves, tallest first.  The shelf width is chosen so that
+    the packed result is roughly square
+
+    Args:
+        extents:    The size of each rectangle
+        gap:        The space to leave between rectangles
+
+    Returns:  The position of each rectangle, in the same order as `extents`
+    """
+    offsets: Offsets = Offsets([(0.0, 0.0)] * len(extents))
+    if len(extents) == 0:
+        return offsets
+
+    area:       float = sum((width + gap) * (height + gap) for width, height in extents)
+    shelfWidth: float = max(sqrt(area), max(width for width, _ in extents))
+
+    x:           float = 0.0
+    y:           float = 0.0
+    shelfHeight: float = 0.0
+    for index in sorted(range(len(extents)), key=lambda i: extents[i][1], reverse=True):
+        width, height = extents[index]
+        if x > 0 and x + width > shelfWidth:
+            y += shelfHeight + gap
+            x = 0.0
+            shelfHeight = 0.0
+        offsets[index] = (x, y)
+        x += width + gap
+        shelfHeight = max(shelfHeight, height)
+
+    return offsets
@@ -0,0 +1,146 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+
+from multiprocessing.shared_memory import SharedMemory
+
+from numpy import float64
+from numpy import ndarray
+
+from pyforcedirectedlayout.ForceKernels import repulsionForRows
+
+NO_SHARED_MEMORY: SharedMemory = cast(SharedMemory, None)
+NO_ARRAY:         ndarray      = cast(ndarray, None)
+
+#
+# Each worker process attaches to the shared buffers once, when it starts
+#
+_workerPositionsMemory: SharedMemory = NO_SHARED_MEMORY
+_workerForcesMemory:    SharedMemory = NO_SHARED_MEMORY
+_workerPositions:       ndarray      = NO_ARRAY
+_workerForces:          ndarray      = NO_ARRAY
+_workerCoulombLawConstant: float     = 0.0
+
+
+def _attachWorker(positionsName: str, forcesName: str, nodeCount: int, coulombLawConstant: float):
+    """
+    Worker process initializer;  Maps the shared position and force buffers
+
+    Args:
+        positionsName:      Name of the shared position buffer
+        forcesName:         Name of the shared force buffer
+        nodeCount:          The number of nodes in the buffers
+        coulombLawConstant: k
+    """
+    global _workerPositionsMemory, _workerForcesMemory, _workerPositions, _workerForces, _workerCoulombLawConstant
+
+    _workerPositionsMemory = SharedMemory(name=positionsName)
+    _workerForcesMemory    = SharedMemory(name=forcesName)
+
+    _workerPositions = ndarray((nodeCount, 2), dtype=float64, buffer=_workerPositionsMemory.buf)
+    _workerForces    = ndarray((nodeCount, 2), dtype=float64, buffer=_workerForcesMemory.buf)
+
+    _workerCoulombLawConstant = coulombLawConstant
+
+
+def _computeRows(start: int, end: int):
+    """
+    Compute the repulsion on the nodes in rows [start, end) and write it to the shared force buffer.
+    Each worker writes a disjoint slice so no locking is needed
+
+    Args:
+        start:  The first row
+        end:    One past the last row
+    """
+    _workerForces[start:end] = repulsionForRows(positions=_workerPositions, start=start, end=end, coulombLawConstant=_workerCoulombLawConstant)
+
+
+class ParallelRepulsion:
+    """
+    Spreads the O(n^2) repulsion computation across a pool of worker processes.
+
+    The positions and the resulting forces live in shared memory, so each iteration only copies
+    the current positions in and the forces out;  The workers each compute a contiguous slice
+    of rows against the full position snapshot.  Use it as a context manager so that the
+    worker processes and the shared memory are released.
+    """
+    def __init__(self, nodeCount: int, workerCount: int, coulombLawConstant: float):
+        """
+
+        Args:
+            nodeCount:          The number of nodes in the simulation
+            workerCount:        The number of worker processes
+            coulombLawConstant: k
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._nodeCount:          int   = nodeCount
+        self._workerCount:        int   = workerCount
+        self._coulombLawConstant: float = coulombLawConstant
+
+        self._positionsMemory: SharedMemory = NO_SHARED_MEMORY
+        self._forcesMemory:    SharedMemory = NO_SHARED_MEMORY
+        self._positions:       ndarray      = NO_ARRAY
+        self._forces:          ndarray      = NO_ARRAY
+
+        self._executor: ProcessPoolExecutor = cast(ProcessPoolExecutor, None)
+
+        rowsPerWorker: int = -(-nodeCount // workerCount)
+
+        self._slices: List[range] = [range(start, min(start + rowsPerWorker, nodeCount)) for start in range(0, nodeCount, rowsPerWorker)]
+
+    def __enter__(self) -> 'ParallelRepulsion':
+
+        size: int = max(self._nodeCount * 2 * float64().itemsize, 1)
+
+        self._positionsMemory = SharedMemory(create=True, size=size)
+        self._forcesMemory    = SharedMemory(create=True, size=size)
+
+        self._positions = ndarray((self._nodeCount, 2), dtype=float64, buffer=self._positionsMemory.buf)
+        self._forces    = ndarray((self._nodeCount, 2), dtype=float64, buffer=self._forcesMemory.buf)
+
+        self._executor = ProcessPoolExecutor(max_workers=self._workerCount,
+                                             initializer=_attachWorker,
+                                             initargs=(self._positionsMemory.name, self._forcesMemory.name, self._nodeCount, self._coulombLawConstant)
+                                             )
+        self.logger.debug(f'Started {self._workerCount} repulsion workers for {self._nodeCount} nodes')
+
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+
+        self._executor.shutdown(wait=True)
+
+        # release the views before closing the buffers they point into
+        self._positions = NO_ARRAY
+        self._forces    = NO_ARRAY
+
+        for memory in (self._positionsMemory, self._forcesMemory):
+            memory.close()
+            memory.unlink()
+
+        self._positionsMemory = NO_SHARED_MEMORY
+        self._forcesMemory    = NO_SHARED_MEMORY
+
+    def computeForces(self, positions: ndarray) -> ndarray:
+        """
+        Args:
+            positions:  (n, 2) node positions
+
+        Returns:  (n, 2) repulsion force on each node
+        """
+        self._positions[:] = positions
+
+        futures: List[Future] = [self._executor.submit(_computeRows, rows.start, rows.stop) for rows in self._slices]
+        wait(futures)
+        for future in futures:
+            future.result()     # surface any worker failure
+
+        return self._forces.copy()
@@ -6,11 +6,11 @@ NO_X_COORDINATE: int = 0
 NO_Y_COORDINATE: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
 
-    x: int = NO_X_COORDINATE
-    y: int = NO_Y_COORDINATE
+    x: float = NO_X_COORDINATE
+    y: float = NO_Y_COORDINATE
 
     def noCoordinates(self) -> bool:
         """
@@ -25,11 +25,19 @@ class Point:
 
     def __sub__(self, other) -> 'Point':
 
-        newX: int = abs(self.x - other.x)
-        newY: int = abs(self.y - other.y)
+        newX: float = abs(self.x - other.x)
+        newY: float = abs(self.y - other.y)
 
         return Point(x=newX, y=newY)
 
+    def rounded(self) -> 'Point':
+        """
+        Coordinates are floats when the layout runs with float precision
+
+        Returns:  A new point with both coordinates rounded to the nearest integer
+        """
+        return Point(x=round(self.x), y=round(self.y))
+
     @classmethod
     def deSerialize(cls, value: str) -> 'Point':
 
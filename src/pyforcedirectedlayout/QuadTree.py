@@ -0,0 +1,166 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+from typing import cast
+
+from math import hypot
+
+from pyforcedirectedlayout.ForceKernels import pairRepulsion
+from pyforcedirectedlayout.LayoutTypes import Force
+
+MAXIMUM_DEPTH: int = 32
+"""
+Stops subdividing so that coincident points end up sharing a leaf instead of recursing forever
+"""
+
+Coordinates = NewType('Coordinates', List[Tuple[float, float]])
+
+
+class QuadTreeCell:
+    """
+    A square region of the quadtree.  Tracks the number of points (the mass) inside of it and
+    their center of mass.  Leaf cells also keep the indices of their points.
+    """
+    def __init__(self, left: float, top: float, size: float):
+
+        self.left:  float = left
+        self.top:   float = top
+        self.size:  float = size
+
+        self.mass:          int   = 0
+        self.centerOfMassX: float = 0.0
+        self.centerOfMassY: float = 0.0
+
+        self.indices:  List[int]               = []
+        self.children: List['QuadTreeCell']    = cast(List['QuadTreeCell'], None)
+
+    @property
+    def isLeaf(self) -> bool:
+        return self.children is None
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.left <= x <= self.left + self.size and self.top <= y <= self.top + self.size
+
+
+class QuadTree:
+    """
+    Barnes-Hut approximation of the Coulomb repulsion between all the points of a diagram.
+
+    The tree is built once over a snapshot of the point locations.  A cell that is far away, relative
+    to its size, is treated as a single point carrying the mass of every point inside it.  This reduces
+    the repulsion for a single point from O(n) to O(log n).
+    """
+    def __init__(self, coordinates: Coordinates):
+        """
+
+        Args:
+            coordinates:  The (x, y) location of every point
+        """
+        self._coordinates: Coordinates  = coordinates
+        self._root:        QuadTreeCell = self._build()
+
+    @property
+    def root(self) -> QuadTreeCell:
+        return self._root
+
+    def repulsionAt(self, x: float, y: float, coulombLawConstant: float, theta: float, floatPrecision: bool = True) -> Force:
+        """
+        Calculates the net repulsion force exerted by every point in the tree on the specified location.
+        Points that coincide with the location exert no force.
+
+        Coulomb's Law: F = k(Qq/r^2)
+
+        Args:
+            x:                  The x coordinate the force is acting on
+            y:                  The y coordinate the force is acting on
+            coulombLawConstant: k
+            theta:              The opening angle;  A cell is approximated when size / distance < theta.
+                                0 reproduces the exact all-pairs result
+            floatPrecision:     Whether distances are truncated to whole pixels, like the all-pairs repulsion
+
+        Returns:  The (x, y) components of the repulsion force
+        """
+        coordinates: Coordinates = self._coordinates
+
+        forceX: float = 0.0
+        forceY: float = 0.0
+
+        stack: List[QuadTreeCell] = [self._root]
+        while stack:
+            cell: QuadTreeCell = stack.pop()
+            if cell.mass == 0:
+                continue
+            if cell.isLeaf is True:
+                for index in cell.indices:
+                    otherX, otherY = coordinates[index]
+                    fX, fY = pairRepulsion(x, y, otherX, otherY, coulombLawConstant, floatPrecision)
+                    forceX += fX
+                    forceY += fY
+            else:
+                distance: float = hypot(cell.centerOfMassX - x, cell.centerOfMassY - y)
+                if distance > 0 and cell.contains(x, y) is False and (cell.size / distance) < theta:
+                    fX, fY = pairRepulsion(x, y, cell.centerOfMassX, cell.centerOfMassY, coulombLawConstant * cell.mass, floatPrecision)
+                    forceX += fX
+                    forceY += fY
+                else:
+                    stack.extend(cell.children)
+
+        return Force((forceX, forceY))
+
+    def _build(self) -> QuadTreeCell:
+        """
+        Returns:  The root cell;  A square that covers every point
+        """
+        coordinates: Coordinates = self._coordinates
+        if len(coordinates) == 0:
+            return QuadTreeCell(left=0.0, top=0.0, size=0.0)
+
+        minX: float = min(c[0] for c in coordinates)
+        maxX: float = max(c[0] for c in coordinates)
+        minY: float = min(c[1] for c in coordinates)
+        maxY: float = max(c[1] for c in coordinates)
+
+        root: QuadTreeCell = QuadTreeCell(left=minX, top=minY, size=max(maxX - minX, maxY - minY, 1.0))
+        self._subdivide(cell=root, indices=list(range(len(coordinates))), depth=0)
+
+        return root
+
+    def _subdivide(self, cell: QuadTreeCell, indices: List[int], depth: int):
+        """
+        Compute the cell's mass and center of mass and then distribute its points to its quadrants
+
+        Args:
+            cell:       The cell to fill
+            indices:    The points that fall in this cell
+            depth:      How far down the tree this cell is
+        """
+        coordinates: Coordinates = self._coordinates
+
+        cell.mass          = len(indices)
+        cell.centerOfMassX = sum(coordinates[i][0] for i in indices) / cell.mass
+        cell.centerOfMassY = sum(coordinates[i][1] for i in indices) / cell.mass
+
+        if cell.mass == 1 or depth >= MAXIMUM_DEPTH:
+            cell.indices = indices
+            return
+
+        half:    float = cell.size / 2
+        middleX: float = cell.left + half
+        middleY: float = cell.top + half
+
+        quadrants: List[List[int]] = [[], [], [], []]
+        for i in indices:
+            x, y = coordinates[i]
+            quadrant: int = (1 if x >= middleX else 0) + (2 if y >= middleY else 0)
+            quadrants[quadrant].append(i)
+
+        cell.children = [
+            QuadTreeCell(left=cell.left, top=cell.top,  size=half),
+            QuadTreeCell(left=middleX,   top=cell.top,  size=half),
+            QuadTreeCell(left=cell.left, top=middleY,   size=half),
+            QuadTreeCell(left=middleX,   top=middleY,   size=half),
+        ]
+        for child, childIndices in zip(cell.children, quadrants):
+            if len(childIndices) > 0:
+                self._subdivide(cell=child, indices=childIndices, depth=depth + 1)
@@ -1,7 +1,4 @@
 
-from logging import Logger
-from logging import getLogger
-
 
 class Rectangle:
     """
@@ -12,6 +9,8 @@ class Rectangle:
     Stores a set of four integers that represent the location and size of a rectangle.
 
     """
+    __slots__ = ('_x', '_y', '_width', '_height')
+
     def __init__(self, x: int, y: int, width: int, height: int):
         """
         Initializes a new instance of the Rectangle class with the specified location and size.
@@ -22,9 +21,6 @@ class Rectangle:
             width:  The width of the rectangle.
             height: The height of the rectangle.
         """
-
-        self.logger: Logger = getLogger(__name__)
-
         self._x: int = x
         self._y: int = y
 
@@ -0,0 +1,79 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from math import floor
+
+from pyforcedirectedlayout.ForceKernels import pairRepulsion
+from pyforcedirectedlayout.LayoutTypes import Force
+from pyforcedirectedlayout.QuadTree import Coordinates
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    A uniform hash grid over a snapshot of the point locations, for repulsion with a cutoff radius.
+
+    The cells are as wide as the cutoff radius, so every point within the radius of a location is
+    in the location's cell or one of the eight cells around it.  Points further away exert no force.
+    On spread-out diagrams this reduces the repulsion for a single point from O(n) to the number of
+    points in its neighborhood.
+    """
+    def __init__(self, coordinates: Coordinates, cutoffRadius: float):
+        """
+
+        Args:
+            coordinates:    The (x, y) location of every point
+            cutoffRadius:   Points further apart than this do not repel each other
+        """
+        self._coordinates:  Coordinates = coordinates
+        self._cutoffRadius: float       = max(cutoffRadius, 1.0)
+
+        self._cells: Dict[Cell, List[int]] = {}
+        for index, (x, y) in enumerate(coordinates):
+            self._cells.setdefault(self._cellOf(x, y), []).append(index)
+
+    @property
+    def cellCount(self) -> int:
+        """
+        Returns:  The number of cells that hold at least one point
+        """
+        return len(self._cells)
+
+    def repulsionAt(self, x: float, y: float, coulombLawConstant: float, floatPrecision: bool = True) -> Force:
+        """
+        Calculates the net repulsion force exerted on the specified location by every point within
+        the cutoff radius.  Points that coincide with the location exert no force.
+
+        Coulomb's Law: F = k(Qq/r^2)
+
+        Args:
+            x:                  The x coordinate the force is acting on
+            y:                  The y coordinate the force is acting on
+            coulombLawConstant: k
+            floatPrecision:     Whether distances are truncated to whole pixels, like the all-pairs repulsion
+
+        Returns:  The (x, y) components of the repulsion force
+        """
+        coordinates:   Coordinates = self._coordinates
+        radiusSquared: float       = self._cutoffRadius * self._cutoffRadius
+
+        forceX: float = 0.0
+        forceY: float = 0.0
+
+        column, row = self._cellOf(x, y)
+        for neighborColumn in (column - 1, column, column + 1):
+            for neighborRow in (row - 1, row, row + 1):
+                for index in self._cells.get((neighborColumn, neighborRow), []):
+                    otherX, otherY = coordinates[index]
+                    if (otherX - x) ** 2 + (otherY - y) ** 2 <= radiusSquared:
+                        fX, fY = pairRepulsion(x, y, otherX, otherY, coulombLawConstant, floatPrecision)
+                        forceX += fX
+                        forceY += fY
+
+        return Force((forceX, forceY))
+
+    def _cellOf(self, x: float, y: float) -> Cell:
+        return floor(x / self._cutoffRadius), floor(y / self._cutoffRadius)
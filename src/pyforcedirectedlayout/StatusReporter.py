@@ -0,0 +1,54 @@
+
+from time import perf_counter
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import LayoutStatusCallback
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+
+
+class StatusReporter:
+    """
+    Throttles the status callback.  An iteration is reported when it is a multiple of
+    `Configuration.statusInterval` and at least `Configuration.statusPeriod` milliseconds have passed
+    since the last report.  The engines only bring the node locations up to date for the
+    iterations that are reported, so nothing is spent on progress that is not reported.
+    """
+    def __init__(self, statusCallback: LayoutStatusCallback):
+        """
+
+        Args:
+            statusCallback:  Called with the status of the reported iterations;  `NO_STATUS_CALLBACK` reports none
+        """
+        configuration: Configuration = Configuration()
+
+        self._statusCallback: LayoutStatusCallback = statusCallback
+        self._interval:       int                  = max(configuration.statusInterval, 1)
+        self._period:         float                = configuration.statusPeriod / 1000.0
+
+        self._lastReport: float = perf_counter()
+
+    def isDue(self, iterations: int) -> bool:
+        """
+        Args:
+            iterations:  The number of iterations so far
+
+        Returns:  True when this iteration should be reported
+        """
+        if self._statusCallback is NO_STATUS_CALLBACK or iterations % self._interval != 0:
+            return False
+        if self._period > 0.0 and perf_counter() - self._lastReport < self._period:
+            return False
+
+        return True
+
+    def report(self, layoutStatus: LayoutStatus):
+        """
+        Call the status callback, if any
+
+        Args:
+            layoutStatus:  The status to report
+        """
+        if self._statusCallback is not NO_STATUS_CALLBACK:
+            self._lastReport = perf_counter()
+            self._statusCallback(layoutStatus)
@@ -0,0 +1,110 @@
+
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import hypot
+from math import inf
+
+from numpy import hypot as arrayHypot
+from numpy import minimum
+from numpy import ndarray
+from numpy import where
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import StepControl
+
+ADAPTIVE_STEP_RATIO: float = 0.9
+"""
+The adaptive step shrinks by this ratio when the energy rises and grows by its inverse
+"""
+ADAPTIVE_PROGRESS_COUNT: int = 5
+"""
+The adaptive step only grows after the energy has dropped this many iterations in a row
+"""
+
+
+class StepController:
+    """
+    Limits how far a node may move in one iteration.  The limit is the step size, in pixels:
+
+    * Fixed:     No limit, the velocity is only slowed by `Configuration.damping`
+    * Cooling:   The limit starts at `Configuration.initialStepSize` and shrinks by `Configuration.coolingRate` every iteration
+    * Adaptive:  The limit shrinks when the system energy rises and grows after it has steadily dropped
+
+    Neither schedule lets the limit drop below `Configuration.minimumStepSize`.  The energy is the sum
+    of the squared net forces on the nodes.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        configuration: Configuration = Configuration()
+
+        self._stepControl:     StepControl = configuration.stepControl
+        self._coolingRate:     float       = configuration.coolingRate
+        self._minimumStepSize: float       = configuration.minimumStepSize
+
+        self._stepSize:   float = inf if self._stepControl == StepControl.FIXED else configuration.initialStepSize
+        self._lastEnergy: float = inf
+        self._progress:   int   = 0
+
+    @property
+    def stepSize(self) -> float:
+        """
+        Returns:  The current limit;  Infinite when the step is fixed
+        """
+        return self._stepSize
+
+    def limit(self, velocityX: float, velocityY: float) -> Tuple[float, float]:
+        """
+        Args:
+            velocityX:  The x component of a node velocity
+            velocityY:  The y component of a node velocity
+
+        Returns:  The velocity shortened to at most the step size
+        """
+        speed: float = hypot(velocityX, velocityY)
+        if speed <= self._stepSize:
+            return velocityX, velocityY
+
+        scale: float = self._stepSize / speed
+
+        return velocityX * scale, velocityY * scale
+
+    def limitArray(self, velocities: ndarray) -> ndarray:
+        """
+        Args:
+            velocities:  (n, 2) node velocities
+
+        Returns:  The velocities shortened to at most the step size
+        """
+        if self._stepSize == inf:
+            return velocities
+
+        speeds: ndarray = arrayHypot(velocities[:, 0], velocities[:, 1])
+        scale:  ndarray = where(speeds > 0, minimum(1.0, self._stepSize / where(speeds > 0, speeds, 1.0)), 1.0)
+
+        return velocities * scale[:, None]
+
+    def update(self, energy: float):
+        """
+        Advance the schedule after an iteration
+
+        Args:
+            energy:  The sum of the squared net forces during the iteration
+        """
+        if self._stepControl == StepControl.COOLING:
+            self._stepSize = max(self._stepSize * self._coolingRate, self._minimumStepSize)
+        elif self._stepControl == StepControl.ADAPTIVE:
+            if energy < self._lastEnergy:
+                self._progress += 1
+                if self._progress >= ADAPTIVE_PROGRESS_COUNT:
+                    self._progress = 0
+                    self._stepSize = self._stepSize / ADAPTIVE_STEP_RATIO
+            else:
+                self._progress = 0
+                self._stepSize = max(self._stepSize * ADAPTIVE_STEP_RATIO, self._minimumStepSize)
+
+        self._lastEnergy = energy
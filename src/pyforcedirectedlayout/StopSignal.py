@@ -0,0 +1,56 @@
+
+from math import inf
+
+from time import perf_counter
+
+from pyforcedirectedlayout.CancellationToken import CancellationToken
+from pyforcedirectedlayout.CancellationToken import NO_CANCELLATION_TOKEN
+from pyforcedirectedlayout.LayoutTypes import StopReason
+
+
+class StopSignal:
+    """
+    Stops a simulation from outside its convergence rules:  When the cancellation token is
+    cancelled or the wall clock time budget runs out.  The time budget starts when the
+    signal is created, so every level of a multilevel layout shares the same deadline
+    """
+    def __init__(self, cancellationToken: CancellationToken = NO_CANCELLATION_TOKEN, timeBudget: float = inf):
+        """
+
+        Args:
+            cancellationToken:  Checked once per iteration
+            timeBudget:         Seconds the simulation may run for;  Infinite for no budget
+        """
+        self._cancellationToken: CancellationToken = cancellationToken
+        self._deadline:          float             = perf_counter() + timeBudget
+
+    @property
+    def cancellationToken(self) -> CancellationToken:
+        return self._cancellationToken
+
+    @property
+    def remainingTime(self) -> float:
+        """
+        Returns:  The seconds left of the time budget;  Infinite when there is no budget
+        """
+        if self._deadline == inf:
+            return inf
+
+        return max(self._deadline - perf_counter(), 0.0)
+
+    def stopReason(self) -> StopReason:
+        """
+        Returns:  Why the simulation should stop;  `StopReason.RUNNING` when it should go on
+        """
+        if self._cancellationToken is not NO_CANCELLATION_TOKEN and self._cancellationToken.cancelled is True:
+            return StopReason.CANCELLED
+        if self._deadline != inf and perf_counter() >= self._deadline:
+            return StopReason.TIME_BUDGET
+
+        return StopReason.RUNNING
+
+
+UNLIMITED: StopSignal = StopSignal()
+"""
+Never stops a simulation
+"""
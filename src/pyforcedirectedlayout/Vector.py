@@ -9,6 +9,7 @@ from math import pi
 from math import sin
 from math import sqrt
 
+from pyforcedirectedlayout.LayoutTypes import Force
 from pyforcedirectedlayout.Point import Point
 
 PI_180: float = pi / 180.0
@@ -24,9 +25,14 @@ class Vector:
     
     Vector addition and scalar multiplication are supported.
     """
-    def __init__(self, magnitude: float, direction: float):
+    __slots__ = ('_magnitude', '_direction')
 
-        self.logger: Logger = getLogger(__name__)
+    logger: Logger = getLogger(__name__)
+    """
+    Shared by every vector;  Vectors are built several times per node pair per iteration
+    """
+
+    def __init__(self, magnitude: float, direction: float):
 
         self._magnitude: float = magnitude
         self._direction: float = direction
@@ -56,16 +62,45 @@ class Vector:
     def direction(self, direction: float):
         self._direction = direction
 
-    def toPoint(self):
+    @classmethod
+    def fromCartesian(cls, x: float, y: float) -> 'Vector':
+        """
+        Converts an X-Y representation into a vector
+
+        Args:
+            x:  The x component
+            y:  The y component
+
+        Returns:  The equivalent vector
+        """
+        magnitude: float = sqrt(pow(x, 2) + pow(y, 2))
+        if magnitude == 0.0:
+            return Vector(magnitude=0.0, direction=0.0)
+
+        return Vector(magnitude=magnitude, direction=(180.0 / pi) * atan2(y, x))
+
+    def toCartesian(self) -> Force:
+        """
+        Returns:  The vector's x and y components
+        """
+        return Force((self._magnitude * cos(PI_180 * self._direction), self._magnitude * sin(PI_180 * self._direction)))
+
+    def toPoint(self, floatPrecision: bool = False) -> Point:
         """
         Converts the vector into an X-Y coordinate representation.
 
+        Args:
+            floatPrecision:  If True keep the sub-pixel coordinates, else truncate them to integers
+
         Returns:
         """
         x: float = self._magnitude * cos((pi / 180.0) * self._direction)
         y: float = self._magnitude * sin((pi / 180.0) * self._direction)
 
-        return Point(x=int(x), y=int(y))
+        if floatPrecision is True:
+            return Point(x=x, y=y)
+        else:
+            return Point(x=int(x), y=int(y))
 
     def __add__(self, other: 'Vector') -> 'Vector':
         """
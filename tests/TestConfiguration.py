@@ -5,6 +5,7 @@ from codeallybasic.MinMax import MinMax
 from codeallybasic.UnitTestBase import UnitTestBase
 
 from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import RepulsionMode
 
 
 class TestConfiguration(UnitTestBase):
@@ -55,6 +56,11 @@ class TestConfiguration(UnitTestBase):
         minMaxY: MinMax = self._configuration.minMaxY
         self.assertTrue(isinstance(minMaxY, MinMax), 'Wrong type')
 
+    def testDeserializeRepulsionMode(self):
+
+        repulsionMode: RepulsionMode = self._configuration.repulsionMode
+        self.assertTrue(isinstance(repulsionMode, RepulsionMode), 'Wrong type')
+
     def testFactorsProperties(self):
         stopCount: int = self._configuration.stopCount
         self.assertTrue(isinstance(stopCount, int), 'Wrong type')
@@ -0,0 +1,111 @@
+
+from typing import Callable
+from typing import List
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from random import Random
+
+from time import perf_counter
+
+from timeit import timeit
+
+import tracemalloc
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutTypes import SimulationEngine
+from pyforcedirectedlayout.Rectangle import Rectangle
+from pyforcedirectedlayout.Vector import Vector
+
+DEFAULT_NODE_COUNT: int = 500
+DEFAULT_ITERATIONS: int = 5
+CONSTRUCTION_COUNT: int = 100000
+
+
+class BenchmarkArrange:
+    """
+    Micro-benchmark of the value types on the hot path of the reference simulation and of
+    `arrange` itself.  Run it before and after a change to see the time and allocation savings:
+
+        python -m tests.benchmark.BenchmarkArrange --nodes 500 --iterations 5
+
+    The configuration is restored afterward
+    """
+    def __init__(self, nodeCount: int, iterations: int):
+
+        self._nodeCount:  int = nodeCount
+        self._iterations: int = iterations
+
+    def run(self):
+
+        self._construction(name='Vector',    factory=lambda: Vector(magnitude=1.0, direction=45.0))
+        self._construction(name='Rectangle', factory=lambda: Rectangle(x=0, y=0, width=10, height=10))
+        self._arrange()
+
+    def _construction(self, name: str, factory: Callable[[], object]):
+        """
+        Report the time and the memory each instance takes
+        """
+        seconds: float = timeit(factory, number=CONSTRUCTION_COUNT)
+
+        tracemalloc.start()
+        instances: List[object] = [factory() for _ in range(CONSTRUCTION_COUNT)]
+        allocated: int          = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f'{name:<10} {seconds / CONSTRUCTION_COUNT * 1e9:8.0f} ns/instance  {allocated / len(instances):6.0f} bytes/instance')
+
+    def _arrange(self):
+        """
+        Report the time per iteration and the peak memory of the reference simulation
+        """
+        configuration: Configuration = Configuration()
+
+        saveSimulationEngine: SimulationEngine = configuration.simulationEngine
+        saveMaxIterations:    int              = configuration.maxIterations
+        try:
+            configuration.simulationEngine = SimulationEngine.PYTHON
+            configuration.maxIterations    = self._iterations
+
+            startTime: float = perf_counter()
+            self._createDiagram().arrange(deterministic=True)
+            seconds: float = perf_counter() - startTime
+
+            layoutEngine: ForceDirectedLayout = self._createDiagram()
+            tracemalloc.start()
+            layoutEngine.arrange(deterministic=True)
+            peak: int = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            configuration.simulationEngine = saveSimulationEngine
+            configuration.maxIterations    = saveMaxIterations
+
+        print(f'arrange    {seconds / self._iterations * 1000:8.1f} ms/iteration  {peak / 1e6:6.2f} MB peak  ({self._nodeCount} nodes)')
+
+    def _createDiagram(self) -> ForceDirectedLayout:
+        """
+        Returns:  The same random tree every time
+        """
+        random:       Random              = Random(1)
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        nodes:        List[LayoutNode]    = [LayoutNode() for _ in range(self._nodeCount)]
+        for index, node in enumerate(nodes):
+            layoutEngine.addNode(node)
+            if index > 0:
+                nodes[random.randrange(index)].addChild(node)
+
+        return layoutEngine
+
+
+if __name__ == '__main__':
+
+    argumentParser: ArgumentParser = ArgumentParser(description='Benchmark the value types and arrange')
+    argumentParser.add_argument('--nodes',      type=int, default=DEFAULT_NODE_COUNT, help='Number of nodes in the diagram')
+    argumentParser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='Number of iterations to arrange for')
+
+    arguments: Namespace = argumentParser.parse_args()
+
+    BenchmarkArrange(nodeCount=arguments.nodes, iterations=arguments.iterations).run()
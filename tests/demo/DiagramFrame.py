@@ -25,7 +25,7 @@ from wx import Window
 from wx.core import PenStyle
 
 from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
-from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NodesView
 from pyforcedirectedlayout.Node import Node
 from pyforcedirectedlayout.Point import Point
 
@@ -101,7 +101,7 @@ class DiagramFrame(ScrolledWindow):
 
         self._drawGrid(memDC=mem, width=w, height=h, startX=x, startY=y)
 
-        nodes: Nodes = self._layoutEngine.nodes
+        nodes: NodesView = self._layoutEngine.nodes
         for n in nodes:
             parentNode: Node = cast(Node, n)
             parentNode.drawNode(mem)
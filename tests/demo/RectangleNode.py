@@ -78,8 +78,8 @@ class RectangleNode(Node):
         dc.SetPen(self._stroke)
         dc.SetBrush(self._fill)
 
-        x:      int = self.location.x
-        y:      int = self.location.y
+        x:      int = round(self.location.x)
+        y:      int = round(self.location.y)
         width:  int = self.size.width
         height: int = self.size.height
 
@@ -121,8 +121,8 @@ class RectangleNode(Node):
         dc.SetFont(self._defaultFont)
         dc.SetTextForeground(self._textColor)
 
-        x: int = self.location.x
-        y: int = self.location.y
+        x: int = round(self.location.x)
+        y: int = round(self.location.y)
 
         w = self.size.width
         h = 0
@@ -74,7 +74,7 @@ class SpotNode(Node):
         savePen: DC = dc.GetPen()
 
         dc.SetPen(self._stroke)
-        dc.DrawLine(x1=sourcePoint.x, y1=sourcePoint.y, x2=destinationPoint.x, y2=destinationPoint.y)
+        dc.DrawLine(x1=round(sourcePoint.x), y1=round(sourcePoint.y), x2=round(destinationPoint.x), y2=round(destinationPoint.y))
         dc.SetPen(savePen)
 
     def drawNode(self, dc: DC):
@@ -85,7 +85,7 @@ class SpotNode(Node):
         dc.SetPen(self._stroke)
         dc.SetBrush(self._fill)
 
-        dc.DrawEllipse(x=self.location.x, y=self.location.y, width=self.size.width, height=self.size.height)
+        dc.DrawEllipse(x=round(self.location.x), y=round(self.location.y), width=self.size.width, height=self.size.height)
 
         dc.SetPen(savePen)
         dc.SetBrush(saveBrush)
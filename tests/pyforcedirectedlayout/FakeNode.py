@@ -37,3 +37,6 @@ class FakeNode(Node):
             ans = True
 
         return ans
+
+    def __hash__(self) -> int:
+        return hash(self.fakeId)
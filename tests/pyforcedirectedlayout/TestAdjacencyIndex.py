@@ -0,0 +1,133 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.Point import Point
+
+from tests.pyforcedirectedlayout.FakeNode import FakeNode
+
+
+class TestAdjacencyIndex(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        self._parentNode: FakeNode = FakeNode(location=Point(x=100, y=100), fakeId=100)
+        self._childNode:  FakeNode = FakeNode(location=Point(x=200, y=200), fakeId=200)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testAddChild(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._parentNode.addChild(self._childNode)
+
+        self.assertEqual([self._childNode],  self._layoutEngine._adjacency.children(self._parentNode), 'Child not indexed')
+        self.assertEqual([self._parentNode], self._layoutEngine._adjacency.parents(self._childNode),   'Parent not indexed')
+
+    def testConnectedBeforeAdded(self):
+
+        self._parentNode.addChild(self._childNode)
+        self._layoutEngine.addNode(self._parentNode)
+
+        self.assertEqual([self._parentNode], self._layoutEngine._adjacency.parents(self._childNode), 'Existing connections should be indexed')
+
+    def testDisconnect(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._parentNode.addChild(self._childNode)
+
+        self._parentNode.disConnect(self._childNode)
+
+        self.assertEqual([], self._layoutEngine._adjacency.children(self._parentNode), 'Child should be gone')
+        self.assertEqual([], self._layoutEngine._adjacency.parents(self._childNode),   'Parent should be gone')
+
+    def testRemoveNode(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._parentNode.addChild(self._childNode)
+
+        removed: bool = self._layoutEngine.removeNode(self._childNode)
+
+        self.assertTrue(removed, 'Child was in the diagram')
+        self.assertEqual((), self._parentNode.connections, 'Parent should no longer be connected')
+        self.assertEqual([], self._layoutEngine._adjacency.children(self._parentNode), 'Child should not be indexed')
+
+    def testConnectAfterRemove(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._layoutEngine.removeNode(self._parentNode)
+
+        self.assertIsNone(self._parentNode.layoutEngine, 'A removed node should not belong to the diagram')
+
+        self._parentNode.addChild(self._childNode)
+
+        self.assertEqual([], self._layoutEngine._adjacency.children(self._parentNode), 'Connections of a removed node should not be indexed')
+        self.assertFalse(self._layoutEngine.containsNode(self._childNode), 'A child of a removed node should not join the diagram')
+
+    def testRemoveParent(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._parentNode.addChild(self._childNode)
+
+        self._layoutEngine.removeNode(self._parentNode)
+
+        self.assertEqual([], self._layoutEngine._adjacency.parents(self._childNode), 'A removed node is no longer a parent')
+
+    def testIndexedByNode(self):
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._parentNode.addChild(self._childNode)
+
+        sameParent: FakeNode = FakeNode(location=Point(), fakeId=self._parentNode.fakeId)
+        sameChild:  FakeNode = FakeNode(location=Point(), fakeId=self._childNode.fakeId)
+
+        self.assertEqual([self._childNode], self._layoutEngine._adjacency.children(sameParent), 'Nodes are looked up by equality, like the diagram does')
+
+        self._layoutEngine._adjacency.removeConnection(parent=sameParent, child=sameChild)
+
+        self.assertEqual([], self._layoutEngine._adjacency.children(self._parentNode), 'An equal node should remove the connection')
+
+    def testConnectedComponents(self):
+
+        isolatedNode: FakeNode = FakeNode(location=Point(x=300, y=300), fakeId=300)
+
+        self._layoutEngine.addNode(self._parentNode)
+        self._layoutEngine.addNode(isolatedNode)
+        self._parentNode.addChild(self._childNode)
+
+        components: List[Nodes] = self._layoutEngine._adjacency.connectedComponents(self._layoutEngine.nodes)
+
+        self.assertEqual([[self._parentNode, self._childNode], [isolatedNode]], components, 'Incorrect components')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAdjacencyIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
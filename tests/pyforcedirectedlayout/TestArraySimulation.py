@@ -0,0 +1,191 @@
+
+from typing import Generator
+from typing import List
+
+from math import atan2
+from math import degrees
+from math import hypot
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+from numpy import zeros_like
+
+from numpy.random import default_rng
+
+from pyforcedirectedlayout.ArraySimulation import ArraySimulation
+from pyforcedirectedlayout.ArraySimulation import MINIMUM_NODES_PER_WORKER
+from pyforcedirectedlayout.ArraySimulation import NO_PARALLEL_REPULSION
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import StopReason
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.Vector import Vector
+
+from tests.pyforcedirectedlayout.FakeNode import FakeNode
+
+
+class TestArraySimulation(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+        self._saveRepulsionForce:  int   = self._configuration.repulsionForce
+        self._saveAttractionForce: float = self._configuration.attractionForce
+        self._saveSpringLength:    int   = self._configuration.springLength
+
+        self._configuration.repulsionForce  = 10000
+        self._configuration.attractionForce = 0.1
+        self._configuration.springLength    = 100
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._configuration.repulsionForce  = self._saveRepulsionForce
+        self._configuration.attractionForce = self._saveAttractionForce
+        self._configuration.springLength    = self._saveSpringLength
+
+    def testRepulsionMatchesReference(self):
+
+        actingOnNode:      FakeNode = FakeNode(location=Point(x=100, y=100), fakeId=100)
+        creatingForceNode: FakeNode = FakeNode(location=Point(x=500, y=500), fakeId=500)
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=Nodes([actingOnNode, creatingForceNode]))
+        forces:          ndarray         = arraySimulation._repulsionForces(arraySimulation.positions)
+
+        expectedForce: Vector = ForceDirectedLayout()._calculateRepulsionForce(x=actingOnNode, y=creatingForceNode)
+
+        self.assertEqual(expectedForce, self._toVector(forces[0]), 'Repulsion force does not match the reference engine')
+
+    def testAttractionMatchesReference(self):
+
+        parentNode: FakeNode = FakeNode(location=Point(x=100, y=100), fakeId=100)
+        childNode:  FakeNode = FakeNode(location=Point(x=500, y=500), fakeId=500)
+        parentNode.addChild(childNode)
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=Nodes([parentNode, childNode]))
+        forces:          ndarray         = arraySimulation._attractionForces(arraySimulation.positions)
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        expectedParentForce: Vector = layoutEngine._calculateAttractionForce(x=parentNode, y=childNode, springLength=100)
+        expectedChildForce:  Vector = layoutEngine._calculateAttractionForce(x=childNode, y=parentNode, springLength=100)
+
+        self.assertEqual(expectedParentForce, self._toVector(forces[0]), 'Parent attraction does not match the reference engine')
+        self.assertEqual(expectedChildForce,  self._toVector(forces[1]), 'Child attraction does not match the reference engine')
+
+    def testCoincidentNodesDoNotRepel(self):
+
+        nodeA: FakeNode = FakeNode(location=Point(x=10, y=10), fakeId=1)
+        nodeB: FakeNode = FakeNode(location=Point(x=10, y=10), fakeId=2)
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=Nodes([nodeA, nodeB]))
+        forces:          ndarray         = arraySimulation._repulsionForces(arraySimulation.positions)
+
+        self.assertEqual(0.0, abs(forces).sum(), 'Coincident nodes have no direction to repel in')
+
+    def testRunUpdatesNodeLocations(self):
+
+        parentNode: FakeNode = FakeNode(location=Point(x=0, y=0), fakeId=1)
+        nodes:      Nodes    = Nodes([parentNode])
+        for x in range(2, 6):
+            childNode: FakeNode = FakeNode(location=Point(x=x, y=-x), fakeId=x)
+            parentNode.addChild(childNode)
+            nodes.append(childNode)
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=nodes)
+        layoutStatus:    LayoutStatus    = arraySimulation.run(statusCallback=lambda status: None)
+
+        self.assertTrue(layoutStatus.iterations > 0, 'The simulation should have iterated')
+        for node, (x, y) in zip(nodes, arraySimulation.positions.tolist()):
+            self.assertEqual(Point(x=int(x), y=int(y)), node.location, 'Final position was not written back')
+
+    def testSteps(self):
+
+        nodes: Nodes = Nodes([FakeNode(location=Point(x=0, y=0), fakeId=1), FakeNode(location=Point(x=10, y=0), fakeId=2)])
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=nodes)
+        iterations:      List[int]       = []
+        for layoutStatus in arraySimulation.steps(maxIterations=5):
+            iterations.append(layoutStatus.iterations)
+
+        self.assertEqual([1, 2, 3, 4, 5], iterations, 'One status per iteration')
+        self.assertEqual(StopReason.MAX_ITERATIONS, layoutStatus.stopReason, 'The last status tells why it stopped')
+        self.assertEqual(Point(x=0, y=0), nodes[0].location, 'Stepping does not move the nodes')
+
+    def testSharedBuffers(self):
+
+        positions:  ndarray = array([(0.0, 0.0), (10.0, 0.0), (0.0, 10.0)], dtype=float64)
+        velocities: ndarray = zeros_like(positions)
+        sources:    ndarray = array([0, 0], dtype=int64)
+        targets:    ndarray = array([1, 2], dtype=int64)
+
+        copied: ArraySimulation = ArraySimulation.fromArrays(positions=positions, sources=sources, targets=targets, velocities=velocities)
+        copied.run(maxIterations=5)
+
+        self.assertEqual(0.0, float(abs(velocities).sum()), 'By default the simulation works on copies')
+
+        shared: ArraySimulation = ArraySimulation.fromArrays(positions=positions, sources=sources, targets=targets, velocities=velocities, shareBuffers=True)
+        shared.run(maxIterations=5)
+
+        self.assertIs(positions, shared.positions, 'The simulation should keep the given buffers')
+        self.assertTrue((copied.positions == positions).all(), 'The positions should be written to the given buffer')
+        self.assertTrue((copied.velocities == velocities).all(), 'The velocities should be written to the given buffer')
+
+    def testWorkerCount(self):
+
+        saveWorkerCount: int = self._configuration.workerCount
+        self._configuration.workerCount = 2
+
+        positions: ndarray = default_rng(1).uniform(0, 1000, size=(2 * MINIMUM_NODES_PER_WORKER, 2))
+        noEdges:   ndarray = array([], dtype=int64)
+        try:
+            serial:      ArraySimulation                     = ArraySimulation.fromArrays(positions=positions, sources=noEdges, targets=noEdges, workerCount=1)
+            serialSteps: Generator[LayoutStatus, None, None] = serial.steps(maxIterations=1)
+            next(serialSteps)
+            self.assertIs(NO_PARALLEL_REPULSION, serial._parallelRepulsion, 'One worker should compute the repulsion in this process')
+            serialSteps.close()
+
+            configured:      ArraySimulation                     = ArraySimulation.fromArrays(positions=positions, sources=noEdges, targets=noEdges)
+            configuredSteps: Generator[LayoutStatus, None, None] = configured.steps(maxIterations=1)
+            next(configuredSteps)
+            self.assertIsNot(NO_PARALLEL_REPULSION, configured._parallelRepulsion, 'By default the configured workers are used')
+            configuredSteps.close()
+        finally:
+            self._configuration.workerCount = saveWorkerCount
+
+    def _toVector(self, force: ndarray) -> Vector:
+        return Vector(magnitude=hypot(force[0], force[1]), direction=degrees(atan2(force[1], force[0])))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestArraySimulation))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,119 @@
+
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import patch
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.BatchLayout import BatchLayout
+from pyforcedirectedlayout.BatchLayout import DiagramLayout
+from pyforcedirectedlayout.BatchLayout import DiagramSpecification
+from pyforcedirectedlayout.BatchLayout import Edge
+from pyforcedirectedlayout.BatchLayout import Edges
+from pyforcedirectedlayout.BatchLayout import layoutDiagram
+from pyforcedirectedlayout.Configuration import Configuration
+
+
+class InProcessExecutor:
+    """
+    Stands in for the process pool;  Runs the workers in this process and counts the pools created
+    """
+    poolCount: int = 0
+
+    def __init__(self, max_workers: int):
+        InProcessExecutor.poolCount += 1
+
+    def __enter__(self) -> 'InProcessExecutor':
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def map(self, function: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:
+        return map(function, iterable)
+
+
+class TestBatchLayout(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._diagramSpecifications: List[DiagramSpecification] = [
+            DiagramSpecification(nodeCount=nodeCount, edges=Edges([Edge((0, i)) for i in range(1, nodeCount)]), deterministic=True)
+            for nodeCount in (2, 5, 8)
+        ]
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testLayoutDiagram(self):
+
+        diagramLayout: DiagramLayout = layoutDiagram(self._diagramSpecifications[1])
+
+        self.assertEqual(5, len(diagramLayout.positions), 'One position per node')
+        self.assertTrue(diagramLayout.layoutStatus.iterations > 0, 'The simulation should have iterated')
+
+    def testBatchMatchesSerial(self):
+
+        batchLayout:    BatchLayout         = BatchLayout(workerCount=2)
+        diagramLayouts: List[DiagramLayout] = batchLayout.arrange(self._diagramSpecifications)
+
+        self.assertEqual(len(self._diagramSpecifications), len(diagramLayouts), 'One layout per diagram')
+        for diagramSpecification, diagramLayout in zip(self._diagramSpecifications, diagramLayouts):
+            expectedLayout: DiagramLayout = layoutDiagram(diagramSpecification)
+            self.assertEqual(expectedLayout, diagramLayout, 'Deterministic layouts should not depend on the worker')
+
+    def testWorkersDoNotStartPools(self):
+
+        configuration:        Configuration = Configuration()
+        saveLayoutComponents: bool          = configuration.layoutComponents
+        saveWorkerCount:      int           = configuration.workerCount
+
+        configuration.layoutComponents = True
+        configuration.workerCount      = 2
+
+        twoComponents: List[DiagramSpecification] = [DiagramSpecification(nodeCount=4, edges=Edges([Edge((0, 1)), Edge((2, 3))]), deterministic=True)] * 2
+
+        InProcessExecutor.poolCount = 0
+        try:
+            with patch('pyforcedirectedlayout.BatchLayout.ProcessPoolExecutor', InProcessExecutor):
+                diagramLayouts: List[DiagramLayout] = BatchLayout(workerCount=2).arrange(twoComponents)
+        finally:
+            configuration.layoutComponents = saveLayoutComponents
+            configuration.workerCount      = saveWorkerCount
+
+        self.assertEqual(2, len(diagramLayouts), 'One layout per diagram')
+        self.assertEqual(1, InProcessExecutor.poolCount, 'The workers should lay out their components without a pool of their own')
+
+    def testEmptyBatch(self):
+
+        self.assertEqual([], BatchLayout().arrange([]), 'Nothing to lay out')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchLayout))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
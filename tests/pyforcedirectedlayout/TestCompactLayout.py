@@ -0,0 +1,138 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import int64
+from numpy import ndarray
+
+from pyforcedirectedlayout.CompactLayout import CompactLayout
+from pyforcedirectedlayout.CompactLayout import NodeView
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import SimulationEngine
+from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.Size import Size
+
+NODE_COUNT: int = 8
+
+
+class TestCompactLayout(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+        self._sources: ndarray = array([0] * (NODE_COUNT - 1), dtype=int64)
+        self._targets: ndarray = array(range(1, NODE_COUNT), dtype=int64)
+        self._sizes:   ndarray = array([(10 + i, 20) for i in range(NODE_COUNT)], dtype=int64)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMatchesForceDirectedLayout(self):
+
+        saveSimulationEngine: SimulationEngine = self._configuration.simulationEngine
+        self._configuration.simulationEngine = SimulationEngine.NUMPY
+
+        nodes:        List[LayoutNode]    = [LayoutNode(size=Size(width=width, height=height)) for width, height in self._sizes.tolist()]
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        for node in nodes:
+            layoutEngine.addNode(node)
+        for source, target in zip(self._sources.tolist(), self._targets.tolist()):
+            nodes[source].addChild(nodes[target])
+
+        expectedStatus: LayoutStatus = layoutEngine.arrange(deterministic=True)
+
+        self._configuration.simulationEngine = saveSimulationEngine
+
+        compactLayout: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=self._sources, targets=self._targets, sizes=self._sizes)
+        layoutStatus:  LayoutStatus  = compactLayout.arrange(deterministic=True)
+
+        self.assertEqual(expectedStatus, layoutStatus, 'Should run the same simulation')
+        self.assertEqual([node.location for node in nodes], [compactLayout.node(index).location for index in range(NODE_COUNT)], 'Should place the nodes the same')
+
+    def testNodeView(self):
+
+        compactLayout: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=self._sources, targets=self._targets, sizes=self._sizes)
+        nodeView:      NodeView      = compactLayout.node(3)
+
+        nodeView.location = Point(x=5, y=7)
+        self.assertEqual([5.0, 7.0], compactLayout.positions[3].tolist(), 'The view writes through to the buffer')
+
+        compactLayout.positions[3] = (9, 11)
+        self.assertEqual(Point(x=9, y=11), nodeView.location, 'The view reads from the buffer')
+        self.assertEqual(Size(width=13, height=20), nodeView.size, 'The size comes from the buffer')
+        self.assertEqual(compactLayout.node(3), nodeView, 'Views of the same node are equal')
+
+    def testWarmStart(self):
+
+        compactLayout: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=self._sources, targets=self._targets)
+
+        coldStatus: LayoutStatus = compactLayout.arrange(deterministic=True)
+        warmStatus: LayoutStatus = compactLayout.arrange(warmStart=True)
+
+        self.assertLess(warmStatus.iterations, coldStatus.iterations, 'A settled layout should reconverge quickly')
+
+    def testEmptyGraph(self):
+
+        noEdges:       ndarray       = array([], dtype=int64)
+        compactLayout: CompactLayout = CompactLayout(nodeCount=0, sources=noEdges, targets=noEdges)
+
+        compactLayout.arrange(deterministic=True)
+        compactLayout.arrange(warmStart=True)
+
+        self.assertEqual((0, 2), compactLayout.positions.shape, 'Nothing to lay out')
+
+    def testWarmStartKeepsConvergedLayout(self):
+
+        configuration:                Configuration = Configuration()
+        saveFloatPrecision:           bool          = configuration.floatPrecision
+        saveMinimumTotalDisplacement: int           = configuration.minimumTotalDisplacement
+        saveMaxIterations:            int           = configuration.maxIterations
+
+        configuration.floatPrecision           = True
+        configuration.minimumTotalDisplacement = 1
+        configuration.maxIterations            = 2000
+        try:
+            compactLayout: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=self._sources, targets=self._targets)
+            compactLayout.arrange(deterministic=True)
+
+            converged: ndarray = compactLayout.positions.copy()
+            compactLayout.arrange(deterministic=True, warmStart=True)
+        finally:
+            configuration.floatPrecision           = saveFloatPrecision
+            configuration.minimumTotalDisplacement = saveMinimumTotalDisplacement
+            configuration.maxIterations            = saveMaxIterations
+
+        self.assertLess(float(abs(compactLayout.positions - converged).max()), configuration.springLength / 10, 'A warm start should not move a converged layout')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCompactLayout))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,97 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import int64
+from numpy import ndarray
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.ConvergenceMonitor import ConvergenceMonitor
+from pyforcedirectedlayout.ForceKernels import repulsionEnergy
+from pyforcedirectedlayout.ForceKernels import springEnergy
+from pyforcedirectedlayout.LayoutTypes import StopCriterion
+
+
+class TestConvergenceMonitor(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+        self._saveStopCriterion: StopCriterion = self._configuration.stopCriterion
+        self._saveTolerance:     float         = self._configuration.tolerance
+        self._saveSpringLength:  int           = self._configuration.springLength
+
+        self._configuration.tolerance    = 0.01
+        self._configuration.springLength = 100
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._configuration.stopCriterion = self._saveStopCriterion
+        self._configuration.tolerance     = self._saveTolerance
+        self._configuration.springLength  = self._saveSpringLength
+
+    def testMaxDisplacement(self):
+
+        self._configuration.stopCriterion = StopCriterion.MAX_DISPLACEMENT
+
+        convergenceMonitor: ConvergenceMonitor = ConvergenceMonitor()
+
+        self.assertFalse(convergenceMonitor.isSettled(totalDisplacement=0.0, maxDisplacement=1.5, energy=0.0),     'A node still moves more than a pixel')
+        self.assertTrue(convergenceMonitor.isSettled(totalDisplacement=5000.0, maxDisplacement=0.5, energy=0.0),   'The total does not matter')
+
+    def testEnergy(self):
+
+        self._configuration.stopCriterion = StopCriterion.ENERGY
+
+        convergenceMonitor: ConvergenceMonitor = ConvergenceMonitor()
+
+        self.assertTrue(convergenceMonitor.needsEnergy, 'The criterion needs the energy')
+        self.assertFalse(convergenceMonitor.isSettled(totalDisplacement=0.0, maxDisplacement=0.0, energy=1000.0), 'There is no change to measure yet')
+        self.assertFalse(convergenceMonitor.isSettled(totalDisplacement=0.0, maxDisplacement=0.0, energy=900.0),  'A 10% change has not settled')
+        self.assertTrue(convergenceMonitor.isSettled(totalDisplacement=0.0, maxDisplacement=0.0, energy=895.0),   'A 0.5% change has settled')
+
+    def testRepulsionEnergy(self):
+
+        positions: ndarray = array([[0.0, 0.0], [3.0, 4.0], [3.0, 4.0]])
+
+        # the coincident pair has no potential
+        self.assertAlmostEqual(2 * 100.0 / 5.0, repulsionEnergy(positions=positions, coulombLawConstant=100.0), msg='Each distinct pair counts once')
+
+    def testSpringEnergy(self):
+
+        positions: ndarray = array([[0.0, 0.0], [0.0, 150.0], [0.0, 50.0]])
+        sources:   ndarray = array([0, 0], dtype=int64)
+        targets:   ndarray = array([1, 2], dtype=int64)
+
+        energy: float = springEnergy(positions=positions, sources=sources, targets=targets, attractionForce=0.1, springLength=100)
+
+        self.assertAlmostEqual(0.1 * 50 * 50 / 2, energy, msg='Only the stretched spring stores energy')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestConvergenceMonitor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
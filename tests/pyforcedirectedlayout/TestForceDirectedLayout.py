@@ -1,22 +1,41 @@
+from typing import AsyncGenerator
+from typing import Generator
 from typing import List
 from typing import NewType
 from typing import Tuple
 from typing import cast
 
+from asyncio import run
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from numpy import array
+
 from codeallybasic.UnitTestBase import UnitTestBase
 
+from pyforcedirectedlayout.CancellationToken import CancellationToken
 from pyforcedirectedlayout.Configuration import Configuration
 from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
 from pyforcedirectedlayout.ForceDirectedLayout import ORIGIN_POINT
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutTypes import LayoutFrame
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.LayoutTypes import NodesView
+from pyforcedirectedlayout.LayoutTypes import RepulsionMode
+from pyforcedirectedlayout.LayoutTypes import SimulationEngine
+from pyforcedirectedlayout.LayoutTypes import StopCriterion
+from pyforcedirectedlayout.LayoutTypes import StopReason
 from pyforcedirectedlayout.Node import Node
 from pyforcedirectedlayout.NodeLayoutInformation import NodeLayoutInformation
 
 from pyforcedirectedlayout.NodeLayoutInformation import NodeLayoutInformationList
 
 from pyforcedirectedlayout.Point import Point
+from pyforcedirectedlayout.QuadTree import Coordinates
+from pyforcedirectedlayout.QuadTree import QuadTree
+from pyforcedirectedlayout.SpatialGrid import SpatialGrid
 from pyforcedirectedlayout.Vector import Vector
 
 from tests.pyforcedirectedlayout.FakeNode import FakeNode
@@ -162,6 +181,28 @@ class TestForceDirectedLayout(UnitTestBase):
 
         self.assertEqual(False, removed, 'Was not in Diagram')
 
+    def testChildOutsideDiagram(self):
+
+        saveStopCriterion: StopCriterion = self._configuration.stopCriterion
+        saveReportEnergy:  bool          = self._configuration.reportEnergy
+
+        self._configuration.stopCriterion = StopCriterion.ENERGY
+        self._configuration.reportEnergy  = True
+
+        parentNode: FakeNode = FakeNode(location=Point(), fakeId=100)
+        parentNode.addChild(FakeNode(location=Point(x=666, y=666), fakeId=666))
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(3)
+        layoutEngine.addNode(parentNode)
+        try:
+            layoutStatus: LayoutStatus = layoutEngine.arrange(deterministic=True)
+        finally:
+            self._configuration.stopCriterion = saveStopCriterion
+            self._configuration.reportEnergy  = saveReportEnergy
+
+        self.assertTrue(layoutStatus.iterations > 0, 'The diagram should be laid out')
+        self.assertEqual(len(layoutEngine.nodes), layoutEngine.snapshot().nodeCount, 'Only the nodes of the diagram are saved')
+
     def testScalePoint(self):
 
         layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
@@ -179,15 +220,79 @@ class TestForceDirectedLayout(UnitTestBase):
 
         layoutList: NodeLayoutInformationList = self._createFixedMetaNodes(layoutEngine)
 
-        netForce: Vector = Vector(magnitude=0.0, direction=0.0)
+        netForces: List[Vector] = []
         for currentLayoutInformation in layoutList:
             metaNode = currentLayoutInformation.node
-            netForce = layoutEngine._determineRepulsionBetweenNodes(metaNode=metaNode)
+            netForce: Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=metaNode)
             self.logger.info(f'Net force {netForce} against: {metaNode=}')
+            netForces.append(netForce)
+
+        outerForce, oppositeForce, centerForce = netForces
+
+        self.assertTrue(outerForce.magnitude > 0, 'Something must be computed')
+        self.assertAlmostEqual(45.0,  outerForce.direction,    1, 'Pushed away from the other two nodes')
+        self.assertAlmostEqual(225.0, oppositeForce.direction, 1, 'Pushed away from the other two nodes')
+        self.assertAlmostEqual(0.0,   centerForce.magnitude,   6, 'The center node is pushed equally in opposite directions')
+
+    def testDetermineRepulsionBarnesHut(self):
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        actingOnNode, creatingForceNode = self._createTwoFakeNodes()
+        layoutEngine.addNode(actingOnNode)
+        layoutEngine.addNode(creatingForceNode)
+
+        quadTree: QuadTree = QuadTree(coordinates=Coordinates([(node.x, node.y) for node in layoutEngine.nodes]))
+
+        expectedForce: Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=actingOnNode)
+        barnesHut:     Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=actingOnNode, quadTree=quadTree)
+
+        self.assertEqual(expectedForce, barnesHut, 'Barnes-Hut should match for distinct nodes')
+
+    def testDetermineRepulsionApproximationsTruncate(self):
 
-        self.logger.info(f'{netForce=}')
-        self.assertTrue(netForce.magnitude > 0, 'Something must be computed')
-        self.assertAlmostEqual(135.0, netForce.direction, 1, 'Direction is always the same with these nodes')
+        saveFloatPrecision: bool = self._configuration.floatPrecision
+        self._configuration.floatPrecision = False
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        self._configuration.floatPrecision = saveFloatPrecision
+
+        closeNodes: List[Node] = [FakeNode(location=Point(x=0, y=0), fakeId=1), FakeNode(location=Point(x=1.5, y=0), fakeId=2)]
+        for closeNode in closeNodes:
+            layoutEngine.addNode(closeNode)
+
+        quadTree: QuadTree = QuadTree(coordinates=Coordinates([(node.x, node.y) for node in layoutEngine.nodes]))
+
+        expectedForce: Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=closeNodes[0])
+        barnesHut:     Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=closeNodes[0], quadTree=quadTree)
+
+        self.assertEqual(expectedForce, barnesHut, 'Barnes-Hut should truncate the distance like the all-pairs repulsion')
+
+        spatialGrid: SpatialGrid = SpatialGrid(coordinates=Coordinates([(node.x, node.y) for node in layoutEngine.nodes]), cutoffRadius=100)
+        cutoff:      Vector      = layoutEngine._determineRepulsionBetweenNodes(metaNode=closeNodes[0], spatialGrid=spatialGrid)
+
+        self.assertEqual(expectedForce, cutoff, 'The cutoff grid should truncate the distance like the all-pairs repulsion')
+
+    def testDetermineRepulsionCutoff(self):
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        actingOnNode, creatingForceNode = self._createTwoFakeNodes()
+        layoutEngine.addNode(actingOnNode)
+        layoutEngine.addNode(creatingForceNode)
+
+        coordinates: Coordinates = Coordinates([(node.x, node.y) for node in layoutEngine.nodes])
+
+        nearGrid: SpatialGrid = SpatialGrid(coordinates=coordinates, cutoffRadius=1000)
+        farGrid:  SpatialGrid = SpatialGrid(coordinates=coordinates, cutoffRadius=100)
+
+        expectedForce: Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=actingOnNode)
+        withinRadius:  Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=actingOnNode, spatialGrid=nearGrid)
+        beyondRadius:  Vector = layoutEngine._determineRepulsionBetweenNodes(metaNode=actingOnNode, spatialGrid=farGrid)
+
+        self.assertEqual(expectedForce, withinRadius, 'Nodes within the radius should repel')
+        self.assertEqual(0.0, beyondRadius.magnitude, 'Nodes beyond the radius should not repel')
 
     def testRandomizeInitialNodeCoordinates(self):
 
@@ -208,6 +313,391 @@ class TestForceDirectedLayout(UnitTestBase):
 
         self.assertEqual(100, distance, 'Incorrect distance')
 
+    def testCalculateExactDistance(self):
+
+        distance: float = ForceDirectedLayout.calculateExactDistance(a=Point(0, 0), b=Point(1.5, 2.0))
+
+        self.assertAlmostEqual(2.5, distance, places=6, msg='Incorrect distance')
+
+    def testFloatPrecisionArrange(self):
+
+        saveFloatPrecision: bool = self._configuration.floatPrecision
+        self._configuration.floatPrecision = True
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(5)
+        layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+
+        self._configuration.floatPrecision = saveFloatPrecision
+
+        fractional: List[Node] = [node for node in layoutEngine.nodes if node.x != int(node.x) or node.y != int(node.y)]
+        self.assertTrue(len(fractional) > 0, 'Float precision should keep sub-pixel locations')
+
+        layoutEngine.roundNodeLocations()
+        for node in layoutEngine.nodes:
+            self.assertEqual(round(node.x), node.x, 'Should be rounded')
+            self.assertEqual(round(node.y), node.y, 'Should be rounded')
+
+    def testArrangeComponents(self):
+
+        saveLayoutComponents: bool = self._configuration.layoutComponents
+        self._configuration.layoutComponents = True
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        components:   List[List[Node]]    = []
+        for parentId in (10, 20, 30):
+            parentNode: FakeNode   = FakeNode(location=Point(), fakeId=parentId)
+            component:  List[Node] = [parentNode]
+            layoutEngine.addNode(parentNode)
+            for childId in range(parentId + 1, parentId + 4):
+                childNode: FakeNode = FakeNode(location=Point(), fakeId=childId)
+                parentNode.addChild(childNode)
+                component.append(childNode)
+            components.append(component)
+
+        layoutStatus: LayoutStatus = layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+
+        self._configuration.layoutComponents = saveLayoutComponents
+
+        self.assertTrue(layoutStatus.iterations > 0, 'The components should have iterated')
+        bounds: List[Tuple[float, float, float, float]] = [
+            (min(n.x for n in c), min(n.y for n in c), max(n.x + n.size.width for n in c), max(n.y + n.size.height for n in c))
+            for c in components
+        ]
+        for index, (left, top, right, bottom) in enumerate(bounds):
+            for otherLeft, otherTop, otherRight, otherBottom in bounds[index + 1:]:
+                overlaps: bool = left < otherRight and otherLeft < right and top < otherBottom and otherTop < bottom
+                self.assertFalse(overlaps, 'Packed components should not overlap')
+
+    def testArrangeComponentsChildOutsideDiagram(self):
+
+        saveLayoutComponents: bool = self._configuration.layoutComponents
+        self._configuration.layoutComponents = True
+
+        parentNode: FakeNode = FakeNode(location=Point(), fakeId=100)
+        parentNode.addChild(FakeNode(location=Point(x=666, y=666), fakeId=666))
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(3)
+        layoutEngine.addNode(parentNode)
+        try:
+            layoutStatus: LayoutStatus = layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+        finally:
+            self._configuration.layoutComponents = saveLayoutComponents
+
+        self.assertTrue(layoutStatus.iterations > 0, 'The components should have iterated')
+
+    def testArrangeIncremental(self):
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        chain:        List[Node]          = [FakeNode(location=Point(), fakeId=1)]
+        layoutEngine.addNode(chain[0])
+        for fakeId in range(2, 8):
+            fakeNode: FakeNode = FakeNode(location=Point(), fakeId=fakeId)
+            chain[-1].addChild(fakeNode)
+            chain.append(fakeNode)
+
+        layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+        arranged: List[Point] = [Point(x=node.x, y=node.y) for node in chain]
+
+        newNode: FakeNode = FakeNode(location=Point(), fakeId=100)
+        chain[-1].addChild(newNode)
+
+        layoutStatus: LayoutStatus = layoutEngine.arrangeIncremental(statusCallback=lambda status: None, deterministic=True)
+
+        self.assertTrue(layoutStatus.iterations <= self._configuration.relaxationIterations, 'Relaxation should be short')
+        self.assertEqual(arranged[:-2], [node.location for node in chain[:-2]], 'Nodes away from the change should not move')
+        distance: float = ForceDirectedLayout.calculateExactDistance(a=newNode.location, b=chain[-1].location)
+        self.assertLess(distance, 3 * KNOWN_SPRING_LENGTH, 'The new node should stay near its parent')
+
+    def testArrangeIncrementalBuildsIndexOnce(self):
+
+        saveRepulsionMode: RepulsionMode = self._configuration.repulsionMode
+        self._configuration.repulsionMode = RepulsionMode.BARNES_HUT
+
+        indexedNodeCounts: List[int] = []
+
+        class CountingLayout(ForceDirectedLayout):
+            def _buildQuadTree(self, nodes):
+                nodes = list(nodes)
+                indexedNodeCounts.append(len(nodes))
+                return super()._buildQuadTree(nodes=nodes)
+
+        layoutEngine: ForceDirectedLayout = CountingLayout()
+        chain:        List[Node]          = [FakeNode(location=Point(), fakeId=1)]
+        layoutEngine.addNode(chain[0])
+        for fakeId in range(2, 8):
+            fakeNode: FakeNode = FakeNode(location=Point(), fakeId=fakeId)
+            chain[-1].addChild(fakeNode)
+            chain.append(fakeNode)
+        try:
+            layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+            arranged: List[Point] = [Point(x=node.x, y=node.y) for node in chain]
+
+            newNode: FakeNode = FakeNode(location=Point(), fakeId=100)
+            chain[-1].addChild(newNode)
+
+            indexedNodeCounts.clear()
+            layoutStatus: LayoutStatus = layoutEngine.arrangeIncremental(statusCallback=lambda status: None, deterministic=True)
+        finally:
+            self._configuration.repulsionMode = saveRepulsionMode
+
+        self.assertTrue(layoutStatus.iterations > 1, 'The relaxation should iterate')
+        # the new node, its parent and the parent's parent move
+        self.assertEqual([len(chain) - 2], indexedNodeCounts, 'The quadtree is built once, over the nodes that do not move')
+        self.assertEqual(arranged[:-2], [node.location for node in chain[:-2]], 'Nodes away from the change should not move')
+
+    def testArrangeIncrementalWithoutArrange(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(3)
+
+        layoutStatus: LayoutStatus = layoutEngine.arrangeIncremental(statusCallback=lambda status: None, deterministic=True)
+
+        self.assertTrue(layoutStatus.iterations > 0, 'Should fall back to a full arrange')
+
+    def testWarmStart(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(6)
+
+        coldStatus: LayoutStatus = layoutEngine.arrange(statusCallback=lambda status: None, deterministic=True)
+        warmStatus: LayoutStatus = layoutEngine.arrange(statusCallback=lambda status: None, warmStart=True)
+
+        self.assertLess(warmStatus.iterations, coldStatus.iterations, 'A settled layout should reconverge quickly')
+
+    def testWarmStartKeepsLocations(self):
+
+        saveSimulationEngine: SimulationEngine = self._configuration.simulationEngine
+        saveMaxIterations:    int              = self._configuration.maxIterations
+
+        self._configuration.simulationEngine = SimulationEngine.NUMPY
+        self._configuration.maxIterations    = 1
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        nodeA:        FakeNode            = FakeNode(location=Point(x=1000, y=0), fakeId=1)
+        nodeB:        FakeNode            = FakeNode(location=Point(x=2000, y=0), fakeId=2)
+        layoutEngine.addNode(nodeA)
+        layoutEngine.addNode(nodeB)
+
+        layoutEngine.arrange(statusCallback=lambda status: None, warmStart=True)
+
+        self._configuration.simulationEngine = saveSimulationEngine
+        self._configuration.maxIterations    = saveMaxIterations
+
+        distance: float = ForceDirectedLayout.calculateExactDistance(a=nodeA.location, b=nodeB.location)
+        self.assertGreater(distance, 900, 'Warm start should not randomize the locations')
+
+    def testWarmStartKeepsConvergedLayout(self):
+
+        saveSimulationEngine:         SimulationEngine = self._configuration.simulationEngine
+        saveFloatPrecision:           bool             = self._configuration.floatPrecision
+        saveMinimumTotalDisplacement: int              = self._configuration.minimumTotalDisplacement
+        saveMaxIterations:            int              = self._configuration.maxIterations
+
+        self._configuration.floatPrecision           = True
+        self._configuration.minimumTotalDisplacement = 1
+        self._configuration.maxIterations            = 2000
+
+        tolerance: float = KNOWN_SPRING_LENGTH / 10
+        try:
+            for simulationEngine in (SimulationEngine.PYTHON, SimulationEngine.NUMPY):
+                self._configuration.simulationEngine = simulationEngine
+
+                layoutEngine: ForceDirectedLayout = ForceDirectedLayout.fromGraph(nodeCount=5, sources=[0, 0, 1, 2], targets=[1, 2, 3, 4])
+                layoutEngine.arrange(deterministic=True)
+
+                converged: List[Point] = [node.location for node in layoutEngine.nodes]
+                layoutEngine.arrange(deterministic=True, warmStart=True)
+                self._assertLocationsKept(converged, layoutEngine, tolerance)
+
+                converged = [node.location for node in layoutEngine.nodes]
+                for _ in layoutEngine.arrangeSteps(deterministic=True, warmStart=True):
+                    pass
+                self._assertLocationsKept(converged, layoutEngine, tolerance)
+
+                converged = [node.location for node in layoutEngine.nodes]
+                restored: ForceDirectedLayout = ForceDirectedLayout.fromSnapshot(layoutEngine.snapshot())
+                restored.arrange(deterministic=True, warmStart=True)
+                self._assertLocationsKept(converged, restored, tolerance)
+        finally:
+            self._configuration.simulationEngine         = saveSimulationEngine
+            self._configuration.floatPrecision           = saveFloatPrecision
+            self._configuration.minimumTotalDisplacement = saveMinimumTotalDisplacement
+            self._configuration.maxIterations            = saveMaxIterations
+
+    def testThrottledStatus(self):
+
+        saveStatusInterval: int = self._configuration.statusInterval
+        self._configuration.statusInterval = 4
+
+        reported:     List[int]           = []
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(4)
+
+        layoutStatus: LayoutStatus = layoutEngine.arrange(statusCallback=lambda status: reported.append(status.iterations), deterministic=True)
+
+        self._configuration.statusInterval = saveStatusInterval
+
+        self.assertTrue(len(reported) > 0, 'Some iterations should be reported')
+        self.assertTrue(all(iterations % 4 == 0 for iterations in reported), 'Only every fourth iteration is reported')
+        self.assertLessEqual(len(reported), layoutStatus.iterations // 4, 'The rest should be skipped')
+
+    def testArrangeWithoutStatus(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(4)
+
+        layoutStatus: LayoutStatus = layoutEngine.arrange(deterministic=True)
+
+        self.assertTrue(layoutStatus.iterations > 0, 'Should lay out without a callback')
+
+    def testCancel(self):
+
+        cancellationToken: CancellationToken = CancellationToken()
+
+        def cancelAtThree(status: LayoutStatus):
+            if status.iterations == 3:
+                cancellationToken.cancel()
+
+        for simulationEngine in (SimulationEngine.PYTHON, SimulationEngine.NUMPY):
+            saveSimulationEngine: SimulationEngine = self._configuration.simulationEngine
+            self._configuration.simulationEngine = simulationEngine
+
+            layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(6)
+            layoutStatus: LayoutStatus        = layoutEngine.arrange(statusCallback=cancelAtThree, cancellationToken=cancellationToken)
+
+            self._configuration.simulationEngine = saveSimulationEngine
+            cancellationToken = CancellationToken()
+
+            self.assertEqual(StopReason.CANCELLED, layoutStatus.stopReason, f'{simulationEngine} should report the cancel')
+            self.assertEqual(4, layoutStatus.iterations, f'{simulationEngine} should stop after the iteration in progress')
+
+    def testTimeBudget(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(6)
+        layoutStatus: LayoutStatus        = layoutEngine.arrange(deterministic=True, timeBudget=0.0)
+
+        self.assertEqual(StopReason.TIME_BUDGET, layoutStatus.stopReason, 'The budget was spent from the start')
+        self.assertEqual(1, layoutStatus.iterations, 'Only the iteration in progress should run')
+
+    def testStopReasonConverged(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(3)
+        layoutStatus: LayoutStatus        = layoutEngine.arrange(deterministic=True)
+
+        self.assertEqual(StopReason.CONVERGED, layoutStatus.stopReason, 'A small diagram should converge')
+
+    def testArrangeAsync(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(6)
+
+        async def collectStatuses() -> List[LayoutStatus]:
+            return [layoutStatus async for layoutStatus in layoutEngine.arrangeAsync(deterministic=True)]
+
+        layoutStatuses: List[LayoutStatus] = run(collectStatuses())
+
+        self.assertTrue(len(layoutStatuses) > 1, 'Progress should be streamed')
+        self.assertEqual(StopReason.RUNNING, layoutStatuses[0].stopReason, 'Progress is reported while running')
+        self.assertNotEqual(StopReason.RUNNING, layoutStatuses[-1].stopReason, 'The final status tells why the layout stopped')
+        self.assertEqual(list(range(1, len(layoutStatuses))), [layoutStatus.iterations for layoutStatus in layoutStatuses[:-1]], 'Each status is a copy')
+
+    def testArrangeAsyncLeftEarly(self):
+
+        cancellationToken: CancellationToken   = CancellationToken()
+        layoutEngine:      ForceDirectedLayout = self._createDiagramWithFakeNodes(50)
+
+        async def firstStatus() -> LayoutStatus:
+            layoutStatuses: AsyncGenerator[LayoutStatus, None] = layoutEngine.arrangeAsync(cancellationToken=cancellationToken)
+            try:
+                return await anext(layoutStatuses)
+            finally:
+                await layoutStatuses.aclose()
+
+        layoutStatus: LayoutStatus = run(firstStatus())
+
+        self.assertEqual(1, layoutStatus.iterations, 'The first status is the first iteration')
+        self.assertTrue(cancellationToken.cancelled, 'Leaving early should cancel the layout')
+
+    def testArrangeSteps(self):
+
+        layoutEngine: ForceDirectedLayout                          = self._createDiagramWithFakeNodes(4)
+        layoutSteps:  Generator[LayoutFrame, None, LayoutStatus] = layoutEngine.arrangeSteps(deterministic=True)
+
+        layoutFrames: List[LayoutFrame] = []
+        try:
+            while True:
+                layoutFrames.append(next(layoutSteps))
+        except StopIteration as stopIteration:
+            layoutStatus: LayoutStatus = stopIteration.value
+
+        self.assertEqual(len(layoutFrames), layoutStatus.iterations, 'One frame per iteration')
+        self.assertEqual((len(layoutEngine.nodes), 2), layoutFrames[0].positions.shape, 'One position per node')
+        self.assertFalse(layoutFrames[0].positions.flags.writeable, 'Frames are read only')
+        self.assertFalse((layoutFrames[0].positions == layoutFrames[-1].positions).all(), 'Earlier frames keep their positions')
+        self.assertEqual(StopReason.RUNNING, layoutFrames[0].layoutStatus.stopReason, 'Each frame has its own status')
+
+    def testArrangeStepsClosedEarly(self):
+
+        layoutEngine: ForceDirectedLayout                          = self._createDiagramWithFakeNodes(4)
+        layoutSteps:  Generator[LayoutFrame, None, LayoutStatus] = layoutEngine.arrangeSteps(deterministic=True)
+
+        for _ in range(3):
+            layoutFrame: LayoutFrame = next(layoutSteps)
+        layoutSteps.close()
+
+        self.assertEqual(3, layoutFrame.layoutStatus.iterations, 'Three frames were taken')
+        for node in layoutEngine.nodes:
+            self.assertNotEqual(Point(), node.location, 'The nodes should have the layout reached so far')
+
+    def testNodesView(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagramWithFakeNodes(3)
+
+        nodes: NodesView = layoutEngine.nodes
+
+        self.assertIs(nodes, layoutEngine.nodes, 'Reads should not copy')
+
+        layoutEngine.removeNode(nodes[-1])
+
+        self.assertEqual(len(nodes) - 1, len(layoutEngine.nodes), 'Removing should be visible on the next read')
+
+        layoutEngine.addGraph(nodes=Nodes([FakeNode(location=Point(), fakeId=10), FakeNode(location=Point(), fakeId=11)]), sources=[0], targets=[1])
+
+        self.assertEqual(len(nodes) + 1, len(layoutEngine.nodes), 'Bulk loading should be visible on the next read')
+        self.assertEqual(1, len(layoutEngine.nodes[-2].connections), 'Bulk connections should be visible on the next read')
+
+    def testAddGraph(self):
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+
+        nodes: Nodes = Nodes([FakeNode(location=Point(), fakeId=x) for x in range(4)])
+
+        connectionCount: int = layoutEngine.addGraph(nodes=nodes, sources=array([0, 0, 1, 2, 0]), targets=array([1, 2, 2, 2, 1]))
+
+        self.assertEqual(3, connectionCount, 'Connections to itself and repeated connections are skipped')
+        self.assertEqual(tuple(nodes), layoutEngine.nodes, 'Every node is added, in order')
+        self.assertEqual((nodes[1], nodes[2]), nodes[0].connections, 'Connections are from the source to the target')
+        self.assertEqual(Nodes([nodes[0], nodes[1]]), layoutEngine._adjacency.parents(nodes[2]), 'Connections are indexed both ways')
+        self.assertEqual(layoutEngine, nodes[3].layoutEngine, 'Unconnected nodes belong to the diagram as well')
+
+    def testAddGraphMatchesAddChild(self):
+
+        edges: List[Tuple[int, int]] = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+
+        bulkEngine: ForceDirectedLayout = ForceDirectedLayout.fromGraph(nodeCount=4, sources=[s for s, _ in edges], targets=[t for _, t in edges])
+
+        layoutEngine: ForceDirectedLayout = ForceDirectedLayout()
+        for _ in range(4):
+            layoutEngine.addNode(LayoutNode())
+        for source, target in edges:
+            layoutEngine.nodes[source].addChild(layoutEngine.nodes[target])
+
+        bulkEngine.arrange(deterministic=True)
+        layoutEngine.arrange(deterministic=True)
+
+        self.assertEqual([node.location for node in layoutEngine.nodes], [node.location for node in bulkEngine.nodes], 'Bulk loading should not change the layout')
+
+    def _assertLocationsKept(self, expected: List[Point], layoutEngine: ForceDirectedLayout, tolerance: float):
+
+        for location, node in zip(expected, layoutEngine.nodes):
+            distance: float = ForceDirectedLayout.calculateExactDistance(a=location, b=node.location)
+            self.assertLess(distance, tolerance, f'A warm start should not move a converged node: {location} -> {node.location}')
+
     def _createTwoFakeNodes(self) -> TwoFakeNodes:
 
         actingOnNode:      FakeNode = FakeNode(location=Point(x=100, y=100), fakeId=100)
@@ -238,10 +728,7 @@ class TestForceDirectedLayout(UnitTestBase):
             diagramNode: Node = node
             diagramNode.location = points[x]
 
-            layoutInformation: NodeLayoutInformation = NodeLayoutInformation(node=diagramNode,
-                                                                             velocity=Vector(magnitude=0, direction=0),
-                                                                             nextPosition=Point(),
-                                                                             )
+            layoutInformation: NodeLayoutInformation = NodeLayoutInformation(node=diagramNode, nextPosition=Point())
             layout.append(layoutInformation)
             x = x + 1
 
@@ -0,0 +1,172 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import float64
+from numpy import int64
+from numpy import memmap
+from numpy import ndarray
+
+from numpy.testing import assert_array_equal
+
+from pyforcedirectedlayout.CompactLayout import CompactLayout
+from pyforcedirectedlayout.ForceDirectedLayout import ForceDirectedLayout
+from pyforcedirectedlayout.LayoutSnapshot import LayoutSnapshot
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.Point import Point
+
+NODE_COUNT: int = 6
+
+
+class TestLayoutSnapshot(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._directory:    TemporaryDirectory = TemporaryDirectory()
+        self._snapshotPath: Path               = Path(self._directory.name) / 'layout.snapshot'
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._directory.cleanup()
+
+    def testSaveAndLoad(self):
+
+        layoutSnapshot: LayoutSnapshot = LayoutSnapshot(nodeIds=array([7, 8, 9], dtype=int64),
+                                                        positions=array([(1.5, 2.0), (3.0, 4.0), (5.0, 6.25)], dtype=float64),
+                                                        velocities=array([(0.5, 0.0), (0.0, -0.5), (1.0, 1.0)], dtype=float64),
+                                                        sources=array([0, 0], dtype=int64),
+                                                        targets=array([1, 2], dtype=int64))
+        layoutSnapshot.save(self._snapshotPath)
+
+        for memoryMap in (True, False):
+            loaded: LayoutSnapshot = LayoutSnapshot.load(self._snapshotPath, memoryMap=memoryMap)
+
+            assert_array_equal(layoutSnapshot.nodeIds,    loaded.nodeIds)
+            assert_array_equal(layoutSnapshot.positions,  loaded.positions)
+            assert_array_equal(layoutSnapshot.velocities, loaded.velocities)
+            assert_array_equal(layoutSnapshot.sources,    loaded.sources)
+            assert_array_equal(layoutSnapshot.targets,    loaded.targets)
+
+        self.assertIsInstance(LayoutSnapshot.load(self._snapshotPath).positions, memmap, 'The arrays should be views of the file')
+
+    def testLoadNotASnapshot(self):
+
+        self._snapshotPath.write_bytes(b'{"nodes": []}' * 4)
+
+        with self.assertRaises(ValueError):
+            LayoutSnapshot.load(self._snapshotPath)
+
+    def testLoadTruncated(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagram()
+        layoutEngine.snapshot().save(self._snapshotPath)
+
+        self._snapshotPath.write_bytes(self._snapshotPath.read_bytes()[:-8])
+
+        with self.assertRaises(ValueError):
+            LayoutSnapshot.load(self._snapshotPath)
+
+    def testRoundTrip(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagram()
+        layoutEngine.arrange(deterministic=True)
+        layoutEngine.snapshot().save(self._snapshotPath)
+
+        restored: ForceDirectedLayout = ForceDirectedLayout.fromSnapshot(LayoutSnapshot.load(self._snapshotPath))
+
+        self.assertEqual([node.location for node in layoutEngine.nodes], [node.location for node in restored.nodes], 'The nodes should be where they were saved')
+        self.assertEqual([len(node.connections) for node in layoutEngine.nodes], [len(node.connections) for node in restored.nodes], 'The connections should be restored')
+        assert_array_equal(layoutEngine.snapshot().velocities, restored.snapshot().velocities)
+
+    def testWarmStartFromSnapshot(self):
+
+        layoutEngine: ForceDirectedLayout = self._createDiagram()
+        coldStatus:   LayoutStatus        = layoutEngine.arrange(deterministic=True)
+        layoutEngine.snapshot().save(self._snapshotPath)
+
+        restored:   ForceDirectedLayout = ForceDirectedLayout.fromSnapshot(LayoutSnapshot.load(self._snapshotPath))
+        warmStatus: LayoutStatus        = restored.arrange(deterministic=True, warmStart=True)
+
+        self.assertLess(warmStatus.iterations, coldStatus.iterations, 'A restored layout should reconverge quickly')
+
+    def testCompactLayoutRoundTrip(self):
+
+        compactLayout: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=array([0] * (NODE_COUNT - 1)), targets=array(range(1, NODE_COUNT)))
+        compactLayout.arrange(deterministic=True)
+        compactLayout.snapshot().save(self._snapshotPath)
+
+        restored: CompactLayout = CompactLayout.fromSnapshot(LayoutSnapshot.load(self._snapshotPath))
+
+        assert_array_equal(compactLayout.positions,  restored.positions)
+        assert_array_equal(compactLayout.velocities, restored.velocities)
+
+        restored.node(0).location = Point(x=-1, y=-1)
+
+        self.assertEqual(Point(x=-1, y=-1), restored.node(0).location, 'A restored layout should have its own buffers')
+
+    def testSharedBuffers(self):
+
+        sources: ndarray = array([0] * (NODE_COUNT - 1), dtype=int64)
+        targets: ndarray = array(range(1, NODE_COUNT), dtype=int64)
+
+        inMemory: CompactLayout = CompactLayout(nodeCount=NODE_COUNT, sources=sources, targets=targets)
+        inMemory.arrange(deterministic=True)
+
+        mapped: CompactLayout = CompactLayout.fromSnapshot(LayoutSnapshot.create(self._snapshotPath, sources=sources, targets=targets, nodeCount=NODE_COUNT),
+                                                           shareBuffers=True)
+        reader: LayoutSnapshot = LayoutSnapshot.load(self._snapshotPath)
+
+        liveReads: List[bool] = []
+
+        def readLive(layoutStatus: LayoutStatus):
+            liveReads.append(bool((reader.positions == mapped.positions).all()))
+
+        mapped.arrange(statusCallback=readLive, deterministic=True)
+
+        self.assertTrue(len(liveReads) > 0 and all(liveReads), 'Another mapping of the file should see the positions while the layout runs')
+        assert_array_equal(inMemory.positions,  reader.positions)
+        assert_array_equal(inMemory.velocities, reader.velocities)
+
+    def testShareReadOnlyBuffers(self):
+
+        self._createDiagram().snapshot().save(self._snapshotPath)
+
+        with self.assertRaises(AssertionError):
+            CompactLayout.fromSnapshot(LayoutSnapshot.load(self._snapshotPath), shareBuffers=True)
+
+    def _createDiagram(self) -> ForceDirectedLayout:
+        return ForceDirectedLayout.fromGraph(nodeCount=NODE_COUNT, sources=[0] * (NODE_COUNT - 1), targets=list(range(1, NODE_COUNT)))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestLayoutSnapshot))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,131 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import int64
+from numpy import ndarray
+
+from numpy.testing import assert_array_equal
+
+from numpy.random import default_rng
+
+from pyforcedirectedlayout.ArraySimulation import ArraySimulation
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import Nodes
+from pyforcedirectedlayout.MultilevelSimulation import MultilevelSimulation
+from pyforcedirectedlayout.MultilevelSimulation import coarsen
+from pyforcedirectedlayout.Point import Point
+
+from tests.pyforcedirectedlayout.FakeNode import FakeNode
+
+
+class TestMultilevelSimulation(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testCoarsenPath(self):
+
+        sources: ndarray = array(range(0, 7), dtype=int64)
+        targets: ndarray = array(range(1, 8), dtype=int64)
+
+        coarseCount, parents, coarseSources, coarseTargets = coarsen(nodeCount=8, sources=sources, targets=targets, generator=default_rng(1))
+
+        self.assertLessEqual(coarseCount, 5, 'Matching should about halve a path')
+        self.assertEqual(8, parents.size, 'Every node needs a coarse node')
+        self.assertTrue((coarseSources != coarseTargets).all(), 'Merged nodes should not keep an edge to themselves')
+
+    def testCoarsenStar(self):
+
+        sources: ndarray = array([0] * 9, dtype=int64)
+        targets: ndarray = array(range(1, 10), dtype=int64)
+
+        coarseCount, parents, coarseSources, coarseTargets = coarsen(nodeCount=10, sources=sources, targets=targets, generator=default_rng(1))
+
+        self.assertEqual(1, coarseCount, 'The leaves should collapse into the hub')
+        self.assertEqual(0, coarseSources.size, 'No edges are left between coarse nodes')
+
+    def testCoarsenIsolated(self):
+
+        coarseCount, parents, _, _ = coarsen(nodeCount=3, sources=array([], dtype=int64), targets=array([], dtype=int64), generator=default_rng(1))
+
+        self.assertEqual(3, coarseCount, 'Isolated nodes cannot be merged')
+
+    def testRun(self):
+
+        saveCoarsestSize: int = self._configuration.coarsestSize
+        self._configuration.coarsestSize = 4
+
+        nodes: Nodes = Nodes([FakeNode(location=Point(x=x, y=x % 7), fakeId=x) for x in range(40)])
+        for index in range(1, len(nodes)):
+            nodes[(index - 1) // 2].addChild(nodes[index])
+
+        multilevelSimulation: MultilevelSimulation = MultilevelSimulation(nodes=nodes, seed=1)
+        layoutStatus:         LayoutStatus         = multilevelSimulation.run(statusCallback=lambda status: None)
+
+        self._configuration.coarsestSize = saveCoarsestSize
+
+        self.assertTrue(layoutStatus.iterations > 0, 'The finest level should have iterated')
+        self.assertLessEqual(layoutStatus.iterations, self._configuration.refinementIterations, 'The finest level is only refined')
+        self.assertEqual(len(nodes), len({(node.x, node.y) for node in nodes}), 'Merged nodes should have separated')
+
+    def testWarmStart(self):
+
+        saveCoarsestSize: int = self._configuration.coarsestSize
+        self._configuration.coarsestSize = 4
+
+        multilevelNodes: Nodes   = self._createTree()
+        arrayNodes:      Nodes   = self._createTree()
+        velocities:      ndarray = array([(x % 3 - 1, x % 5 - 2) for x in range(len(multilevelNodes))], dtype=float)
+
+        try:
+            multilevelSimulation: MultilevelSimulation = MultilevelSimulation(nodes=multilevelNodes, seed=1, velocities=velocities)
+            multilevelSimulation.run()
+        finally:
+            self._configuration.coarsestSize = saveCoarsestSize
+
+        arraySimulation: ArraySimulation = ArraySimulation(nodes=arrayNodes, velocities=velocities)
+        arraySimulation.run()
+
+        self.assertEqual([node.location for node in arrayNodes], [node.location for node in multilevelNodes], 'A warm start should only run the diagram itself')
+        assert_array_equal(arraySimulation.velocities, multilevelSimulation.velocities, 'A warm start should keep the velocities')
+
+    def _createTree(self) -> Nodes:
+
+        nodes: Nodes = Nodes([FakeNode(location=Point(x=x * 10, y=x % 7 * 10), fakeId=x) for x in range(40)])
+        for index in range(1, len(nodes)):
+            nodes[(index - 1) // 2].addChild(nodes[index])
+
+        return nodes
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestMultilevelSimulation))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -7,6 +7,8 @@ from copy import deepcopy
 
 from codeallybasic.UnitTestBase import UnitTestBase
 
+from pyforcedirectedlayout.LayoutNode import LayoutNode
+from pyforcedirectedlayout.LayoutTypes import NodesView
 from pyforcedirectedlayout.Point import Point
 from tests.pyforcedirectedlayout.FakeNode import FakeNode
 
@@ -68,6 +70,53 @@ class TestNode(UnitTestBase):
             childId = toObjectId(fakeNode)
             self.logger.info(f'{fakeNode._id} {childId}')
 
+    def testIdentity(self):
+
+        nodeA: LayoutNode = LayoutNode(location=Point(x=10, y=10))
+        nodeB: LayoutNode = LayoutNode(location=Point(x=10, y=10))
+
+        self.assertNotEqual(nodeA.nodeId, nodeB.nodeId, 'Every node has its own id')
+        self.assertNotEqual(nodeA, nodeB, 'Nodes at the same location are still different nodes')
+        self.assertEqual(2, len({nodeA, nodeB}), 'Nodes can be kept in a set')
+
+    def testConnections(self):
+
+        parentNode: LayoutNode = LayoutNode()
+        childNode:  LayoutNode = LayoutNode()
+
+        self.assertTrue(parentNode.addChild(childNode),  'Should connect')
+        self.assertFalse(parentNode.addChild(childNode), 'Already connected')
+        self.assertEqual((childNode,), parentNode.connections, 'One connection')
+
+        self.assertFalse(parentNode.disConnect(childNode), 'The child was not connected to the parent')
+        self.assertEqual((), parentNode.connections, 'The connection should be gone')
+
+    def testLayoutNodeDefaults(self):
+
+        nodeA: LayoutNode = LayoutNode()
+        nodeB: LayoutNode = LayoutNode()
+
+        nodeA.size.width = 42
+
+        self.assertEqual(0, nodeB.size.width, 'Nodes should not share a default size')
+        self.assertIsNot(nodeA.location, nodeB.location, 'Nodes should not share a default location')
+
+    def testConnectionsView(self):
+
+        parentNode: LayoutNode = LayoutNode()
+        childNode:  LayoutNode = LayoutNode()
+
+        parentNode.addChild(childNode)
+
+        connections: NodesView = parentNode.connections
+
+        self.assertIs(connections, parentNode.connections, 'Reads should not copy')
+
+        parentNode.addChild(LayoutNode())
+
+        self.assertEqual(1, len(connections), 'Earlier reads keep their snapshot')
+        self.assertEqual(2, len(parentNode.connections), 'Connecting should be visible on the next read')
+
 
 def suite() -> TestSuite:
     import unittest
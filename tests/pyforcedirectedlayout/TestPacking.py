@@ -0,0 +1,68 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.Packing import Extents
+from pyforcedirectedlayout.Packing import Offsets
+from pyforcedirectedlayout.Packing import shelfPack
+
+
+class TestPacking(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testEmpty(self):
+
+        self.assertEqual([], shelfPack(extents=Extents([]), gap=10), 'Nothing to pack')
+
+    def testTallestFirst(self):
+
+        offsets: Offsets = shelfPack(extents=Extents([(100, 50), (100, 100)]), gap=10)
+
+        self.assertEqual((0.0, 0.0), offsets[1], 'The tallest rectangle starts the first shelf')
+
+    def testNoOverlap(self):
+
+        extents: Extents = Extents([(100, 100), (40, 80), (60, 20), (30, 30), (100, 10), (70, 90)])
+        offsets: Offsets = shelfPack(extents=extents, gap=10)
+
+        rectangles = [(x, y, x + width, y + height) for (x, y), (width, height) in zip(offsets, extents)]
+        for index, (left, top, right, bottom) in enumerate(rectangles):
+            for otherLeft, otherTop, otherRight, otherBottom in rectangles[index + 1:]:
+                overlaps: bool = left < otherRight and otherLeft < right and top < otherBottom and otherTop < bottom
+                self.assertFalse(overlaps, 'Packed rectangles should not overlap')
+
+    def testStartsNewShelf(self):
+
+        offsets: Offsets = shelfPack(extents=Extents([(100, 100)] * 4), gap=0)
+
+        self.assertEqual([(0.0, 0.0), (100.0, 0.0), (0.0, 100.0), (100.0, 100.0)], offsets, 'Four squares should pack two by two')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPacking))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
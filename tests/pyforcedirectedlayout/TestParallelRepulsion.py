@@ -0,0 +1,70 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import ndarray
+from numpy import allclose
+from numpy.random import default_rng
+
+from pyforcedirectedlayout.ForceKernels import repulsionForRows
+from pyforcedirectedlayout.ParallelRepulsion import ParallelRepulsion
+
+COULOMB_LAW_CONSTANT: float = 10000.0
+NUMBER_OF_NODES:      int   = 600
+
+
+class TestParallelRepulsion(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._positions: ndarray = default_rng(42).uniform(-1000, 1000, size=(NUMBER_OF_NODES, 2))
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testMatchesSingleProcess(self):
+
+        expectedForces: ndarray = repulsionForRows(positions=self._positions, start=0, end=NUMBER_OF_NODES, coulombLawConstant=COULOMB_LAW_CONSTANT)
+
+        with ParallelRepulsion(nodeCount=NUMBER_OF_NODES, workerCount=2, coulombLawConstant=COULOMB_LAW_CONSTANT) as parallelRepulsion:
+            actualForces: ndarray = parallelRepulsion.computeForces(self._positions)
+
+        self.assertTrue(allclose(expectedForces, actualForces), 'Workers should compute the same forces')
+
+    def testPositionsAreRefreshed(self):
+
+        with ParallelRepulsion(nodeCount=NUMBER_OF_NODES, workerCount=2, coulombLawConstant=COULOMB_LAW_CONSTANT) as parallelRepulsion:
+            parallelRepulsion.computeForces(self._positions)
+
+            movedPositions: ndarray = self._positions * 2.0
+            actualForces:   ndarray = parallelRepulsion.computeForces(movedPositions)
+
+        expectedForces: ndarray = repulsionForRows(positions=movedPositions, start=0, end=NUMBER_OF_NODES, coulombLawConstant=COULOMB_LAW_CONSTANT)
+
+        self.assertTrue(allclose(expectedForces, actualForces), 'Each call should use the positions it was given')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParallelRepulsion))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -46,6 +46,11 @@ class TestPoint(UnitTestBase):
 
         self.assertEqual(Point(x=600, y=600), currentPoint, 'Did not adjust correctly')
 
+    def testRounded(self):
+        point: Point = Point(x=10.6, y=-3.2)
+
+        self.assertEqual(Point(x=11, y=-3), point.rounded(), 'Did not round to the nearest pixel')
+
 
 def suite() -> TestSuite:
     import unittest
@@ -0,0 +1,113 @@
+
+from random import Random
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.LayoutTypes import Force
+from pyforcedirectedlayout.QuadTree import Coordinates
+from pyforcedirectedlayout.QuadTree import QuadTree
+
+COULOMB_LAW_CONSTANT: float = 10000.0
+NUMBER_OF_POINTS:     int   = 200
+
+
+class TestQuadTree(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        generator: Random = Random(42)
+
+        self._coordinates: Coordinates = Coordinates([(generator.uniform(-500, 500), generator.uniform(-500, 500)) for _ in range(NUMBER_OF_POINTS)])
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRootMass(self):
+
+        quadTree: QuadTree = QuadTree(coordinates=self._coordinates)
+
+        self.assertEqual(NUMBER_OF_POINTS, quadTree.root.mass, 'Every point should be in the tree')
+
+    def testZeroThetaIsExact(self):
+
+        quadTree: QuadTree = QuadTree(coordinates=self._coordinates)
+
+        for x, y in self._coordinates[:10]:
+            expectedX, expectedY = self._bruteForce(x=x, y=y)
+            actualX, actualY     = quadTree.repulsionAt(x=x, y=y, coulombLawConstant=COULOMB_LAW_CONSTANT, theta=0.0)
+
+            self.assertAlmostEqual(expectedX, actualX, places=6, msg='Theta 0 should open every cell')
+            self.assertAlmostEqual(expectedY, actualY, places=6, msg='Theta 0 should open every cell')
+
+    def testApproximationIsClose(self):
+
+        quadTree: QuadTree = QuadTree(coordinates=self._coordinates)
+
+        for x, y in self._coordinates[:10]:
+            expectedX, expectedY = self._bruteForce(x=x, y=y)
+            actualX, actualY     = quadTree.repulsionAt(x=x, y=y, coulombLawConstant=COULOMB_LAW_CONSTANT, theta=0.5)
+
+            # the net force can mostly cancel out so measure against the individual forces
+            error:      float = ((expectedX - actualX) ** 2 + (expectedY - actualY) ** 2) ** 0.5
+            totalForce: float = self._totalMagnitude(x=x, y=y)
+            self.assertLess(error, totalForce * 0.02, 'Approximation is too far off')
+
+    def testCoincidentPoints(self):
+
+        quadTree: QuadTree = QuadTree(coordinates=Coordinates([(10.0, 10.0), (10.0, 10.0), (10.0, 10.0)]))
+
+        force: Force = quadTree.repulsionAt(x=10.0, y=10.0, coulombLawConstant=COULOMB_LAW_CONSTANT, theta=0.8)
+
+        self.assertEqual(Force((0.0, 0.0)), force, 'Coincident points exert no force')
+
+    def _bruteForce(self, x: float, y: float) -> Force:
+
+        forceX: float = 0.0
+        forceY: float = 0.0
+        for otherX, otherY in self._coordinates:
+            deltaX:   float = otherX - x
+            deltaY:   float = otherY - y
+            distance: float = (deltaX ** 2 + deltaY ** 2) ** 0.5
+            if distance > 0:
+                proximity: float = max(distance, 1.0)
+                forceX -= COULOMB_LAW_CONSTANT / (proximity ** 2) * deltaX / distance
+                forceY -= COULOMB_LAW_CONSTANT / (proximity ** 2) * deltaY / distance
+
+        return Force((forceX, forceY))
+
+    def _totalMagnitude(self, x: float, y: float) -> float:
+
+        total: float = 0.0
+        for otherX, otherY in self._coordinates:
+            distance: float = ((otherX - x) ** 2 + (otherY - y) ** 2) ** 0.5
+            if distance > 0:
+                total += COULOMB_LAW_CONSTANT / (max(distance, 1.0) ** 2)
+
+        return total
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestQuadTree))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
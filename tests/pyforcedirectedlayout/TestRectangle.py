@@ -39,6 +39,12 @@ class TestRectangle(UnitTestBase):
 
         self.assertEqual(expectedRectangle, actualRectangle, 'Should be functionally the same')
 
+    def testNoInstanceState(self):
+
+        rectangle: Rectangle = Rectangle(x=1, y=2, width=3, height=4)
+
+        self.assertFalse(hasattr(rectangle, '__dict__'), 'Rectangles should only hold their slots')
+
 
 def suite() -> TestSuite:
     import unittest
@@ -0,0 +1,101 @@
+
+from random import Random
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.LayoutTypes import Force
+from pyforcedirectedlayout.QuadTree import Coordinates
+from pyforcedirectedlayout.SpatialGrid import SpatialGrid
+
+COULOMB_LAW_CONSTANT: float = 10000.0
+NUMBER_OF_POINTS:     int   = 200
+
+
+class TestSpatialGrid(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        generator: Random = Random(42)
+
+        self._coordinates: Coordinates = Coordinates([(generator.uniform(-500, 500), generator.uniform(-500, 500)) for _ in range(NUMBER_OF_POINTS)])
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testLargeRadiusIsExact(self):
+
+        spatialGrid: SpatialGrid = SpatialGrid(coordinates=self._coordinates, cutoffRadius=2000)
+
+        for x, y in self._coordinates[:10]:
+            expectedX, expectedY = self._bruteForce(x=x, y=y, cutoffRadius=2000)
+            actualX, actualY     = spatialGrid.repulsionAt(x=x, y=y, coulombLawConstant=COULOMB_LAW_CONSTANT)
+
+            self.assertAlmostEqual(expectedX, actualX, places=6, msg='A radius that covers the diagram should compare every pair')
+            self.assertAlmostEqual(expectedY, actualY, places=6, msg='A radius that covers the diagram should compare every pair')
+
+    def testCutoff(self):
+
+        spatialGrid: SpatialGrid = SpatialGrid(coordinates=self._coordinates, cutoffRadius=150)
+
+        for x, y in self._coordinates[:10]:
+            expectedX, expectedY = self._bruteForce(x=x, y=y, cutoffRadius=150)
+            actualX, actualY     = spatialGrid.repulsionAt(x=x, y=y, coulombLawConstant=COULOMB_LAW_CONSTANT)
+
+            self.assertAlmostEqual(expectedX, actualX, places=6, msg='Only the points within the radius should repel')
+            self.assertAlmostEqual(expectedY, actualY, places=6, msg='Only the points within the radius should repel')
+
+    def testCellCount(self):
+
+        spatialGrid: SpatialGrid = SpatialGrid(coordinates=Coordinates([(0.0, 0.0), (10.0, 10.0), (250.0, 0.0), (-10.0, 0.0)]), cutoffRadius=100)
+
+        self.assertEqual(3, spatialGrid.cellCount, 'Points should share cells')
+
+    def testCoincidentPoints(self):
+
+        spatialGrid: SpatialGrid = SpatialGrid(coordinates=Coordinates([(10.0, 10.0), (10.0, 10.0)]), cutoffRadius=100)
+
+        force: Force = spatialGrid.repulsionAt(x=10.0, y=10.0, coulombLawConstant=COULOMB_LAW_CONSTANT)
+
+        self.assertEqual(Force((0.0, 0.0)), force, 'Coincident points exert no force')
+
+    def _bruteForce(self, x: float, y: float, cutoffRadius: float) -> Force:
+
+        forceX: float = 0.0
+        forceY: float = 0.0
+        for otherX, otherY in self._coordinates:
+            deltaX:   float = otherX - x
+            deltaY:   float = otherY - y
+            distance: float = (deltaX ** 2 + deltaY ** 2) ** 0.5
+            if 0 < distance <= cutoffRadius:
+                proximity: float = max(distance, 1.0)
+                forceX -= COULOMB_LAW_CONSTANT / (proximity ** 2) * deltaX / distance
+                forceY -= COULOMB_LAW_CONSTANT / (proximity ** 2) * deltaY / distance
+
+        return Force((forceX, forceY))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialGrid))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
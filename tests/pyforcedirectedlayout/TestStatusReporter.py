@@ -0,0 +1,88 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import LayoutStatus
+from pyforcedirectedlayout.LayoutTypes import NO_STATUS_CALLBACK
+from pyforcedirectedlayout.StatusReporter import StatusReporter
+
+
+class TestStatusReporter(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+        self._saveStatusInterval: int = self._configuration.statusInterval
+        self._saveStatusPeriod:   int = self._configuration.statusPeriod
+
+        self._reported: List[LayoutStatus] = []
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._configuration.statusInterval = self._saveStatusInterval
+        self._configuration.statusPeriod   = self._saveStatusPeriod
+
+    def testEveryIteration(self):
+
+        statusReporter: StatusReporter = StatusReporter(statusCallback=self._reported.append)
+
+        self.assertTrue(all(statusReporter.isDue(iterations=iterations) for iterations in range(1, 10)), 'The default reports every iteration')
+
+    def testInterval(self):
+
+        self._configuration.statusInterval = 3
+
+        statusReporter: StatusReporter = StatusReporter(statusCallback=self._reported.append)
+        dueIterations:  List[int]      = [iterations for iterations in range(1, 10) if statusReporter.isDue(iterations=iterations)]
+
+        self.assertEqual([3, 6, 9], dueIterations, 'Only every third iteration')
+
+    def testPeriod(self):
+
+        self._configuration.statusPeriod = 60 * 1000
+
+        statusReporter: StatusReporter = StatusReporter(statusCallback=self._reported.append)
+
+        self.assertFalse(statusReporter.isDue(iterations=1), 'Too soon after the start')
+
+        statusReporter.report(LayoutStatus(iterations=1))
+        self.assertEqual(1, len(self._reported), 'An explicit report always goes through')
+        self.assertFalse(statusReporter.isDue(iterations=2), 'Too soon after the last report')
+
+    def testNoCallback(self):
+
+        statusReporter: StatusReporter = StatusReporter(statusCallback=NO_STATUS_CALLBACK)
+
+        self.assertFalse(statusReporter.isDue(iterations=1), 'Nothing to report to')
+        statusReporter.report(LayoutStatus())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestStatusReporter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,116 @@
+
+from math import inf
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from numpy import array
+from numpy import hypot
+from numpy import ndarray
+
+from pyforcedirectedlayout.Configuration import Configuration
+from pyforcedirectedlayout.LayoutTypes import StepControl
+from pyforcedirectedlayout.StepController import StepController
+
+
+class TestStepController(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._configuration: Configuration = Configuration()
+
+        self._saveStepControl:     StepControl = self._configuration.stepControl
+        self._saveInitialStepSize: float       = self._configuration.initialStepSize
+        self._saveMinimumStepSize: float       = self._configuration.minimumStepSize
+        self._saveCoolingRate:     float       = self._configuration.coolingRate
+
+        self._configuration.initialStepSize = 10.0
+        self._configuration.minimumStepSize = 1.0
+        self._configuration.coolingRate     = 0.5
+
+    def tearDown(self):
+        super().tearDown()
+
+        self._configuration.stepControl     = self._saveStepControl
+        self._configuration.initialStepSize = self._saveInitialStepSize
+        self._configuration.minimumStepSize = self._saveMinimumStepSize
+        self._configuration.coolingRate     = self._saveCoolingRate
+
+    def testFixedDoesNotLimit(self):
+
+        self._configuration.stepControl = StepControl.FIXED
+
+        stepController: StepController = StepController()
+        stepController.update(energy=1.0)
+
+        self.assertEqual(inf, stepController.stepSize, 'A fixed step has no limit')
+        self.assertEqual((300.0, 400.0), stepController.limit(velocityX=300.0, velocityY=400.0), 'A fixed step has no limit')
+
+    def testLimit(self):
+
+        self._configuration.stepControl = StepControl.COOLING
+
+        stepController: StepController = StepController()
+
+        self.assertEqual((6.0, 8.0), stepController.limit(velocityX=30.0, velocityY=40.0), 'Should shorten to the step size')
+        self.assertEqual((3.0, 4.0), stepController.limit(velocityX=3.0, velocityY=4.0),   'Short steps are unchanged')
+
+    def testLimitArray(self):
+
+        self._configuration.stepControl = StepControl.COOLING
+
+        stepController: StepController = StepController()
+        limited:        ndarray        = stepController.limitArray(array([[30.0, 40.0], [3.0, 4.0], [0.0, 0.0]]))
+
+        self.assertEqual([10.0, 5.0, 0.0], hypot(limited[:, 0], limited[:, 1]).tolist(), 'Only the long steps should shorten')
+
+    def testCooling(self):
+
+        self._configuration.stepControl = StepControl.COOLING
+
+        stepController: StepController = StepController()
+        stepController.update(energy=1.0)
+        self.assertEqual(5.0, stepController.stepSize, 'Should cool by the cooling rate')
+
+        for _ in range(10):
+            stepController.update(energy=1.0)
+        self.assertEqual(1.0, stepController.stepSize, 'Should not cool below the minimum')
+
+    def testAdaptive(self):
+
+        self._configuration.stepControl = StepControl.ADAPTIVE
+
+        stepController: StepController = StepController()
+        stepController.update(energy=100.0)
+        stepController.update(energy=200.0)
+        self.assertAlmostEqual(9.0, stepController.stepSize, msg='Rising energy should shrink the step')
+
+        for energy in (90.0, 80.0, 70.0, 60.0, 50.0):
+            stepController.update(energy=energy)
+        self.assertAlmostEqual(10.0, stepController.stepSize, msg='Steadily dropping energy should grow the step')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestStepController))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,74 @@
+
+from math import inf
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from pyforcedirectedlayout.CancellationToken import CancellationToken
+from pyforcedirectedlayout.LayoutTypes import StopReason
+from pyforcedirectedlayout.StopSignal import StopSignal
+from pyforcedirectedlayout.StopSignal import UNLIMITED
+
+
+class TestStopSignal(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testUnlimited(self):
+
+        self.assertEqual(StopReason.RUNNING, UNLIMITED.stopReason(), 'Should never stop')
+        self.assertEqual(inf, UNLIMITED.remainingTime, 'There is no budget')
+
+    def testCancel(self):
+
+        cancellationToken: CancellationToken = CancellationToken()
+        stopSignal:        StopSignal        = StopSignal(cancellationToken=cancellationToken)
+
+        self.assertEqual(StopReason.RUNNING, stopSignal.stopReason(), 'Not cancelled yet')
+
+        cancellationToken.cancel()
+        self.assertEqual(StopReason.CANCELLED, stopSignal.stopReason(), 'Should stop once cancelled')
+
+    def testTimeBudget(self):
+
+        self.assertEqual(StopReason.TIME_BUDGET, StopSignal(timeBudget=0.0).stopReason(), 'No time to run')
+
+        stopSignal: StopSignal = StopSignal(timeBudget=60.0)
+        self.assertEqual(StopReason.RUNNING, stopSignal.stopReason(), 'Plenty of time left')
+        self.assertTrue(0.0 < stopSignal.remainingTime <= 60.0, 'The budget counts down')
+
+    def testCancelWins(self):
+
+        cancellationToken: CancellationToken = CancellationToken()
+        cancellationToken.cancel()
+
+        self.assertEqual(StopReason.CANCELLED, StopSignal(cancellationToken=cancellationToken, timeBudget=0.0).stopReason(), 'A cancel is reported first')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestStopSignal))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -45,6 +45,11 @@ class TestVector(UnitTestBase):
 
         self.assertEqual(expectedPoint, actualPoint, 'What the heck')
 
+    def testToPointFloatPrecision(self):
+        vector: Vector = Vector(magnitude=2.5, direction=0.0)
+
+        self.assertEqual(Point(x=2.5, y=0.0), vector.toPoint(floatPrecision=True), 'Sub-pixel coordinate was lost')
+
     def testAddition(self):
 
         vector:     Vector = Vector(magnitude=1.0, direction=180.0)
@@ -63,6 +68,29 @@ class TestVector(UnitTestBase):
         self.assertAlmostEqual(180.0, newVector.direction,   places=2, msg='Direction incorrect')
         self.assertAlmostEqual(3.0, newVector.magnitude, places=2, msg='I guess not close enough')
 
+    def testFromCartesian(self):
+
+        vector: Vector = Vector.fromCartesian(x=-3.0, y=-4.0)
+
+        self.assertAlmostEqual(5.0,   vector.magnitude, places=2, msg='Magnitude incorrect')
+        self.assertAlmostEqual(233.13, vector.direction, places=2, msg='Direction incorrect')
+
+    def testToCartesian(self):
+
+        vector: Vector = Vector(magnitude=2.0, direction=90.0)
+
+        x, y = vector.toCartesian()
+
+        self.assertAlmostEqual(0.0, x, places=6, msg='x component incorrect')
+        self.assertAlmostEqual(2.0, y, places=6, msg='y component incorrect')
+
+    def testNoInstanceState(self):
+
+        vector: Vector = Vector(magnitude=2.0, direction=90.0)
+
+        self.assertFalse(hasattr(vector, '__dict__'), 'Vectors should only hold their slots')
+        self.assertIs(Vector.logger, vector.logger, 'The logger is shared')
+
 
 def suite() -> TestSuite:
     import unittest